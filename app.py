@@ -1,9 +1,10 @@
+import time
+_IMPORT_START = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
-import time
 import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
+from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import shutil
 import tempfile
@@ -20,8 +21,19 @@ from src.news_fetcher import NewsFetcher
 from src.css import Cssdash
 from src.geo_data import GeoDataFetcher
 from src.asset_categories import AssetCategories
+from src.macro_data import MacroData
+from src.rolling_stats import RollingStats
+from src.data_export import DataExporter
+from src.profiler import ColdStartProfiler
+from src.runtime import Runtime
 import random
 
+# Heavy libraries (yfinance, plotly.express, feedparser) are imported on first use
+ColdStartProfiler.record("Imports", time.perf_counter() - _IMPORT_START)
+
+# Analytics modules keep their caches in Streamlit's resource cache and read settings (theme) from the session
+Runtime.configure(backend="streamlit", settings=st.session_state)
+
 def set_global_theme(theme_name):
     """Set global theme and store colors in session_state"""
     st.session_state.theme = theme_name
@@ -258,6 +270,35 @@ def test_multi_asset_comparison():
         print(f"❌ Comparison error: {str(e)}")
         return False
 
+def multi_ticker_download(frames, key, fmt=None):
+    """
+    Zip export of several DataFrames, written to disk one member at a time
+
+    Args:
+        frames (dict): {name: DataFrame} dictionary
+        key (str): Widget key prefix
+        fmt (str): Export format, None shows a format choice and waits for a 'Prepare' click (default: None)
+    """
+    if fmt is None:
+        cols = st.columns([1, 2])
+        fmt = cols[0].selectbox("Export format", list(DataExporter.FORMATS), key=f"{key}_format",
+                                label_visibility="collapsed")
+        if cols[1].button("Prepare zip", key=f"{key}_prepare"):
+            st.session_state[f"{key}_request"] = fmt
+        if st.session_state.get(f"{key}_request") != fmt:
+            return
+
+    path = DataExporter().write_zip(frames, fmt)
+    with open(path, 'rb') as f:
+        st.download_button(
+            label="📦 Download all (zip)",
+            data=f,
+            file_name=f"{key}_{datetime.now().strftime('%Y-%m-%d')}_{DataExporter.extension(fmt)}.zip",
+            mime="application/zip",
+            key=f"{key}_download",
+            on_click="ignore"  # Downloading does not rerun the app
+        )
+
 def portfolio_mode():
     """Virtual portfolio management interface"""
     st.title("🎯 Virtual Portfolio")
@@ -326,7 +367,30 @@ def portfolio_mode():
     
     # Create ticker/weight dictionary
     tickers_weights = dict(zip(selected_tickers, [w/100 for w in normalized_weights]))
-    
+
+    # Rebalancing policy
+    with st.expander("⚖️ Rebalancing and transaction costs"):
+        rebalancing_options = {
+            "Daily (constant weights, no costs)": "constant",
+            "Buy and hold": None,
+            "Weekly": "W",
+            "Monthly": "M",
+            "Quarterly": "Q",
+            "Yearly": "Y"
+        }
+        rebalancing_label = st.selectbox("Rebalancing", list(rebalancing_options.keys()), key="rebalancing_policy")
+        rebalancing = rebalancing_options[rebalancing_label]
+
+        rcols = st.columns(3)
+        threshold_pct = rcols[0].number_input("Drift threshold (%)", 0.0, 50.0, 0.0, step=0.5,
+                                              help="0 = rebalance on every calendar date")
+        cost_bps = rcols[1].number_input("Proportional cost (bps)", 0.0, 500.0, 10.0, step=1.0)
+        fixed_cost = rcols[2].number_input("Fixed cost per rebalance ($)", 0.0, 1000.0, 0.0, step=1.0,
+                                           help="Relative to a $10,000 portfolio")
+
+    # Chosen before running: results are only shown on the run's own rerun
+    export_format = st.selectbox("Export format", list(DataExporter.FORMATS), key="portfolio_export_format")
+
     if st.button("Run simulation", key="run_portfolio_sim"):
         # Reset previous results
         if 'portfolio_results' in st.session_state:
@@ -356,7 +420,16 @@ def portfolio_mode():
             # Step 2: Calculate weighted returns
             status.write("⏳ Calculating weighted returns...")
             try:
-                returns = pm.calculate_weighted_returns()
+                if rebalancing == "constant":
+                    returns = pm.calculate_weighted_returns()
+                else:
+                    returns = pm.simulate_rebalancing(
+                        frequency=rebalancing,
+                        threshold=threshold_pct / 100 if threshold_pct > 0 else None,
+                        proportional_cost=cost_bps / 10000,
+                        fixed_cost=fixed_cost,
+                        initial_value=10000.0
+                    )
             except Exception as e:
                 status.error(f"Return calculation error: {str(e)}")
                 st.stop()
@@ -368,6 +441,13 @@ def portfolio_mode():
             except Exception as e:
                 status.error(f"Performance calculation error: {str(e)}")
                 st.stop()
+
+            try:
+                # Same simulated returns (rebalancing, costs) as the performance metrics
+                risk = pm.get_risk_metrics()
+            except Exception as e:
+                status.warning(f"Risk metrics unavailable: {str(e)}")
+                risk = None
             
             # Step 4: Calculate combined geographical influence
             status.write("⏳ Analyzing geographical influence...")
@@ -378,8 +458,10 @@ def portfolio_mode():
                 geo_data = None
             
             st.session_state.portfolio_results = {
+                'data': data,
                 'returns': returns,
                 'metrics': metrics,
+                'risk': risk,
                 'geo_data': geo_data
             }
             status.update(label="Simulation complete!", state="complete")
@@ -392,6 +474,8 @@ def portfolio_mode():
             
             # Create performance chart
             if not returns.empty:
+                multi_ticker_download({**results['data'], 'portfolio': returns}, key="portfolio", fmt=export_format)
+
                 fig = Visualizer(returns, rows=1, columns=1)
                 fig._add_trace(
                     go.Scatter(
@@ -417,6 +501,16 @@ def portfolio_mode():
             col1.metric("Annualized Return", f"{metrics.get('annualized_return', 0):.2f}%")
             col2.metric("Volatility", f"{metrics.get('volatility', 0):.2f}%")
             col3.metric("Sharpe Ratio", f"{metrics.get('sharpe_ratio', 0):.2f}")
+
+            risk = results.get('risk')
+            if risk:
+                st.subheader("🛡️ Risk Metrics")
+                rcols = st.columns(4)
+                rcols[0].metric("VaR 95% (1 day)", f"{risk['var_historical'] * 100:.2f}%")
+                rcols[1].metric("CVaR 95% (1 day)", f"{risk['cvar_historical'] * 100:.2f}%")
+                rcols[2].metric("Max Drawdown", f"{risk['max_drawdown']:.2f}%",
+                                help=f"Longest drawdown: {risk['max_drawdown_duration']:.0f} days")
+                rcols[3].metric("Sortino / Calmar", f"{risk['sortino_ratio']:.2f} / {risk['calmar_ratio']:.2f}")
             
             # Display geographical influence
             st.subheader("🌍 Combined Geographical Influence")
@@ -425,6 +519,8 @@ def portfolio_mode():
                 df_geo = pd.DataFrame(geo_data)
                 df_geo['size'] = df_geo['weight'] * 50
                 
+                import plotly.express as px
+
                 fig = px.scatter_geo(
                     df_geo,
                     lat='lat',
@@ -471,20 +567,18 @@ def portfolio_mode():
                 st.warning("No geographical data available for this portfolio")
 
 def test_news_fetcher():
-    """NewsFetcher test with simulation"""
+    """NewsFetcher test against a local HTTP stand-in"""
     print("\n" + "="*50)
     print("NEWS FETCHER TEST".center(50))
     print("="*50)
     
     try:
-        fetcher = NewsFetcher()
-        news = fetcher.get_company_news("AAPL")
-        
-        if not news:
-            print("❌ No news retrieved")
-            return False
+        results = NewsFetcher.test_fetcher()
+        news = results['news']
         
-        print(f"✅ {len(news)} articles retrieved")
+        print(f"✅ First fetch: {results['first']}")
+        print(f"✅ Conditional refetch: {results['second']}")
+        print(f"✅ {len(news)} articles stored")
         for i, item in enumerate(news[:3]):
             print(f"{i+1}. {item['title']} ({item['sentiment']})")
         
@@ -494,14 +588,13 @@ def test_news_fetcher():
         return False
 
 def test_reddit_sentiment():
-    """RedditSentiment test with simulation"""
+    """RedditSentiment test on a generated dump"""
     print("\n" + "="*50)
     print("REDDIT SENTIMENT TEST".center(50))
     print("="*50)
     
     try:
-        analyzer = RedditSentiment()
-        data = analyzer.analyze_ticker("TSLA")
+        data = RedditSentiment.test_ingest()['TSLA']
         
         print(f"✅ Results: Positive={data['positive']}, Neutral={data['neutral']}, Negative={data['negative']}")
         print(f"Total: {data['total']}")
@@ -649,9 +742,6 @@ def clear_yfinance_cache():
     if os.path.exists(cache_dir):
         shutil.rmtree(cache_dir, ignore_errors=True)
 
-# Clear cache on startup
-clear_yfinance_cache()
-
 def main():
     """Main application entry point"""
     st.set_page_config(page_title="Financial Dashboard", layout="wide")
@@ -748,24 +838,24 @@ def main():
     </script>
     """, unsafe_allow_html=True)
     
-    # Display loading screen with current theme
+    # Loading screen until the session's first render is ready
     loading_placeholder = st.empty()
-    with loading_placeholder.container():
-        st.markdown(f"""
-        <div class="loading-screen">
-            <div class="loading-content">
-                <div class="loading-logo">
-                    <div class="triangle"></div>
-                    <div class="eye"></div>
+    if not st.session_state.get('app_ready'):
+        with loading_placeholder.container():
+            st.markdown(f"""
+            <div class="loading-screen">
+                <div class="loading-content">
+                    <div class="loading-logo">
+                        <div class="triangle"></div>
+                        <div class="eye"></div>
+                    </div>
+                    <div class="loading-text">MARKET ANALYZER</div>
+                    <div class="loading-subtext">Loading financial data...</div>
                 </div>
-                <div class="loading-text">MARKET ANALYZER</div>
-                <div class="loading-subtext">Loading financial data...</div>
             </div>
-        </div>
-        """, unsafe_allow_html=True)
+            """, unsafe_allow_html=True)
     
-    start_time = time.time()
-    min_loading_time = 2.0
+    start_time = time.perf_counter()
 
     # Main application logic
     if mode == "Individual Dashboard":
@@ -792,6 +882,7 @@ def main():
                     analyzer.add_performance_column()
                     analyzer.add_returns_columns()
                     st.session_state.df = analyzer.df
+                    st.session_state.df_ticker = "AAPL"
                     st.session_state.last_dates = (start_date, end_date)
                 else:
                     st.error("No data available for this period")
@@ -871,18 +962,37 @@ def main():
                     status.update(label="Data loading failed", state="error")
         
         if "compare_data" in st.session_state and st.session_state.compare_data:
+            rebase = st.checkbox("Rebase to 100", value=True, help="Compare relative performance instead of price levels")
             viz = Visualizer(next(iter(st.session_state.compare_data.values())), rows=1, columns=1)
-            viz.draw_multiple_tickers(st.session_state.compare_data)
-            
-            viz.fig.update_layout(
-                title="Performance Comparison",
-                yaxis_title="Closing Price ($)",
-                hovermode="x unified",
-                height=600
-            )
-            
-            st.plotly_chart(viz.fig, use_container_width=True)
-    
+            viz.draw_comparison(st.session_state.compare_data, rebase=rebase)
+            if not rebase:
+                viz.fig.update_yaxes(title_text="Closing Price ($)")
+            viz.show(title="Performance Comparison")
+            multi_ticker_download(st.session_state.compare_data, key="comparison")
+
+            # Rolling beta against the S&P 500
+            st.subheader("📐 Rolling 60-day beta vs S&P 500")
+            macro_period = "1y" if start_date >= (datetime.now() - timedelta(days=365)).date() else "5y"
+            macro_df, _ = MacroData().fetch_macro_data(period=macro_period)
+            try:
+                rolling = RollingStats(window=60).against_indicator(
+                    st.session_state.compare_data, macro_df, indicator="S&P 500"
+                )
+                beta = rolling['beta'].dropna(how='all')
+                if beta.empty:
+                    st.info("Not enough overlapping data for a 60-day beta")
+                else:
+                    beta_viz = Visualizer(beta, rows=1, columns=1)
+                    for ticker in beta.columns:
+                        beta_viz._add_trace(
+                            go.Scatter(x=beta.index, y=beta[ticker], name=ticker, mode='lines'),
+                            overlay=True
+                        )
+                    beta_viz.fig.update_layout(yaxis_title="Beta", hovermode="x unified", height=350)
+                    st.plotly_chart(beta_viz.fig, use_container_width=True)
+            except ValueError as e:
+                st.warning(f"Rolling beta unavailable: {str(e)}")
+
     elif mode == "Virtual Portfolio":
         portfolio_mode()
     
@@ -897,7 +1007,9 @@ def main():
             "NewsFetcher": test_news_fetcher,
             "RedditSentiment": test_reddit_sentiment,
             "PortfolioManager": test_portfolio_manager,
-            "Alert System": test_alert_system
+            "Alert System": test_alert_system,
+            "Cold-start profiler": lambda: bool(ColdStartProfiler.test_profiler()),
+            "Cache backends": Runtime.test_runtime
         }
         
         selected_test = st.selectbox("Select a test to run", list(tests.keys()), key="test_selector")
@@ -915,15 +1027,26 @@ def main():
             
             st.text_area("Logs", value="See console for details", height=100, key="logs_area")
     
-    elapsed = time.time() - start_time
-    if elapsed < min_loading_time:
-        time.sleep(min_loading_time - elapsed)
+    ColdStartProfiler.record(f"First render: {mode}", time.perf_counter() - start_time)
+    st.session_state.app_ready = True
     loading_placeholder.empty()
     
     # Add button to clear cache
     with st.sidebar.expander("Advanced options"):
+        st.checkbox("Show render report", key="show_render_report",
+                    help="Trace types, plotted/dropped points and JSON size under each chart")
+        if st.checkbox("Show startup profile", key="show_startup_profile"):
+            st.dataframe(
+                pd.Series(ColdStartProfiler.stages(), name="ms").rename_axis("Stage (first run of this process)"),
+                use_container_width=True
+            )
+            if st.button("Measure cold imports", help="Import timings in a fresh interpreter (a few seconds)"):
+                times = ColdStartProfiler.import_times(cwd=os.path.dirname(os.path.abspath(__file__)))
+                st.dataframe(pd.Series(times, name="ms").rename_axis("Module"), use_container_width=True)
         if st.button("Clear cache", help="Force reload of all data"):
             st.cache_data.clear()
+            st.cache_resource.clear()  # Analytics caches (macro data, figures, exports)
+            clear_yfinance_cache()
             if 'ticker_cache' in st.session_state:
                 del st.session_state.ticker_cache
             if 'data_cache' in st.session_state:
@@ -0,0 +1,507 @@
+import gzip
+import hashlib
+import io
+import json
+import math
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+# Import local modules
+from src.batch import PIPELINE, load_bars
+from src.cache_utils import SingleFlight
+from src.data_export import DataExporter
+from src.data_fetcher import DataFetcher
+from src.macro_data import MacroData, daily_returns
+from src.portfolio_manager import PortfolioManager
+from src.runtime import Runtime
+from src.technical_analyzer import TechnicalAnalyzer
+
+# Shared by every request: computed frames {(kind, *params): value}
+_DATA_CACHE = Runtime.cache("service_data", ttl=300, maxsize=128)
+# Encoded responses {(path, params, format): (created, status, etag, content type, body, gzipped body or None)},
+# expired on read and, with the disk backend, by the store itself (entries are set with their ttl)
+_RESPONSE_CACHE = Runtime.cache("service_responses", maxsize=256)
+# Identical requests arriving together wait for one computation
+_FLIGHTS = SingleFlight()
+
+class AnalyticsService:
+    """Class to serve the dashboard's indicators, portfolio metrics and macro correlations over HTTP"""
+
+    # Path -> method building the response data (a DataFrame, or a dict for JSON only)
+    ENDPOINTS = {
+        '/health': 'health',
+        '/bars': 'bars',
+        '/indicators': 'indicators',
+        '/portfolio': 'portfolio',
+        '/portfolio/returns': 'portfolio_returns',
+        '/macro/returns': 'macro_returns',
+        '/macro/correlation': 'macro_correlation',
+    }
+
+    # Query 'format' values -> DataExporter format (None: JSON)
+    FORMATS = {'json': None, 'csv': "CSV", 'parquet': "Parquet", 'arrow': "Arrow IPC"}
+
+    DATA_TTL = 300  # Downloaded and computed frames are kept 5 minutes
+    RESPONSE_TTL = 60  # Encoded responses are reused for 1 minute
+    ERROR_TTL = 30  # "No data" answers are retried after 30 seconds
+    GZIP_MIN_BYTES = 1024  # Smaller bodies are sent as is
+    TICKER_PATTERN = re.compile(r"[A-Z0-9.^=-]{1,20}")  # Symbols such as BRK-B, ^VIX or EURUSD=X
+
+    def __init__(self, input_dir=None, period="1y", verbose=False):
+        """
+        Initialize service.
+
+        Args:
+            input_dir (str): Directory of <ticker>.parquet/.csv bars used instead of downloads
+                (macro indicators are read from <symbol> files, e.g. ^VIX.parquet)
+            period (str): Default data period (default: "1y")
+            verbose (bool): Log every request (default: False)
+        """
+        self.input_dir = input_dir
+        self.period = period
+        self.verbose = verbose
+        self.exporter = DataExporter()
+        self.stats = {'requests': 0, 'response_hits': 0, 'not_modified': 0, 'computed': 0, 'errors': 0}
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached frames and responses"""
+        _DATA_CACHE.clear()
+        _RESPONSE_CACHE.clear()
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _cached(self, key, compute):
+        """
+        Value of key from the shared data cache, computed once for concurrent callers
+
+        Cached values are shared by every request and must not be modified.
+
+        Args:
+            key (tuple): Cache key
+            compute (callable): Builds the value on a miss
+
+        Returns:
+            Cached or computed value
+        """
+        value = _DATA_CACHE.get(key)
+        if value is None:
+            value = _FLIGHTS.do(key, self._fill, key, compute)
+        return value
+
+    def _fill(self, key, compute):
+        value = _DATA_CACHE.get(key)  # Filled by a flight that ended just before this one started
+        if value is None:
+            value = compute()
+            _DATA_CACHE.set(key, value, ttl=self.DATA_TTL)
+        return value
+
+    # Data
+
+    def health(self, params):
+        """Service counters"""
+        return {'status': 'ok', **self.stats, 'coalesced': _FLIGHTS.coalesced, 'cached_responses': len(_RESPONSE_CACHE)}
+
+    def _ticker_bars(self, ticker, period, interval):
+        def load():
+            if self.input_dir:
+                try:
+                    df = load_bars(self.input_dir, ticker)
+                except FileNotFoundError:
+                    df = pd.DataFrame()
+            else:
+                df = DataFetcher(ticker).fetch_data(period=period, interval=interval)
+            if df.empty:
+                raise LookupError(f"No data for {ticker}")
+            return df
+        return self._cached(('bars', ticker, period, interval), load)
+
+    def _ticker_indicators(self, ticker, period, interval):
+        def analyze():
+            analyzer = TechnicalAnalyzer(self._ticker_bars(ticker, period, interval).copy())
+            for method in PIPELINE:
+                getattr(analyzer, method)()
+            return analyzer.df
+        return self._cached(('indicators', ticker, period, interval), analyze)
+
+    @classmethod
+    def _ticker(cls, value):
+        """Upper-cased ticker, rejected unless it is a plain symbol (it names a file with --input)"""
+        ticker = value.strip().upper()
+        if not cls.TICKER_PATTERN.fullmatch(ticker):
+            raise ValueError(f"Invalid ticker: {value!r}")
+        return ticker
+
+    def _series_params(self, params):
+        """Ticker, period and interval of a request"""
+        if not params.get('ticker'):
+            raise ValueError("Missing 'ticker' parameter")
+        return self._ticker(params['ticker']), params.get('period', self.period), params.get('interval', "1d")
+
+    @staticmethod
+    def _tail(df, params):
+        """Last 'tail' rows when requested"""
+        if 'tail' not in params:
+            return df
+        return df.iloc[-int(params['tail']):]
+
+    def bars(self, params):
+        """OHLCV bars (params: ticker, period, interval, tail)"""
+        return self._tail(self._ticker_bars(*self._series_params(params)), params)
+
+    def indicators(self, params):
+        """Bars with the dashboard's indicators (params: ticker, period, interval, tail)"""
+        return self._tail(self._ticker_indicators(*self._series_params(params)), params)
+
+    def _weights(self, params):
+        """Portfolio weights from 'weights=AAPL:0.6,MSFT:0.4' or equal weights from 'tickers=AAPL,MSFT'"""
+        if params.get('weights'):
+            weights = {}
+            for item in params['weights'].split(','):
+                ticker, _, weight = item.partition(':')
+                weights[self._ticker(ticker)] = float(weight)
+        elif params.get('tickers'):
+            tickers = [self._ticker(ticker) for ticker in params['tickers'].split(',') if ticker.strip()]
+            weights = {ticker: 1 / len(tickers) for ticker in tickers}
+        else:
+            raise ValueError("Missing 'weights' or 'tickers' parameter")
+        if sum(weights.values()) <= 0:
+            raise ValueError("Portfolio weights must sum to a positive value")
+        return weights
+
+    def _portfolio(self, params):
+        weights = self._weights(params)
+        period = params.get('period', self.period)
+
+        def compute():
+            manager = PortfolioManager(weights)
+            # Reuses the per-ticker frames of /indicators requests
+            manager.data = {ticker: self._ticker_indicators(ticker, period, "1d") for ticker in weights}
+            returns = manager.calculate_weighted_returns()
+            return {
+                'weights': weights,
+                'period': period,
+                'metrics': manager.get_performance_metrics(),
+                'risk': manager.evaluate_allocations().iloc[0].to_dict(),
+                'correlations': manager.calculate_correlations().to_dict(),
+                'returns': returns
+            }
+        return self._cached(('portfolio', tuple(sorted(weights.items())), period), compute)
+
+    def portfolio(self, params):
+        """Performance, risk metrics and correlations of a portfolio (params: weights or tickers, period)"""
+        return {key: value for key, value in self._portfolio(params).items() if key != 'returns'}
+
+    def portfolio_returns(self, params):
+        """Weighted daily and cumulative returns of a portfolio (params: weights or tickers, period)"""
+        return self._portfolio(params)['returns']
+
+    def _macro_panel(self, period):
+        def load():
+            if not self.input_dir:
+                return MacroData().get_macro_returns(period=period)
+            series = {}
+            for name, symbol in MacroData.INDICATORS.items():
+                try:
+                    series[name] = daily_returns(load_bars(self.input_dir, symbol)['Close'])
+                except FileNotFoundError:
+                    continue
+            if not series:
+                return pd.DataFrame()
+            return pd.concat(series, axis=1).iloc[1:]
+        panel = self._cached(('macro', period), load)
+        if panel.empty:
+            raise LookupError("No macro data available")
+        return panel
+
+    def macro_returns(self, params):
+        """Daily returns of the macro indicators (params: period)"""
+        return self._macro_panel(params.get('period', self.period))
+
+    def macro_correlation(self, params):
+        """Correlation of a ticker's returns with each macro indicator (params: ticker, period, window)"""
+        ticker, period, interval = self._series_params(params)
+        df = self._ticker_indicators(ticker, period, interval)
+        macro = self._macro_panel(period)
+        if 'window' in params:
+            return MacroData().get_rolling_correlation(df, macro_returns=macro, window=int(params['window']))
+        return MacroData().get_correlation(df, macro_returns=macro)
+
+    # Encoding
+
+    @classmethod
+    def _jsonable(cls, value):
+        """Plain JSON value (frames in 'split' orientation, NaN and infinities as null)"""
+        if isinstance(value, pd.DataFrame):
+            return json.loads(value.to_json(orient='split', date_format='iso'))
+        if isinstance(value, dict):
+            return {str(key): cls._jsonable(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._jsonable(item) for item in value]
+        if hasattr(value, 'item'):
+            value = value.item()
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+
+    def _encode(self, data, fmt):
+        """Body and content type of response data"""
+        if fmt == 'json':
+            if isinstance(data, pd.DataFrame):
+                body = data.to_json(orient='split', date_format='iso')
+            else:
+                body = json.dumps(self._jsonable(data), separators=(',', ':'))
+            return body.encode('utf-8'), "application/json"
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError(f"Format '{fmt}' is only available for tabular endpoints")
+        export_format = self.FORMATS[fmt]
+        buffer = io.BytesIO()
+        self.exporter.write(data, export_format, buffer)
+        return buffer.getvalue(), self.exporter.mime(export_format)
+
+    def _format(self, params, accept):
+        """Response format from the 'format' parameter, else the Accept header"""
+        fmt = params.pop('format', None)
+        if fmt is None:
+            fmt = 'json'
+            for name, export_format in self.FORMATS.items():
+                if export_format and self.exporter.mime(export_format) in accept:
+                    fmt = name
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown format '{fmt}', use one of: {', '.join(self.FORMATS)}")
+        return fmt
+
+    @staticmethod
+    def _error(status, error):
+        """JSON error response"""
+        body = json.dumps({'error': f"{type(error).__name__}: {error}"}).encode('utf-8')
+        return status, {'Content-Type': "application/json"}, body
+
+    def _build(self, path, params, fmt):
+        """Encode an endpoint's data once for every waiting request and cache it"""
+        try:
+            body, content_type = self._encode(getattr(self, self.ENDPOINTS[path])(dict(params)), fmt)
+            status = 200
+        except LookupError as e:
+            # Missing data is cached too (shorter), so unknown tickers are not reloaded on every request
+            status, headers, body = self._error(404, e)
+            content_type = headers['Content-Type']
+        # Parquet is compressed already
+        gzipped = gzip.compress(body, compresslevel=5) if len(body) >= self.GZIP_MIN_BYTES and fmt != 'parquet' else None
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        # Wall-clock time: entries of the disk backend outlive the process (and reboots)
+        entry = (time.time(), status, etag, content_type, body, gzipped)
+        if path != '/health':
+            self._count('computed')
+            _RESPONSE_CACHE.set((path, params, fmt), entry, ttl=self.RESPONSE_TTL if status == 200 else self.ERROR_TTL)
+        return entry
+
+    def handle(self, path, query, headers):
+        """
+        Answer a GET request
+
+        Args:
+            path (str): URL path
+            query (dict): Parsed query string ({name: [values]})
+            headers (Mapping): Request headers
+
+        Returns:
+            tuple: (HTTP status, {header: value}, body bytes)
+        """
+        self._count('requests')
+        try:
+            if path not in self.ENDPOINTS:
+                raise FileNotFoundError(f"Unknown endpoint {path}, available: {', '.join(self.ENDPOINTS)}")
+            params = {name: values[-1] for name, values in query.items()}
+            fmt = self._format(params, headers.get('Accept', ''))
+            key = (path, tuple(sorted(params.items())), fmt)
+
+            entry = _RESPONSE_CACHE.get(key)
+            if entry is not None and 0 <= time.time() - entry[0] < (self.RESPONSE_TTL if entry[1] == 200 else self.ERROR_TTL):
+                self._count('response_hits')
+            else:
+                entry = _FLIGHTS.do(('response',) + key, self._build, path, key[1], fmt)
+        except Exception as e:
+            self._count('errors')
+            return self._error(404 if isinstance(e, FileNotFoundError) else 400 if isinstance(e, ValueError) else 500, e)
+
+        _, status, etag, content_type, body, gzipped = entry
+        if status != 200:
+            self._count('errors')
+            return status, {'Content-Type': content_type}, body
+
+        response_headers = {
+            'Content-Type': content_type,
+            'ETag': etag,
+            'Cache-Control': f"max-age={self.RESPONSE_TTL}",
+            'Vary': "Accept, Accept-Encoding"
+        }
+        if headers.get('If-None-Match') == etag:
+            self._count('not_modified')
+            return 304, response_headers, b""
+        if gzipped is not None and 'gzip' in headers.get('Accept-Encoding', ''):
+            response_headers['Content-Encoding'] = "gzip"
+            body = gzipped
+        return 200, response_headers, body
+
+    # Server
+
+    def make_server(self, host="127.0.0.1", port=8765):
+        """
+        HTTP server answering each connection in its own thread (port 0 picks a free port)
+
+        Returns:
+            ThreadingHTTPServer: Server, started with serve_forever()
+        """
+        handler = type('Handler', (_RequestHandler,), {'service': self})
+        return _Server((host, port), handler)
+
+    def start_background(self, host="127.0.0.1", port=0):
+        """
+        Start a server in a daemon thread
+
+        Returns:
+            tuple: (server, base URL)
+        """
+        server = self.make_server(host, port)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server, f"http://{host}:{server.server_address[1]}"
+
+    @classmethod
+    def test_service(cls):
+        """
+        Test endpoints, formats, gzip, ETags and coalescing on synthetic data
+
+        Example:
+        >>> stats = AnalyticsService.test_service()
+        >>> print(stats)
+        """
+        import tempfile
+        import urllib.request
+        from concurrent.futures import ThreadPoolExecutor
+        import pyarrow as pa
+
+        raw = TechnicalAnalyzer.test_update().df[['Open', 'High', 'Low', 'Close', 'Volume']]
+        with tempfile.TemporaryDirectory() as input_dir:
+            raw.to_parquet(os.path.join(input_dir, "AAA.parquet"))
+            (raw * 1.01).to_parquet(os.path.join(input_dir, "BBB.parquet"))
+            (raw[['Close']] * 0.5).to_parquet(os.path.join(input_dir, "^VIX.parquet"))
+
+            cls.clear_cache()
+            service = cls(input_dir=input_dir)
+            loads = []
+            ticker_bars = service._ticker_bars
+
+            def slow_bars(*args):
+                loads.append(args)
+                time.sleep(0.2)  # Lets concurrent requests pile up behind the first one
+                return ticker_bars(*args)
+            service._ticker_bars = slow_bars
+
+            server, url = service.start_background()
+            try:
+                def get(path, **headers):
+                    request = urllib.request.Request(url + path, headers=headers)
+                    try:
+                        with urllib.request.urlopen(request) as response:
+                            return response.status, response.headers, response.read()
+                    except urllib.error.HTTPError as e:
+                        return e.code, e.headers, e.read()
+
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(executor.map(lambda _: get("/indicators?ticker=AAA"), range(8)))
+                assert all(status == 200 for status, _, _ in results), "Concurrent requests failed"
+                assert len({body for _, _, body in results}) == 1, "Concurrent responses differ"
+                assert service.stats['computed'] == 1 and _FLIGHTS.coalesced >= 1, f"Requests not coalesced: {service.stats}"
+                assert len(loads) == 1, "Bars loaded more than once"
+
+                status, headers, body = get("/indicators?ticker=AAA", **{'Accept-Encoding': "gzip"})
+                assert headers['Content-Encoding'] == "gzip" and gzip.decompress(body) == results[0][2], "Bad gzip body"
+                assert service.stats['response_hits'] == 1, "Response not reused"
+                assert get("/indicators?ticker=AAA", **{'If-None-Match': headers['ETag']})[0] == 304, "ETag not honored"
+
+                status, headers, body = get("/indicators?ticker=AAA&format=arrow")
+                table = pa.ipc.open_file(pa.BufferReader(body)).read_all()
+                assert status == 200 and table.num_rows == len(raw), "Bad Arrow body"
+                status, _, body = get("/indicators?ticker=AAA", Accept=service.exporter.mime("Parquet"))
+                assert status == 200 and body[:4] == b"PAR1", "Accept header ignored"
+
+                status, _, body = get("/portfolio?tickers=AAA,BBB")
+                portfolio = json.loads(body)
+                assert status == 200 and set(portfolio) == {'weights', 'period', 'metrics', 'risk', 'correlations'}, body
+                assert get("/macro/correlation?ticker=AAA")[0] == 200, "Macro correlation failed"
+
+                assert get("/indicators")[0] == 400, "Missing ticker accepted"
+                assert get("/indicators?ticker=../../AAA")[0] == 400, "Path in ticker accepted"
+                assert get("/portfolio?tickers=AAA,../BBB")[0] == 400, "Path in portfolio ticker accepted"
+                assert get("/indicators?ticker=ZZZ")[0] == 404, "Unknown ticker found"
+                hits = service.stats['response_hits']
+                assert get("/indicators?ticker=ZZZ")[0] == 404 and service.stats['response_hits'] == hits + 1, "Missing data not cached"
+                assert get("/portfolio?tickers=AAA&format=arrow")[0] == 400, "Arrow for a non-tabular endpoint"
+                assert get("/nowhere")[0] == 404, "Unknown endpoint found"
+            finally:
+                server.shutdown()
+                server.server_close()
+                cls.clear_cache()
+        return service.health({})
+
+class _Server(ThreadingHTTPServer):
+    """Threaded server accepting bursts of connections"""
+
+    daemon_threads = True
+    request_queue_size = 128  # The default 5 makes clients beyond it retry after 1 s
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Hands GET requests to the service bound by AnalyticsService.make_server"""
+
+    service = None
+    protocol_version = "HTTP/1.1"  # Keep-alive connections
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, headers, body = self.service.handle(url.path, parse_qs(url.query), self.headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.service.verbose:
+            super().log_message(format, *args)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve indicators, portfolio metrics and macro correlations as JSON, CSV, Parquet or Arrow")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--input", help="Directory of <ticker>.parquet/.csv bars used instead of downloads")
+    parser.add_argument("--period", default="1y", help="Default data period")
+    parser.add_argument("--cache", choices=["memory", "disk"], default="memory",
+                        help="Cache backend, disk keeps computed data across restarts and processes")
+    parser.add_argument("--cache-dir", help="Directory of the disk cache")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    Runtime.configure(backend=args.cache, cache_dir=args.cache_dir)
+
+    server = AnalyticsService(input_dir=args.input, period=args.period, verbose=args.verbose).make_server(args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} ({', '.join(AnalyticsService.ENDPOINTS)})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
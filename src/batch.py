@@ -0,0 +1,309 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+# Import local modules
+from src.asset_categories import AssetCategories
+from src.data_fetcher import DataFetcher
+from src.portfolio_manager import PortfolioManager
+from src.risk_analyzer import RiskAnalyzer
+from src.technical_analyzer import TechnicalAnalyzer
+
+DEFAULT_OUTPUT = "batch_output"
+
+# TechnicalAnalyzer steps of the dashboard, in order
+PIPELINE = (
+    'compute_50_200_days', 'add_rsi', 'calculate_volatility',
+    'add_signal_column', 'add_performance_column', 'add_returns_columns'
+)
+
+def load_bars(input_dir, ticker):
+    """Bars of a ticker from <input_dir>/<ticker>.parquet or .csv (dates in the index or a 'Date' column)"""
+    path = os.path.join(input_dir, f"{ticker}.parquet")
+    if os.path.exists(path):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(os.path.join(input_dir, f"{ticker}.csv"))
+    if 'Date' in df.columns:
+        df = df.set_index(pd.to_datetime(df.pop('Date'), utc=True))
+    return df
+
+def _write_parquet(df, path):
+    """Write atomically, so an interrupted run never leaves a truncated file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+def _process_ticker(ticker, params):
+    """
+    Fetch (or load), analyze and write one ticker, in a worker process
+
+    Returns:
+        dict: 'ticker', 'timings' {stage: seconds}, 'summary' row or 'error' and failed 'stage'
+    """
+    timings = {}
+    stage = 'fetch'
+    try:
+        start = time.perf_counter()
+        raw_path = os.path.join(params['output'], 'raw', f"{ticker}.parquet")
+        if params['input']:
+            bars = load_bars(params['input'], ticker)
+        elif os.path.exists(raw_path):
+            bars = pd.read_parquet(raw_path)  # Downloaded by an interrupted run
+        else:
+            bars = DataFetcher(ticker).fetch_data(period=params['period'])
+            if bars.empty:
+                raise ValueError("No data")
+            _write_parquet(bars, raw_path)
+        timings['fetch'] = time.perf_counter() - start
+
+        stage = 'analyze'
+        start = time.perf_counter()
+        analyzer = TechnicalAnalyzer(bars)
+        for method in PIPELINE:
+            getattr(analyzer, method)()
+        df = analyzer.df
+        risk = RiskAnalyzer(df[['Daily_Return']]).evaluate([[1.0]]).iloc[0]
+        timings['analyze'] = time.perf_counter() - start
+
+        stage = 'write'
+        start = time.perf_counter()
+        _write_parquet(df, os.path.join(params['output'], 'tickers', f"{ticker}.parquet"))
+        timings['write'] = time.perf_counter() - start
+
+        if params['charts']:
+            stage = 'chart'
+            start = time.perf_counter()
+            from src.visualizer import Visualizer  # Only needed for charts
+
+            # Timezone-aware dates are object arrays that Plotly copies slowly (~6x), local dates plot the same
+            chart_df = df.tz_localize(None) if getattr(df.index, 'tz', None) is not None else df
+            viz = Visualizer(chart_df, rows=2, columns=1, row_heights=[0.7, 0.3])
+            viz.draw_candlestick().MA_draw(overlay=True).Rsi_draw()
+            viz.styled_figure(title=ticker).write_html(
+                os.path.join(params['output'], 'charts', f"{ticker}.html"), include_plotlyjs='cdn'
+            )
+            timings['chart'] = time.perf_counter() - start
+
+        summary = {
+            'ticker': ticker,
+            'last_date': df.index[-1].isoformat(),
+            'close': df['Close'].iloc[-1],
+            'rsi': df['rsi'].iloc[-1],
+            'volatility': df['Volatility'].iloc[-1],
+            'signal': df['Signal'].iloc[-1],
+            'rows': len(df),
+            **risk.to_dict()
+        }
+        # Plain Python values: summaries are kept in the JSON manifest
+        summary = {key: value.item() if hasattr(value, 'item') else value for key, value in summary.items()}
+        return {'ticker': ticker, 'timings': timings, 'summary': summary}
+    except Exception as e:
+        return {'ticker': ticker, 'timings': timings, 'error': f"{type(e).__name__}: {e}", 'stage': stage}
+
+def _category_metrics(category, tickers, output):
+    """Equal-weight portfolio metrics of a category from the written ticker files, in a worker process"""
+    start = time.perf_counter()
+    manager = PortfolioManager({ticker: 1 / len(tickers) for ticker in tickers})
+    manager.data = {
+        ticker: pd.read_parquet(os.path.join(output, 'tickers', f"{ticker}.parquet"), columns=['Close', 'Daily_Return'])
+        for ticker in tickers
+    }
+    manager.calculate_weighted_returns()
+    row = {'category': category, 'tickers': len(tickers), **manager.get_performance_metrics()}
+    risk = manager.evaluate_allocations().iloc[0]
+    row.update({f"risk_{name}": value for name, value in risk.items()})
+    return row, time.perf_counter() - start
+
+class BatchRunner:
+    """Class to run the analysis pipeline over many tickers without Streamlit, on all cores"""
+
+    def __init__(self, output=DEFAULT_OUTPUT, period="1y", input_dir=None, charts=False, workers=None, run_date=None):
+        """
+        Initialize runner.
+
+        Args:
+            output (str): Output directory (default: "batch_output")
+            period (str): History downloaded per ticker (default: "1y")
+            input_dir (str): Load <ticker>.parquet/.csv bars from this directory instead of downloading (default: None)
+            charts (bool): Also write static HTML charts (default: False)
+            workers (int): Worker processes (default: number of cores)
+            run_date (str): Run identifier, a run resumes only a run with the same one (default: today)
+        """
+        self.output = output
+        run_date = run_date or pd.Timestamp.now().date().isoformat()
+        self.params = {'output': output, 'period': period, 'input': input_dir, 'charts': charts, 'date': run_date}
+        self.workers = workers or os.cpu_count() or 1
+        self.manifest_path = os.path.join(output, 'manifest.json')
+        self.timings = []  # (ticker or category, stage, seconds)
+
+    def _load_manifest(self):
+        """Completed tickers of a previous run with the same parameters"""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {'params': self.params, 'tickers': {}}
+        if manifest.get('params') != self.params:
+            return {'params': self.params, 'tickers': {}}  # Different run: start over
+        return manifest
+
+    def _save_manifest(self, manifest):
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, default=str)
+        os.replace(tmp_path, self.manifest_path)
+
+    def run(self, tickers=None, categories=None, resume=True):
+        """
+        Process tickers, then category portfolios, writing Parquet tables
+
+        Tickers completed by a previous run with the same parameters are
+        skipped when resuming; the manifest is saved after every ticker, so an
+        interrupted or partly failed run can be started again.
+
+        Args:
+            tickers (list): Tickers (default: those of the categories)
+            categories (list): Category names (default: every AssetCategories category)
+            resume (bool): Skip tickers already completed (default: True)
+
+        Returns:
+            dict: 'done', 'skipped' and 'failed' ({ticker: error}) tickers
+        """
+        all_categories = AssetCategories.get_all_categories()
+        categories = {name: all_categories[name] for name in (categories or all_categories)}
+        if tickers is None:
+            tickers = sorted({ticker for members in categories.values() for ticker in members})
+        for folder in ('raw', 'tickers', 'charts' if self.params['charts'] else None):
+            if folder:
+                os.makedirs(os.path.join(self.output, folder), exist_ok=True)
+
+        manifest = self._load_manifest() if resume else {'params': self.params, 'tickers': {}}
+        if not manifest['tickers']:
+            # Starting over: downloads kept for an interrupted run are stale
+            for entry in os.scandir(os.path.join(self.output, 'raw')):
+                os.unlink(entry.path)
+        done = {t for t, entry in manifest['tickers'].items() if entry.get('status') == 'done'}
+        pending = [t for t in tickers if t not in done]
+        result = {'done': [], 'skipped': sorted(done & set(tickers)), 'failed': {}}
+        print(f"{len(pending)} tickers to process, {len(result['skipped'])} already done, {self.workers} workers")
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(_process_ticker, ticker, self.params) for ticker in pending]
+            for i, future in enumerate(as_completed(futures), 1):
+                outcome = future.result()
+                ticker = outcome['ticker']
+                self.timings.extend((ticker, stage, seconds) for stage, seconds in outcome['timings'].items())
+                if 'error' in outcome:
+                    manifest['tickers'][ticker] = {'status': 'failed', 'stage': outcome['stage'], 'error': outcome['error']}
+                    result['failed'][ticker] = outcome['error']
+                    print(f"[{i}/{len(pending)}] {ticker} failed at {outcome['stage']}: {outcome['error']}")
+                else:
+                    manifest['tickers'][ticker] = {'status': 'done', 'summary': outcome['summary']}
+                    result['done'].append(ticker)
+                self._save_manifest(manifest)
+
+            # Summary of every completed ticker, this run and previous ones
+            summaries = [entry['summary'] for t, entry in manifest['tickers'].items()
+                         if entry.get('status') == 'done' and t in tickers]
+            if summaries:
+                _write_parquet(pd.DataFrame(summaries).set_index('ticker').sort_index(),
+                               os.path.join(self.output, 'summary.parquet'))
+
+            completed = {t for t, entry in manifest['tickers'].items() if entry.get('status') == 'done'}
+            jobs = {
+                executor.submit(_category_metrics, name, members, self.output): name
+                for name, members in ((name, sorted(set(members) & completed)) for name, members in categories.items())
+                if members
+            }
+            rows = []
+            for future in as_completed(jobs):
+                try:
+                    row, seconds = future.result()
+                except Exception as e:
+                    print(f"Category {jobs[future]} failed: {e}")
+                    continue
+                rows.append(row)
+                self.timings.append((jobs[future], 'portfolio', seconds))
+            if rows:
+                _write_parquet(pd.DataFrame(rows).set_index('category').sort_index(),
+                               os.path.join(self.output, 'portfolios.parquet'))
+
+        self.timings.append(('*', 'total (wall clock)', time.perf_counter() - start))
+        _write_parquet(pd.DataFrame(self.timings, columns=['item', 'stage', 'seconds']),
+                       os.path.join(self.output, 'timings.parquet'))
+        return result
+
+    def timing_report(self):
+        """
+        Per-stage timing statistics of the last run
+
+        Returns:
+            pd.DataFrame: count, total, mean and max seconds by stage
+        """
+        timings = pd.DataFrame(self.timings, columns=['item', 'stage', 'seconds'])
+        return timings.groupby('stage', sort=False)['seconds'].agg(['count', 'sum', 'mean', 'max']).rename(
+            columns={'sum': 'total'}
+        )
+
+    @classmethod
+    def test_batch(cls):
+        """
+        Run on generated inputs, with a failing ticker, then resume
+
+        Example:
+        >>> result = BatchRunner.test_batch()
+        >>> print(result)
+        """
+        import tempfile
+
+        import numpy as np
+
+        with tempfile.TemporaryDirectory() as tmp:
+            inputs = os.path.join(tmp, 'inputs')
+            os.makedirs(inputs)
+            rng = np.random.default_rng(0)
+            dates = pd.date_range("2023-01-02", periods=300, freq="B", tz="America/New_York", name="Date")
+            for ticker in ("AAA", "BBB"):
+                close = 100 + np.cumsum(rng.normal(size=len(dates)))
+                pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1e6},
+                             index=dates).to_parquet(os.path.join(inputs, f"{ticker}.parquet"))
+
+            runner = cls(output=os.path.join(tmp, 'out'), input_dir=inputs, workers=2)
+            first = runner.run(tickers=["AAA", "BBB", "CCC"], categories=["Technology"])
+            assert first['done'] and "CCC" in first['failed'], f"Unexpected first run: {first}"
+
+            second = cls(output=runner.output, input_dir=inputs, workers=2).run(
+                tickers=["AAA", "BBB", "CCC"], categories=["Technology"]
+            )
+            assert sorted(second['skipped']) == ["AAA", "BBB"], f"Completed tickers not skipped: {second}"
+            summary = pd.read_parquet(os.path.join(runner.output, 'summary.parquet'))
+            assert list(summary.index) == ["AAA", "BBB"], f"Unexpected summary: {summary.index}"
+        return {'first': first, 'second': second}
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Headless batch analytics over the AssetCategories universe")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Output directory (default: %(default)s)")
+    parser.add_argument("--categories", nargs="+", help="Categories to process (default: all)")
+    parser.add_argument("--tickers", nargs="+", help="Tickers to process (default: those of the categories)")
+    parser.add_argument("--period", default="1y", help="History downloaded per ticker (default: %(default)s)")
+    parser.add_argument("--input", help="Directory of <ticker>.parquet/.csv bars to use instead of downloading")
+    parser.add_argument("--charts", action="store_true", help="Write static HTML charts")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of cores)")
+    parser.add_argument("--no-resume", action="store_true", help="Process again tickers already completed")
+    args = parser.parse_args()
+
+    runner = BatchRunner(output=args.output, period=args.period, input_dir=args.input,
+                         charts=args.charts, workers=args.workers)
+    outcome = runner.run(tickers=args.tickers, categories=args.categories, resume=not args.no_resume)
+    print(f"\nDone: {len(outcome['done'])}, skipped: {len(outcome['skipped'])}, failed: {len(outcome['failed'])}")
+    print("\nStage timings (s):")
+    print(runner.timing_report().round(3).to_string())
+    sys.exit(1 if outcome['failed'] else 0)
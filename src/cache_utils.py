@@ -0,0 +1,345 @@
+import contextlib
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+class TTLCache:
+    """Thread-safe in-memory cache with per-entry expiry"""
+
+    def __init__(self, ttl=3600, maxsize=None):
+        """
+        Initialize cache.
+
+        Args:
+            ttl (float): Default time-to-live in seconds (default: 3600)
+            maxsize (int): Maximum number of entries, least recently used evicted first,
+                None for no limit (default: None)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (expiry timestamp, value), least recently used first
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return cached value, or default if missing or expired.
+
+        Args:
+            key (hashable): Cache key
+            default: Value returned on miss (default: None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expiry, value = entry
+            if expiry < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value, dropping expired entries and the least recently used ones beyond maxsize.
+
+        Args:
+            key (hashable): Cache key
+            value: Value to store
+            ttl (float): Time-to-live in seconds (default: cache ttl)
+        """
+        now = time.monotonic()
+        with self._lock:
+            # Entries only expire on read otherwise: keys never read again would stay forever
+            for expired in [k for k, (expiry, _) in self._entries.items() if expiry < now]:
+                del self._entries[expired]
+            self._entries[key] = (now + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+class LRUCache:
+    """Thread-safe in-memory cache keeping the most recently used entries"""
+
+    def __init__(self, maxsize=32):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize (int): Maximum number of entries (default: 32)
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return cached value (marking it as recently used), or default if missing.
+
+        Args:
+            key (hashable): Cache key
+            default: Value returned on miss (default: None)
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        """
+        Store a value, evicting the least recently used entries beyond maxsize.
+
+        Args:
+            key (hashable): Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+class DiskCache:
+    """Pickle-file cache with per-entry expiry, shared by every process using the same directory"""
+
+    def __init__(self, directory, ttl=None, maxsize=None):
+        """
+        Initialize cache.
+
+        Args:
+            directory (str): Directory of entry files (created if missing)
+            ttl (float): Default time-to-live in seconds, None to keep entries (default: None)
+            maxsize (int): Maximum number of entries, oldest removed first, None for no limit (default: None)
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.maxsize = maxsize
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{data_fingerprint(key)}.pkl")
+
+    def get(self, key, default=None):
+        """
+        Return cached value, or default if missing, expired or unreadable.
+
+        Args:
+            key (hashable): Cache key (fingerprinted, see data_fingerprint)
+            default: Value returned on miss (default: None)
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                expiry, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        if expiry is not None and expiry < time.time():
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+            return default
+        return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value (written atomically, so concurrent readers never see a partial file).
+
+        Args:
+            key (hashable): Cache key
+            value: Picklable value
+            ttl (float): Time-to-live in seconds (default: cache ttl)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((None if ttl is None else time.time() + ttl, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        if self.maxsize is not None:
+            self._evict()
+
+    def _evict(self):
+        """Remove the oldest entries beyond maxsize"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue  # Evicted or replaced by another process meanwhile
+        if len(entries) > self.maxsize:
+            entries.sort()
+            for _, path in entries[:len(entries) - self.maxsize]:
+                with contextlib.suppress(OSError):
+                    os.unlink(path)
+
+    def clear(self):
+        """Remove all entries"""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                with contextlib.suppress(OSError):
+                    os.unlink(entry.path)
+
+    def __len__(self):
+        return sum(1 for entry in os.scandir(self.directory) if entry.name.endswith('.pkl'))
+
+class StreamlitCache:
+    """In-memory cache held in Streamlit's resource cache: shared by sessions, dropped by "Clear cache\""""
+
+    def __init__(self, name, ttl=None, maxsize=None):
+        """
+        Initialize cache.
+
+        Args:
+            name (str): Cache name (one store per name)
+            ttl (float): Default time-to-live in seconds, entries expire with a TTLCache (default: None)
+            maxsize (int): Maximum number of entries, least recently used evicted first (default: None)
+        """
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+    def _store(self):
+        # Looked up on every call: st.cache_resource.clear() replaces the store
+        return _streamlit_store(self.name, self.ttl, self.maxsize)
+
+    def get(self, key, default=None):
+        """Return cached value, or default (see TTLCache.get / LRUCache.get)"""
+        return self._store().get(key, default)
+
+    def set(self, key, value, ttl=None):
+        """Store a value (ttl is used by TTL stores only)"""
+        store = self._store()
+        if isinstance(store, TTLCache):
+            store.set(key, value, ttl=ttl)
+        else:
+            store.set(key, value)
+
+    def clear(self):
+        """Remove all entries"""
+        self._store().clear()
+
+    def __len__(self):
+        return len(self._store())
+
+_STREAMLIT_STORE = None
+
+def _streamlit_store(name, ttl, maxsize):
+    """Store of a StreamlitCache, created by a st.cache_resource function defined on first use"""
+    global _STREAMLIT_STORE
+    if _STREAMLIT_STORE is None:
+        import streamlit as st  # Only when the Streamlit backend is selected
+
+        @st.cache_resource(show_spinner=False)
+        def store(name, ttl, maxsize):
+            return TTLCache(ttl=ttl, maxsize=maxsize) if ttl is not None else LRUCache(maxsize=maxsize or 32)
+        _STREAMLIT_STORE = store
+    return _STREAMLIT_STORE(name, ttl, maxsize)
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution"""
+
+    def __init__(self):
+        self._calls = {}  # key -> [done event, result, exception]
+        self._lock = threading.Lock()
+        self.coalesced = 0  # Calls served by another caller's execution
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Run func, or wait for the call already running for key and share its outcome.
+
+        Args:
+            key (hashable): Call identity
+            func (callable): Function to run
+            *args, **kwargs: Arguments of func
+
+        Returns:
+            Result of func (its exception is raised in every waiting caller)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = [threading.Event(), None, None]
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call[1] = func(*args, **kwargs)
+            except Exception as e:
+                call[2] = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call[0].set()
+        else:
+            call[0].wait()
+
+        if call[2] is not None:
+            raise call[2]
+        return call[1]
+
+def data_fingerprint(obj):
+    """
+    Content hash of data and plain parameters, usable as a cache key
+
+    DataFrames, Series and arrays are hashed by value (including index and
+    column names), dicts, lists and tuples recursively, anything else by repr.
+
+    Args:
+        obj: Value to fingerprint
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    def feed(value):
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            labels = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+            digest.update(f"{type(value).__name__}{value.shape}{labels}".encode())
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        elif isinstance(value, np.ndarray):
+            digest.update(f"ndarray{value.shape}{value.dtype}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, dict):
+            digest.update(b"{")
+            for key in sorted(value, key=repr):
+                feed(key)
+                feed(value[key])
+            digest.update(b"}")
+        elif isinstance(value, (list, tuple)):
+            digest.update(b"[")
+            for item in value:
+                feed(item)
+            digest.update(b"]")
+        else:
+            digest.update(repr(value).encode())
+        digest.update(b"|")
+
+    feed(obj)
+    return digest.hexdigest()
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+class CovarianceEngine:
+    """Class to estimate covariance and correlation of asset returns, updatable day by day"""
+
+    def __init__(self, columns):
+        """
+        Initialize an empty estimator.
+
+        Args:
+            columns (list): Asset names (one per return column)
+        """
+        self.columns = list(columns)
+        size = len(self.columns)
+        self.count = 0
+        self.mean = np.zeros(size)
+        self._m2 = np.zeros((size, size))  # Sum of centered cross-products
+        # Shift and fourth-moment accumulators used by Ledoit-Wolf shrinkage
+        self._shift = None
+        self._sum_q = 0.0
+        self._sum_q2 = 0.0
+        self._sum_qz = np.zeros(size)
+
+    @classmethod
+    def from_returns(cls, returns):
+        """
+        Build an estimator from a block of returns.
+
+        Args:
+            returns (pd.DataFrame): Daily returns (rows: dates, columns: assets)
+
+        Returns:
+            CovarianceEngine: Fitted estimator
+        """
+        engine = cls(returns.columns)
+        engine.update(returns)
+        return engine
+
+    def update(self, returns):
+        """
+        Add new observations (one day or a block of days).
+
+        Rows containing NaN are ignored. Blocks are merged with the pairwise
+        (Chan et al.) update, so the result equals a full recomputation.
+
+        Args:
+            returns (pd.Series/pd.DataFrame/np.ndarray): New daily returns
+
+        Returns:
+            CovarianceEngine: self
+        """
+        if isinstance(returns, pd.DataFrame):
+            block = returns[self.columns].to_numpy(dtype=float)
+        elif isinstance(returns, pd.Series):
+            block = returns[self.columns].to_numpy(dtype=float)[None, :]
+        else:
+            block = np.atleast_2d(np.asarray(returns, dtype=float))
+
+        block = block[~np.isnan(block).any(axis=1)]
+        block_count = len(block)
+        if block_count == 0:
+            return self
+
+        if self._shift is None:
+            self._shift = block.mean(axis=0)
+
+        block_mean = block.mean(axis=0)
+        centered = block - block_mean
+        total = self.count + block_count
+        delta = block_mean - self.mean
+
+        self._m2 += centered.T @ centered + np.outer(delta, delta) * (self.count * block_count / total)
+        self.mean += delta * (block_count / total)
+        self.count = total
+
+        shifted = block - self._shift
+        q = np.einsum('ij,ij->i', shifted, shifted)
+        self._sum_q += q.sum()
+        self._sum_q2 += q @ q
+        self._sum_qz += q @ shifted
+        return self
+
+    def covariance(self, shrinkage=False):
+        """
+        Return the covariance matrix.
+
+        Args:
+            shrinkage (bool): Apply Ledoit-Wolf shrinkage towards a scaled identity (default: False)
+
+        Returns:
+            pd.DataFrame: Covariance matrix
+        """
+        if self.count < 2:
+            raise ValueError("At least 2 observations are required.")
+
+        if shrinkage:
+            matrix = self._ledoit_wolf()
+        else:
+            matrix = self._m2 / (self.count - 1)
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+    def correlation(self, shrinkage=False):
+        """
+        Return the correlation matrix.
+
+        Args:
+            shrinkage (bool): Derive correlations from the shrunk covariance (default: False)
+
+        Returns:
+            pd.DataFrame: Correlation matrix
+        """
+        cov = self.covariance(shrinkage=shrinkage).to_numpy()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = cov / np.outer(std, std)
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def shrinkage_intensity(self):
+        """Return the Ledoit-Wolf shrinkage intensity (0 = sample covariance, 1 = target)"""
+        return self._ledoit_wolf(return_intensity=True)
+
+    def _ledoit_wolf(self, return_intensity=False):
+        """
+        Ledoit-Wolf (2004) shrinkage of the biased sample covariance towards mu * I.
+
+        The sum of squared norms of the centered observations is rebuilt from the
+        running accumulators, so shrinkage stays available after online updates.
+        """
+        n = self.count
+        size = len(self.columns)
+        sample = self._m2 / n
+        mu = np.trace(sample) / size
+
+        target_gap = sample.copy()
+        target_gap[np.diag_indices(size)] -= mu
+        d2 = np.sum(target_gap ** 2)
+
+        # sum_t ||x_t - mean||^4 expressed with shifted accumulators
+        offset = self.mean - self._shift
+        m = offset @ offset
+        sum_y4 = (self._sum_q2
+                  + 4 * offset @ self._m2 @ offset
+                  - 4 * offset @ self._sum_qz
+                  + 2 * m * self._sum_q
+                  + n * m ** 2)
+        b2_bar = max(sum_y4 - n * np.sum(sample ** 2), 0.0) / n ** 2
+        b2 = min(b2_bar, d2)
+        intensity = b2 / d2 if d2 > 0 else 0.0
+
+        if return_intensity:
+            return intensity
+
+        shrunk = (1 - intensity) * sample
+        shrunk[np.diag_indices(size)] += intensity * mu
+        return shrunk
@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
@@ -14,6 +13,9 @@ from src.reddit_analyzer import RedditSentiment
 from src.geo_data import GeoDataFetcher
 from src.asset_categories import AssetCategories
 from src.macro_data import MacroData
+from src.table_view import TableView
+from src.data_export import DataExporter
+from src.live_feed import LiveFeed
 
 class Dashboard:
     """Class to create financial dashboard"""
@@ -163,6 +165,7 @@ class Dashboard:
         if 'data_cache' in st.session_state and cache_key in st.session_state.data_cache:
             self.df = st.session_state.data_cache[cache_key]
             st.session_state.df = self.df
+            st.session_state.df_ticker = self.selected_ticker
             st.rerun()
             return
             
@@ -198,6 +201,7 @@ class Dashboard:
                 
                 self.df = analyzer.df
                 st.session_state.df = self.df
+                st.session_state.df_ticker = self.selected_ticker
                 progress_bar.progress(100)
                 status.update(label="Data updated successfully!", state="complete")
                 st.rerun()
@@ -209,20 +213,26 @@ class Dashboard:
             st.session_state.data_cache = {}
             st.session_state.data_cache[cache_key] = self.df
             
-    def _display_kpis(self):
-        """Display key indicators with improved style"""
+    @st.fragment
+    def _display_kpis(self, df):
+        """
+        Display key indicators with improved style (fragment, reruns on its own)
+
+        Args:
+            df (pd.DataFrame): Analyzed price data
+        """
         cols = st.columns(4)
     
-        price_change = self.df['Close'].pct_change().iloc[-1] * 100
+        price_change = df['Close'].pct_change().iloc[-1] * 100
         cols[0].metric(
             label="💰 Current price",
-            value=f"{self.df['Close'].iloc[-1]:.2f} $",
+            value=f"{df['Close'].iloc[-1]:.2f} $",
             delta=f"{price_change:.2f}%",
             delta_color="normal",
             help="Last closing price with daily variation"
         )
     
-        volatility = self.df['Volatility'].iloc[-1] * 100
+        volatility = df['Volatility'].iloc[-1] * 100
         volatility_icon = "📈" if volatility < 5 else "📉" if volatility > 15 else "📊"
         cols[1].metric(
             label=f"{volatility_icon} Volatility (30d)",
@@ -230,15 +240,15 @@ class Dashboard:
             help="Annualized 30-day volatility"
         )
     
-        volume = self.df['Volume'].iloc[-1]
+        volume = df['Volume'].iloc[-1]
         cols[2].metric(
             label="📦 Daily volume",
             value=f"{volume/1e6:.1f}M",
             help="Traded volume in millions"
         )
     
-        if 'rsi' in self.df.columns:
-            rsi_value = self.df['rsi'].iloc[-1]
+        if 'rsi' in df.columns:
+            rsi_value = df['rsi'].iloc[-1]
             rsi_status = "Buy" if rsi_value < 30 else "Sell" if rsi_value > 70 else "Neutral"
             cols[3].metric(
                 label=f"📊 RSI (14d) - {rsi_status}",
@@ -248,16 +258,20 @@ class Dashboard:
         
         # Market Mood (new section)
         st.markdown("---")
-        self._display_market_mood()
+        self._display_market_mood(df)
         
         # Risk/Reward gauge
-        self._display_risk_reward()
-
-        # Add after risk/reward gauge
-        self._display_macro_context()
+        self._display_risk_reward(df)
         
-    def _display_macro_context(self):
-        """Display macroeconomic context"""
+    @st.fragment
+    def _display_macro_context(self, df, ticker):
+        """
+        Display macroeconomic context (fragment, reruns on its own)
+
+        Args:
+            df (pd.DataFrame): Analyzed price data
+            ticker (str): Ticker correlated with the indicators
+        """
         st.markdown("---")
         st.subheader("🌐 Macro-economic Context")
         
@@ -302,89 +316,160 @@ class Dashboard:
                 )
             fig.fig.update_layout(height=300)
             st.plotly_chart(fig.fig, use_container_width=True)
+
+            # Asset vs macro daily-return correlation (shared cached returns panel)
+            correlations = macro_fetcher.get_correlation(df, period="1y")
+            if not correlations.empty:
+                st.markdown(f"**Daily-return correlation with {ticker}**")
+                st.bar_chart(correlations['Close'].dropna(), height=200)
             
+    ANALYSIS_SECTIONS = {
+        "📈 Main Chart": "_display_main_chart",
+        "📊 Technical Analysis": "_display_technical_analysis",
+        "🔍 Raw Data": "_display_raw_data",
+        "📰 News & Sentiment": "_display_news_analysis",
+        "🌍 Geographical Influence": "_display_geo_influence"
+    }
+
+    @st.fragment
     def _create_analysis_tabs(self):
-        """Create analysis tabs with enriched content"""
-        tab1, tab2, tab3, tab4 , tab5 = st.tabs([
-            "📈 Main Chart", 
-            "📊 Technical Analysis", 
-            "🔍 Raw Data",
-            "📰 News & Sentiment",
-            "🌍 Geographical Influence" 
-        ])
-
-        with tab1:
-            st.markdown("#### Price evolution with moving averages")
-            fig = Visualizer(self.df, rows=1, columns=1)
-            fig.draw_candlestick().MA_draw(overlay=True)
-            fig.show(title=f"Analysis of {self.selected_ticker}")
-        
-            st.markdown("##### Recent trends")
-            col1, col2 = st.columns(2)
-            with col1:
-                last_5_days = self.df['Close'].pct_change(5).iloc[-1] * 100
-                st.metric("Last 5 days", f"{last_5_days:.2f}%")
-            with col2:
-                last_month = self.df['Close'].pct_change(20).iloc[-1] * 100
-                st.metric("1 month", f"{last_month:.2f}%")
-
-        with tab2:
-            st.markdown("#### Complete technical analysis")
-            cols = st.columns(2)
-        
-            with cols[0]:
-                st.markdown("##### Key indicators")
-                fig1 = Visualizer(self.df, rows=2, columns=1, row_heights=[0.7, 0.3])
-                fig1.draw_candlestick().Rsi_draw(show_zones=True)
-                fig1.show()
-            
-            with cols[1]:
-                st.markdown("##### Volume and volatility")
-                fig2 = Visualizer(self.df, rows=2, columns=1, row_heights=[0.5, 0.5])
-                fig2.draw_volume().draw_cumulative_returns()
-                fig2.show()
-
-        with tab3:
-            st.markdown("#### Historical data")
-            st.data_editor(
-                self.df.sort_index(ascending=False),
-                column_config={
-                    "Open": st.column_config.NumberColumn(format="$%.2f"),
-                    "High": st.column_config.NumberColumn(format="$%.2f"),
-                    "Low": st.column_config.NumberColumn(format="$%.2f"),
-                    "Close": st.column_config.NumberColumn(format="$%.2f"),
-                    "Volume": st.column_config.NumberColumn(format="%.0f"),
-                    "rsi": st.column_config.NumberColumn(format="%.1f"),
-                    "Volatility": st.column_config.NumberColumn(format="%.2%")
-                },
-                hide_index=False,
-                use_container_width=True,
-                height=600
+        """Create analysis sections, rendering only the selected one (fragment: section widgets rerun only it)"""
+        # st.tabs runs every body on each rerun, a selector lets hidden sections cost nothing
+        sections = list(self.ANALYSIS_SECTIONS)
+        selected = st.segmented_control(
+            "Analysis section",
+            sections,
+            default=sections[0],
+            key="analysis_section",
+            label_visibility="collapsed"
+        )
+        # Clicking the active option deselects it: keep showing the first section
+        getattr(self, self.ANALYSIS_SECTIONS[selected or sections[0]])()
+
+    def _display_main_chart(self):
+        """Display price chart with moving averages and recent trends"""
+        st.markdown("#### Price evolution with moving averages")
+        Visualizer.render(
+            self.df, [("draw_candlestick", {}), ("MA_draw", {"overlay": True})],
+            title=f"Analysis of {self.selected_ticker}"
+        )
+    
+        st.markdown("##### Recent trends")
+        col1, col2 = st.columns(2)
+        with col1:
+            last_5_days = self.df['Close'].pct_change(5).iloc[-1] * 100
+            st.metric("Last 5 days", f"{last_5_days:.2f}%")
+        with col2:
+            last_month = self.df['Close'].pct_change(20).iloc[-1] * 100
+            st.metric("1 month", f"{last_month:.2f}%")
+
+    def _display_technical_analysis(self):
+        """Display technical indicators, volume and returns"""
+        st.markdown("#### Complete technical analysis")
+        cols = st.columns(2)
+    
+        with cols[0]:
+            st.markdown("##### Key indicators")
+            Visualizer.render(
+                self.df, [("draw_candlestick", {}), ("Rsi_draw", {"show_zones": True})],
+                rows=2, row_heights=[0.7, 0.3]
             )
         
-        with tab4:
-            self._display_news_analysis()
-        
-        with tab5:  
-            self._display_geo_influence()
+        with cols[1]:
+            st.markdown("##### Volume and volatility")
+            Visualizer.render(
+                self.df, [("draw_volume", {}), ("draw_cumulative_returns", {})],
+                rows=2, row_heights=[0.5, 0.5]
+            )
+
+    RAW_DATA_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "rsi", "Volatility"]
+
+    def _table_view(self):
+        """TableView of the current data, kept across reruns while the data object is unchanged"""
+        key = (id(self.df), len(self.df), self.selected_ticker)
+        cached = st.session_state.get('raw_data_view')
+        if cached is None or cached[0] != key:
+            cached = (key, TableView(self.df))
+            st.session_state.raw_data_view = cached
+        return cached[1]
+
+    def _display_raw_data(self):
+        """Display historical data one page at a time (sliced on the server)"""
+        st.markdown("#### Historical data")
+        view = self._table_view()
+        dates = pd.DatetimeIndex(self.df.index)
+
+        columns = st.multiselect(
+            "Columns",
+            list(self.df.columns),
+            default=[c for c in self.RAW_DATA_COLUMNS if c in self.df.columns],
+            key="raw_data_columns"
+        )
+
+        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+        with col1:
+            date_range = st.date_input(
+                "Date range",
+                value=(dates.min().date(), dates.max().date()),
+                min_value=dates.min().date(),
+                max_value=dates.max().date(),
+                key=f"raw_data_dates_{self.selected_ticker}"  # Bounds change with the ticker
+            )
+        numeric_columns = list(self.df.select_dtypes("number").columns)
+        with col2:
+            filter_column = st.selectbox("Filter on", ["None"] + numeric_columns, key="raw_data_filter_column")
+        with col3:
+            minimum = st.number_input("Min", value=None, key="raw_data_min", disabled=filter_column == "None")
+        with col4:
+            maximum = st.number_input("Max", value=None, key="raw_data_max", disabled=filter_column == "None")
+
+        # A range being edited has a single date: use it as the start
+        start = date_range[0] if len(date_range) > 0 else None
+        end = date_range[1] if len(date_range) > 1 else None
+        filters = {filter_column: (minimum, maximum)} if filter_column != "None" else None
+        positions = view.query(start=start, end=end, filters=filters)
+
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page_size = st.selectbox("Rows per page", [50, 100, 250, 500], index=1, key="raw_data_page_size")
+        pages = TableView.page_count(positions, page_size)
+        # Fewer pages after a new filter: go back to the last one instead of failing the widget
+        if st.session_state.get("raw_data_page", 1) > pages:
+            st.session_state.raw_data_page = pages
+        with col2:
+            page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, key="raw_data_page")
+
+        st.dataframe(
+            view.page(positions, page=page, page_size=page_size, columns=columns),
+            column_config={
+                "Open": st.column_config.NumberColumn(format="$%.2f"),
+                "High": st.column_config.NumberColumn(format="$%.2f"),
+                "Low": st.column_config.NumberColumn(format="$%.2f"),
+                "Close": st.column_config.NumberColumn(format="$%.2f"),
+                "Volume": st.column_config.NumberColumn(format="%.0f"),
+                "rsi": st.column_config.NumberColumn(format="%.1f"),
+                "Volatility": st.column_config.NumberColumn(format="%.2%")
+            },
+            hide_index=False,
+            use_container_width=True,
+            height=600
+        )
+        st.caption(f"{len(positions):,} of {len(view):,} rows match, newest first")
 
     def _display_geo_influence(self):
-        @st.cache_data(ttl=86400)  # 24h cache
-        def get_cached_geo_data(ticker):
-            fetcher = GeoDataFetcher()
-            return fetcher.get_geo_data(ticker)
-            
         """Display geographical influence map with Plotly"""
         st.subheader("Geographical Influence")
         
+        # Row slice of the shared exposure matrix, no per-rerun rebuild
         fetcher = GeoDataFetcher()
-        geo_data = get_cached_geo_data(self.selected_ticker)
-        df_geo = fetcher.to_dataframe(geo_data)
+        df_geo = fetcher.to_dataframe(fetcher.get_geo_data(self.selected_ticker))
         
         if df_geo.empty:
             st.warning("No geographical data available for this ticker")
             return
         
+        import plotly.express as px
+
         # Create map with Plotly
         fig = px.scatter_geo(
             df_geo,
@@ -439,15 +524,18 @@ class Dashboard:
         """Display news and sentiment analysis"""
         st.subheader("📰 News and Sentiment Analysis")
     
-        news = NewsFetcher().get_company_news(self.selected_ticker)
+        fetcher = NewsFetcher()
+        news = fetcher.get_company_news(self.selected_ticker)
         reddit_data = RedditSentiment().analyze_ticker(self.selected_ticker)
     
         news_scores = [item['score'] for item in news]
         avg_news_score = sum(news_scores) / len(news_scores) if news_scores else 0
     
-        reddit_score = (reddit_data['positive'] - reddit_data['negative']) / reddit_data['total']
-    
-        global_score = (avg_news_score + reddit_score) / 2
+        if reddit_data['total']:
+            reddit_score = (reddit_data['positive'] - reddit_data['negative']) / reddit_data['total']
+            global_score = (avg_news_score + reddit_score) / 2
+        else:
+            global_score = avg_news_score
         
         st.markdown("### Investment Recommendation")
         if global_score > 0.3:
@@ -459,7 +547,18 @@ class Dashboard:
         
         st.metric("Confidence score", f"{global_score:.2f}/1.0")
         
+        sentiment = fetcher.get_sentiment_series(self.selected_ticker)
+        sentiment = sentiment[sentiment.index >= pd.Timestamp(self.df.index.min()).tz_localize(None).normalize()]
+        if not sentiment.empty:
+            st.markdown("### Daily news sentiment")
+            Visualizer.render(
+                self.df, [("draw_candlestick", {}), ("draw_sentiment", {"sentiment": sentiment})],
+                rows=2, row_heights=[0.7, 0.3]
+            )
+
         st.markdown("### Latest news")
+        if not news:
+            st.info("Fetching the latest headlines in the background, they will appear on the next refresh.")
         for item in news:
             sentiment_color = {
                 "positive": "green",
@@ -471,19 +570,22 @@ class Dashboard:
             <div style="border-left: 3px solid {sentiment_color}; padding-left: 10px; margin-bottom: 15px;">
                 <b>{item['title']}</b><br>
                 <i>{item['source']} - {item['date']}</i><br>
-                Sentiment: <span style="color: {sentiment_color}; font-weight: bold">{item['sentiment']}</span>
+                Sentiment: <span style="color: {sentiment_color}; font-weight: bold">{item['sentiment']}</span> ({item['score']:+.2f})
             </div>
             """, unsafe_allow_html=True)
         
         st.markdown("### Social media sentiment")
+        if not reddit_data['total']:
+            st.info("No social posts ingested for this ticker (run `python -m src.reddit_analyzer <dump>`).")
+            return
         st.progress((reddit_data['positive'] / reddit_data['total']))
         st.caption(f"Positive: {reddit_data['positive']} | Neutral: {reddit_data['neutral']} | Negative: {reddit_data['negative']}")
         
-    def _display_market_mood(self):
+    def _display_market_mood(self, df):
         """Display market mood with giant emojis"""
         # Calculate trends
-        last_5_days = self.df['Close'].pct_change(5).iloc[-1] * 100
-        last_month = self.df['Close'].pct_change(20).iloc[-1] * 100
+        last_5_days = df['Close'].pct_change(5).iloc[-1] * 100
+        last_month = df['Close'].pct_change(20).iloc[-1] * 100
         
         # Determine mood
         if last_5_days > 5:
@@ -512,9 +614,9 @@ class Dashboard:
         </div>
         """, unsafe_allow_html=True)
         
-    def _display_risk_reward(self):
+    def _display_risk_reward(self, df):
         """Display risk/reward gauge"""
-        volatility = self.df['Volatility'].iloc[-1] * 100  # Volatility in %
+        volatility = df['Volatility'].iloc[-1] * 100  # Volatility in %
         
         # Determine risk level
         if volatility < 5:
@@ -554,25 +656,35 @@ class Dashboard:
         </div>
         """, unsafe_allow_html=True)
         
+    @st.fragment
     def _add_data_download(self):
-        """Add data download button"""
-        csv_data = self.df.to_csv(index=False).encode('utf-8')
+        """Add data export: bytes are built only after 'Prepare', then cached per data and format (fragment)"""
+        exporter = DataExporter()
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            fmt = st.selectbox("Export format", list(DataExporter.FORMATS), key="export_format",
+                               label_visibility="collapsed")
+        with col2:
+            if st.button("Prepare download", key="export_prepare"):
+                st.session_state.export_request = (self.selected_ticker, fmt)
+
+        if st.session_state.get('export_request') != (self.selected_ticker, fmt):
+            return
         today = datetime.now().strftime("%Y-%m-%d")
         st.download_button(
             label="📥 Download data",
-            data=csv_data,
-            file_name=f'stock_data_{today}.csv',
-            mime='text/csv',
-            key=f"download_btn_{datetime.now().timestamp()}"
+            data=exporter.to_bytes(self.df, fmt),
+            file_name=f'{self.selected_ticker}_{today}.{DataExporter.extension(fmt)}',
+            mime=DataExporter.mime(fmt),
+            key="download_btn",
+            on_click="ignore"  # Downloading does not rerun the app
         )
-    
 
     def display(self):
         """Display dashboard with alert system"""
         container = st.container()
         with container:
             self._create_sidebar_controls()
-            self._create_alert_system()
             
             # Verify if data is loaded
             if not hasattr(self, 'df') or self.df.empty:
@@ -580,15 +692,111 @@ class Dashboard:
                 self._reload_data()
                 return
     
-            if hasattr(self, 'df'):
-                self._check_alerts()
-                self._display_kpis()
-                self._create_analysis_tabs()
-                self._add_data_download()
+            # Independent fragments: a widget inside one only reruns that one
+            with st.sidebar:
+                self._create_alert_system(self.df)
+                live_interval = self._create_live_controls()
+            if live_interval:
+                # Timer-driven fragments: each tick only reruns them
+                st.fragment(self._display_live_panel, run_every=live_interval)()
+                if st.session_state.get('watchlist'):
+                    st.fragment(self._display_watchlist, run_every=live_interval)(tuple(st.session_state.watchlist))
+            self._display_kpis(self.df)
+            self._display_macro_context(self.df, self.selected_ticker)
+            self._create_analysis_tabs()
+            self._add_data_download()
                 
-    def _create_alert_system(self):
-        """Visually improved alert system"""
-        with st.sidebar.expander("🔔 Alert System", expanded=True):
+    LIVE_INTERVALS = {"15 s": 15, "30 s": 30, "1 min": 60, "5 min": 300}
+
+    def _create_live_controls(self):
+        """
+        Live mode switch, refresh interval and watchlist (inside the sidebar)
+
+        Returns:
+            int: Refresh interval in seconds, None when live mode is off
+        """
+        with st.expander("⚡ Live mode", expanded=st.session_state.get('live_mode', False)):
+            live = st.toggle("Auto-refresh", key="live_mode", help="Pull new bars on a timer")
+            interval = st.selectbox("Refresh every", list(self.LIVE_INTERVALS), index=2, key="live_interval")
+            tickers = sorted({t for category in self.asset_categories.values() for t in category})
+            st.multiselect("Watchlist", tickers, key="watchlist", max_selections=10)
+        return self.LIVE_INTERVALS[interval] if live else None
+
+    def _live_feed(self):
+        """Feed of the displayed ticker, started from the dashboard data and kept across reruns"""
+        ticker = st.session_state.get('df_ticker', self.selected_ticker)
+        feed = st.session_state.get('live_feed')
+        # Each refresh publishes feed.df as the dashboard data, any other data means a reload
+        if feed is None or feed.ticker != ticker or st.session_state.get('df') is not feed.df:
+            feed = LiveFeed(ticker, st.session_state.get('df', self.df))
+            st.session_state.live_feed = feed
+        return feed
+
+    def _display_live_panel(self):
+        """Live chart of the displayed ticker: new bars only, appended to the existing figure"""
+        feed = self._live_feed()
+        stats = feed.refresh()
+        st.session_state.df = feed.df  # Full reruns show the updated data
+
+        st.subheader(f"⚡ Live: {feed.ticker}")
+        close = feed.df['Close']
+        st.metric("Last price", f"{close.iloc[-1]:.2f} $",
+                  delta=f"{(close.iloc[-1] / close.iloc[-2] - 1) * 100:.2f}%" if len(close) > 1 else None)
+        st.plotly_chart(feed.chart().fig, use_container_width=True, theme=None, key="live_chart")
+        st.caption(f"{stats['rows']} bar(s) updated at {stats['time']:%H:%M:%S} "
+                   f"(download {stats['fetch_ms']:.0f} ms, update {stats['update_ms']:.0f} ms)")
+        self._check_alerts(feed.df)
+
+    def _display_watchlist(self, tickers):
+        """
+        Watchlist table refreshed incrementally, tickers downloaded in parallel
+
+        Args:
+            tickers (tuple): Watched tickers
+        """
+        feeds = st.session_state.setdefault('watchlist_feeds', {})
+
+        def update(ticker):
+            feed = feeds.get(ticker)
+            if feed is None:
+                return ticker, LiveFeed.start(ticker)
+            feed.refresh()
+            return ticker, feed
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for ticker, feed in executor.map(update, tickers):
+                if feed is not None:
+                    feeds[ticker] = feed
+        for ticker in set(feeds) - set(tickers):
+            del feeds[ticker]
+
+        st.subheader("👀 Watchlist")
+        rows = [feeds[t].summary() for t in tickers if t in feeds]
+        if not rows:
+            st.info("No data available for the watchlist")
+            return
+        st.dataframe(
+            pd.DataFrame(rows).set_index('Ticker'),
+            column_config={
+                "Last": st.column_config.NumberColumn(format="%.2f"),
+                "Change %": st.column_config.NumberColumn(format="%+.2f%%"),
+                "RSI": st.column_config.NumberColumn(format="%.1f"),
+                "Updated": st.column_config.DatetimeColumn(format="HH:mm:ss")
+            },
+            use_container_width=True
+        )
+
+    @st.fragment
+    def _create_alert_system(self, df):
+        """
+        Alert panel (fragment: adding, toggling or deleting an alert only reruns the panel)
+
+        Must be called inside a `with st.sidebar:` block, fragments cannot use st.sidebar.
+
+        Args:
+            df (pd.DataFrame): Analyzed price data the alerts are checked against
+        """
+        with st.expander("🔔 Alert System", expanded=True):
             if 'alerts' not in st.session_state:
                 st.session_state.alerts = []
         
@@ -628,8 +836,10 @@ class Dashboard:
                         'threshold': threshold,
                         'color': color,
                         'active': True,
-                        'triggered': False
+                        'triggered': False,
+                        'id': st.session_state.get('alert_next_id', 0)
                     }
+                    st.session_state.alert_next_id = new_alert['id'] + 1
                     st.session_state.alerts.append(new_alert)
                     st.success("Alert saved!")
         
@@ -638,13 +848,15 @@ class Dashboard:
                 st.markdown("**My active alerts**")
             
                 for i, alert in enumerate(st.session_state.alerts[:5]):
+                    # Keys follow the alert, not its position, so deleting one keeps the others' state
+                    alert_key = alert.get('id', f"pos{i}")
                     with st.container(border=True):
                         cols = st.columns([1, 3, 1])
                         with cols[0]:
                             st.checkbox(
                                 "Active",
                                 value=alert['active'],
-                                key=f"alert_active_{i}",
+                                key=f"alert_active_{alert_key}",
                                 on_change=lambda i=i: self._toggle_alert(i),
                                 label_visibility="collapsed"
                             )
@@ -655,10 +867,14 @@ class Dashboard:
                         with cols[2]:
                             st.button(
                                 "🗑️", 
-                                key=f"delete_{i}",
+                                key=f"delete_{alert_key}",
                                 on_click=lambda i=i: self._remove_alert(i),
                                 use_container_width=True
                             )
+
+        # In live mode the live panel checks each new bar, checking here too would toast twice
+        if not st.session_state.get('live_mode'):
+            self._check_alerts(df)
                             
     def _toggle_alert(self, index):
         """Enable/disable an alert"""
@@ -666,12 +882,18 @@ class Dashboard:
 
     def _remove_alert(self, index):
         """Remove an alert"""
+        # The fragment reruns after its callbacks, no st.rerun() needed
         st.session_state.alerts.pop(index)
-        st.rerun()
 
-    def _check_alerts(self):
-        """Check if alert conditions are met"""
-        if not hasattr(self, 'df') or 'alerts' not in st.session_state:
+    def _check_alerts(self, df=None):
+        """
+        Check if alert conditions are met
+
+        Args:
+            df (pd.DataFrame): Data to check (default: dashboard data)
+        """
+        df = self.df if df is None else df
+        if df is None or 'alerts' not in st.session_state:
             return
     
         for i, alert in enumerate(st.session_state.alerts):
@@ -683,11 +905,11 @@ class Dashboard:
                 message = ""
             
                 if alert['indicator'] == "RSI":
-                    current_value = self.df['rsi'].iloc[-1]
+                    current_value = df['rsi'].iloc[-1]
                 elif alert['indicator'] == "Closing Price":
-                    current_value = self.df['Close'].iloc[-1]
+                    current_value = df['Close'].iloc[-1]
                 elif alert['indicator'] == "Volatility":
-                    current_value = self.df['Volatility'].iloc[-1] * 100
+                    current_value = df['Volatility'].iloc[-1] * 100
             
                 if current_value is not None:
                     if alert['condition'] == "Above" and current_value > alert['threshold']:
@@ -697,12 +919,12 @@ class Dashboard:
                 
                     elif alert['indicator'] == "MA Crossover":
                         if alert['condition'] == "Crosses above" and \
-                            self.df['MA_50'].iloc[-1] > self.df['MA_200'].iloc[-1] and \
-                            self.df['MA_50'].iloc[-2] <= self.df['MA_200'].iloc[-2]:
+                            df['MA_50'].iloc[-1] > df['MA_200'].iloc[-1] and \
+                            df['MA_50'].iloc[-2] <= df['MA_200'].iloc[-2]:
                             message = "🚨 Bullish crossover (MA50 > MA200)"
                         elif alert['condition'] == "Crosses below" and \
-                            self.df['MA_50'].iloc[-1] < self.df['MA_200'].iloc[-1] and \
-                            self.df['MA_50'].iloc[-2] >= self.df['MA_200'].iloc[-2]:
+                            df['MA_50'].iloc[-1] < df['MA_200'].iloc[-1] and \
+                            df['MA_50'].iloc[-2] >= df['MA_200'].iloc[-2]:
                             message = "🚨 Bearish crossover (MA50 < MA200)"
             
                     if message and not alert['triggered']:
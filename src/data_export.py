@@ -0,0 +1,180 @@
+import io
+import os
+import tempfile
+import time
+import zipfile
+
+import pandas as pd
+
+# Import local modules
+from src.cache_utils import data_fingerprint
+from src.runtime import Runtime
+
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), 'bourse_dashboard', 'exports')
+
+# Export bytes of single DataFrames: (fingerprint, format) -> bytes
+_EXPORT_CACHE = Runtime.cache("exports", maxsize=16)
+
+class DataExporter:
+    """Class to export price data as CSV, Parquet or Arrow IPC"""
+
+    FORMATS = {
+        "CSV": ("csv", "text/csv"),
+        "Parquet": ("parquet", "application/vnd.apache.parquet"),
+        "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file")
+    }
+
+    ZIP_MAX_AGE = 86400  # Exported zips older than a day are removed
+
+    def __init__(self, export_dir=EXPORT_DIR):
+        """
+        Initialize exporter.
+
+        Args:
+            export_dir (str): Directory of multi-ticker zip files (default: temporary directory)
+        """
+        self.export_dir = export_dir
+
+    @classmethod
+    def extension(cls, fmt):
+        """File extension of a format"""
+        return cls.FORMATS[fmt][0]
+
+    @classmethod
+    def mime(cls, fmt):
+        """MIME type of a format"""
+        return cls.FORMATS[fmt][1]
+
+    @staticmethod
+    def _with_date_column(df):
+        """Frame with its index as a named column, so dates survive every format"""
+        df = df.reset_index()
+        return df.rename(columns={df.columns[0]: 'Date'}) if df.columns[0] == 'index' else df
+
+    def write(self, df, fmt, target):
+        """
+        Write a DataFrame to a binary file object
+
+        Args:
+            df (pd.DataFrame): Data (index exported as a column)
+            fmt (str): Key of FORMATS
+            target: Writable binary file object
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        df = self._with_date_column(df)
+
+        if fmt == "CSV":
+            text = io.TextIOWrapper(target, encoding='utf-8', newline='')
+            df.to_csv(text, index=False)
+            text.flush()
+            text.detach()  # Leave the target open for the caller
+        elif fmt == "Parquet":
+            df.to_parquet(target, index=False)
+        else:
+            import pyarrow as pa  # Installed with pandas' Parquet support and Streamlit
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with pa.ipc.new_file(target, table.schema) as writer:
+                writer.write_table(table)
+
+    def to_bytes(self, df, fmt):
+        """
+        Export bytes of a DataFrame, cached per data fingerprint and format
+
+        Args:
+            df (pd.DataFrame): Data
+            fmt (str): Key of FORMATS
+
+        Returns:
+            bytes: File content
+        """
+        key = (data_fingerprint(df), fmt)
+        data = _EXPORT_CACHE.get(key)
+        if data is None:
+            buffer = io.BytesIO()
+            self.write(df, fmt, buffer)
+            data = buffer.getvalue()
+            _EXPORT_CACHE.set(key, data)
+        return data
+
+    def write_zip(self, frames, fmt):
+        """
+        Write several DataFrames into a zip file on disk, one member at a time
+
+        Each member is streamed into the archive, so only one frame's export
+        is ever being produced. The file name is derived from the data
+        fingerprint, and an existing file is reused.
+
+        Args:
+            frames (dict): {name: DataFrame} dictionary
+            fmt (str): Key of FORMATS
+
+        Returns:
+            str: Path of the zip file
+        """
+        os.makedirs(self.export_dir, exist_ok=True)
+        self._remove_old_zips()
+        path = os.path.join(self.export_dir, f"{data_fingerprint((frames, fmt))}.zip")
+        if os.path.exists(path):
+            return path
+
+        extension = self.extension(fmt)
+        fd, tmp_path = tempfile.mkstemp(dir=self.export_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, zipfile.ZipFile(raw, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                for name, df in frames.items():
+                    with archive.open(f"{name}.{extension}", 'w', force_zip64=True) as member:
+                        self.write(df, fmt, member)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def _remove_old_zips(self):
+        cutoff = time.time() - self.ZIP_MAX_AGE
+        for entry in os.scandir(self.export_dir):
+            try:
+                if entry.name.endswith('.zip') and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass  # Removed concurrently
+
+    @classmethod
+    def test_exporter(cls):
+        """
+        Round-trip every format, single frame and zip
+
+        Example:
+        >>> result = DataExporter.test_exporter()
+        >>> print(result)
+        """
+        import numpy as np
+
+        index = pd.date_range("2024-01-01", periods=5, name="Date")
+        df = pd.DataFrame({"Close": np.arange(5.0), "Volume": np.arange(5) * 10}, index=index)
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = cls(export_dir=tmp)
+            sizes = {}
+            for fmt in cls.FORMATS:
+                data = exporter.to_bytes(df, fmt)
+                assert exporter.to_bytes(df, fmt) is data, "Export bytes not cached"
+                if fmt == "CSV":
+                    back = pd.read_csv(io.BytesIO(data), parse_dates=["Date"])
+                elif fmt == "Parquet":
+                    back = pd.read_parquet(io.BytesIO(data))
+                else:
+                    import pyarrow as pa
+                    back = pa.ipc.open_file(io.BytesIO(data)).read_pandas()
+                assert back["Date"].tolist() == index.tolist(), f"{fmt} lost the dates"
+                sizes[fmt] = len(data)
+
+            path = exporter.write_zip({"AAA": df, "BBB": df * 2}, "Parquet")
+            assert exporter.write_zip({"AAA": df, "BBB": df * 2}, "Parquet") == path, "Zip not reused"
+            with zipfile.ZipFile(path) as archive:
+                members = archive.namelist()
+                back = pd.read_parquet(io.BytesIO(archive.read("BBB.parquet")))
+            assert members == ["AAA.parquet", "BBB.parquet"], f"Unexpected members: {members}"
+            assert back["Close"].tolist() == (df["Close"] * 2).tolist(), "Zip member content differs"
+        return sizes
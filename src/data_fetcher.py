@@ -1,9 +1,11 @@
-import yfinance as yf
 import pandas as pd
 from datetime import datetime
 
 class DataFetcher:
     """Fetch and preprocess stock market data"""
+
+    # Bond ETFs are downloaded from their .BO listing
+    BOND_ETFS = ["TLT", "IEF", "LQD", "HYG", "BND", "GOVT", "VGIT", "VGLT"]
     
     def __init__(self, ticker="TSLA"):
         """
@@ -41,11 +43,10 @@ class DataFetcher:
             if isinstance(end, (pd.Timestamp, datetime)):
                 end = end.strftime("%Y-%m-%d")
         
-        # Special treatment for bond ETFs
-        bond_etfs = ["TLT", "IEF", "LQD", "HYG", "BND", "GOVT", "VGIT", "VGLT"]
-        
+        import yfinance as yf
+
         try:
-            if self.ticker in bond_etfs:
+            if self.ticker in self.BOND_ETFS:
                 bond_ticker = self.ticker + ".BO" if not self.ticker.endswith(".BO") else self.ticker
                 # Priority to specific dates
                 if start and end:
@@ -89,6 +90,48 @@ class DataFetcher:
             print(f"❌ Critical error with {self.ticker}: {str(e)}")
             return pd.DataFrame()
 
+    def fetch_new_bars(self, since, interval="1d", timeout=10):
+        """
+        Fetch only the bars from a known bar onwards (live refresh)
+
+        The download starts on the day of `since`, so its size depends on the
+        number of new bars, not on the history already held. The bar at `since`
+        is returned again: it may still have been forming when it was fetched.
+
+        Args:
+            since (pd.Timestamp): Date of the last bar already held
+            interval (str): Data interval (default: "1d")
+            timeout (int): Request timeout in seconds (default: 10)
+
+        Returns:
+            pd.DataFrame: Cleaned bars at or after `since`, empty on error
+        """
+        import yfinance as yf
+
+        since = pd.Timestamp(since)
+        symbol = self.ticker
+        if symbol in self.BOND_ETFS and not symbol.endswith(".BO"):
+            symbol += ".BO"
+        try:
+            data = yf.Ticker(symbol).history(
+                start=since.strftime("%Y-%m-%d"),
+                interval=interval,
+                timeout=timeout
+            )
+            bars = self._clean_data(data)
+        except Exception as e:
+            print(f"❌ Live update error with {self.ticker}: {str(e)}")
+            return pd.DataFrame()
+
+        if bars.empty:
+            return bars
+        # Compare in the bars' timezone
+        if bars.index.tz is not None and since.tz is None:
+            since = since.tz_localize(bars.index.tz)
+        elif bars.index.tz is None and since.tz is not None:
+            since = since.tz_localize(None)
+        return bars[bars.index >= since]
+
     def real_time_data(self):
         """
         Fetch most recent real-time data (1-minute interval)
@@ -96,6 +139,8 @@ class DataFetcher:
         Returns:
             pd.DataFrame: Latest price data (1 row) or empty DataFrame
         """
+        import yfinance as yf
+
         try:
             raw_data = yf.Ticker(self.ticker).history(
                 period="1d",
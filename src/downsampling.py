@@ -0,0 +1,81 @@
+import numpy as np
+
+def bucket_starts(length, buckets):
+    """
+    First row of each of `buckets` contiguous, near-equal buckets
+
+    Args:
+        length (int): Number of rows
+        buckets (int): Number of buckets (at most length)
+
+    Returns:
+        np.ndarray: Strictly increasing start positions, first is 0
+    """
+    return np.linspace(0, length, buckets + 1).astype(np.int64)[:-1]
+
+def lttb_indices(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets selection of a line's points
+
+    Keeps the first and last points, and in each bucket the point forming the
+    largest triangle with the previously kept point and the next bucket's mean,
+    which keeps the visual shape (spikes included) of the line. Non-finite y
+    values are ignored.
+
+    Args:
+        x (array-like): Numeric x values (sorted)
+        y (array-like): y values
+        threshold (int): Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted positions of kept points
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.flatnonzero(np.isfinite(y))
+    if threshold >= len(finite) or threshold < 3:
+        return finite
+    x, y = x[finite], y[finite]
+    n = len(finite)
+
+    # threshold - 2 buckets over the inner points, the last bucket's "next" is the final point
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end, next_end = edges[i], edges[i + 1], edges[i + 2]
+        cx = x[end:next_end].mean()
+        cy = y[end:next_end].mean()
+        area = np.abs((x[a] - cx) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (cy - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return finite[selected]
+
+def ohlc_buckets(open_, high, low, close, buckets):
+    """
+    Aggregate candles into buckets: first open, highest high, lowest low, last close
+
+    Args:
+        open_, high, low, close (array-like): Candle columns
+        buckets (int): Number of buckets
+
+    Returns:
+        tuple: (bucket start positions, open, high, low, close arrays)
+    """
+    starts = bucket_starts(len(close), buckets)
+    ends = np.append(starts[1:], len(close)) - 1
+    high = np.fmax.reduceat(np.asarray(high, dtype=float), starts)
+    low = np.fmin.reduceat(np.asarray(low, dtype=float), starts)
+    return starts, np.asarray(open_, dtype=float)[starts], high, low, np.asarray(close, dtype=float)[ends]
+
+def sum_buckets(values, buckets):
+    """
+    Sum values into buckets (missing values count as 0)
+
+    Returns:
+        tuple: (bucket start positions, sums)
+    """
+    starts = bucket_starts(len(values), buckets)
+    return starts, np.add.reduceat(np.nan_to_num(np.asarray(values, dtype=float)), starts)
@@ -1,348 +1,486 @@
+import numpy as np
 import pandas as pd
-import random
+from functools import lru_cache
+from types import MappingProxyType
+
+# Geographical reference data, built once at import and shared read-only by every caller
+
+# Database of countries and their coordinates
+_COUNTRY_DATA = {
+    "USA": {"lat": 37.0902, "lon": -95.7129, "color": "#FF0000"},
+    "China": {"lat": 35.8617, "lon": 104.1954, "color": "#0000FF"},
+    "Japan": {"lat": 36.2048, "lon": 138.2529, "color": "#00FF00"},
+    "Germany": {"lat": 51.1657, "lon": 10.4515, "color": "#FFFF00"},
+    "UK": {"lat": 55.3781, "lon": -3.4360, "color": "#00FFFF"},
+    "India": {"lat": 20.5937, "lon": 78.9629, "color": "#FF00FF"},
+    "France": {"lat": 46.2276, "lon": 2.2137, "color": "#800080"},
+    "Canada": {"lat": 56.1304, "lon": -106.3468, "color": "#FFA500"},
+    "Australia": {"lat": -25.2744, "lon": 133.7751, "color": "#008000"},
+    "Brazil": {"lat": -14.2350, "lon": -51.9253, "color": "#008080"},
+    "Ireland": {"lat": 53.4129, "lon": -8.2439, "color": "#169B62"},
+}
+
+COUNTRY_DATA = MappingProxyType({
+    country: MappingProxyType(info) for country, info in _COUNTRY_DATA.items()
+})
+
+# Database of companies with their country of origin
+COMPANY_ORIGINS = MappingProxyType({
+    "AAPL": "USA",
+    "MSFT": "USA",
+    "GOOGL": "USA",
+    "META": "USA",
+    "NVDA": "USA",
+    "TSLA": "USA",
+    "ADBE": "USA",
+    "INTC": "USA",
+    "CSCO": "USA",
+    "ORCL": "USA",
+    "IBM": "USA",
+    "QCOM": "USA",
+    "TXN": "USA",
+    "AVGO": "USA",
+    "AMD": "USA",
+    "CRM": "USA",
+    "ADP": "USA",
+    "INTU": "USA",
+    "NOW": "USA",
+    "AMAT": "USA",
+    "MU": "USA",
+    "ADI": "USA",
+    "LRCX": "USA",
+    "KLAC": "USA",
+    "CDNS": "USA",
+    "SNPS": "USA",
+    "ANET": "USA",
+    "FTNT": "USA",
+    "NXPI": "USA",
+    "MRVL": "USA",
+    "PANW": "USA",
+    "PYPL": "USA",
+    "SQ": "USA",
+    "SHOP": "Canada",
+    "ZM": "USA",
+    "TEAM": "USA",
+    "OKTA": "USA",
+    "CRWD": "USA",
+    "ZS": "USA",
+    "NET": "USA",
+    "NEE": "USA",
+    "DUK": "USA",
+    "SO": "USA",
+    "D": "USA",
+    "EXC": "USA",
+    "AEP": "USA",
+    "PEG": "USA",
+    "ED": "USA",
+    "EIX": "USA",
+    "ES": "USA",
+    "FE": "USA",
+    "PPL": "USA",
+    "WEC": "USA",
+    "XEL": "USA",
+    "AEE": "USA",
+    "ETR": "USA",
+    "CMS": "USA",
+    "AWK": "USA",
+    "ATO": "USA",
+    "SRE": "USA",
+    "CNP": "USA",
+    "PCG": "USA",
+    "NI": "USA",
+    "DTE": "USA",
+    "LNT": "USA",
+    "EVRG": "USA",
+    "AGR": "USA",
+    "BEP": "Canada",
+    "BIPC": "Canada",
+    "JNJ": "USA",
+    "PFE": "USA",
+    "UNH": "USA",
+    "MRK": "USA",
+    "ABT": "USA",
+    "TMO": "USA",
+    "BMY": "USA",
+    "AMGN": "USA",
+    "GILD": "USA",
+    "CVS": "USA",
+    "LLY": "USA",
+    "ABBV": "USA",
+    "MDT": "USA",
+    "VRTX": "USA",
+    "REGN": "USA",
+    "DHR": "USA",
+    "SYK": "USA",
+    "BDX": "USA",
+    "ISRG": "USA",
+    "ZTS": "USA",
+    "HCA": "USA",
+    "CI": "USA",
+    "ANTM": "USA",
+    "HUM": "USA",
+    "IQV": "USA",
+    "EW": "USA",
+    "IDXX": "USA",
+    "ALGN": "USA",
+    "MRNA": "USA",
+    "BNTX": "Germany",
+    "VTRS": "USA",
+    "BAX": "USA",
+    "BIIB": "USA",
+    "ILMN": "USA",
+    "DGX": "USA",
+    "LH": "USA",
+    "UHS": "USA",
+    "HOLX": "USA",
+    "DXCM": "USA",
+    "STE": "USA",
+    "PG": "USA",
+    "KO": "USA",
+    "PEP": "USA",
+    "WMT": "USA",
+    "COST": "USA",
+    "MO": "USA",
+    "PM": "USA",
+    "MDLZ": "USA",
+    "CL": "USA",
+    "KHC": "USA",
+    "EL": "USA",
+    "KMB": "USA",
+    "STZ": "USA",
+    "CLX": "USA",
+    "SJM": "USA",
+    "CHD": "USA",
+    "CAG": "USA",
+    "HSY": "USA",
+    "GIS": "USA",
+    "ADM": "USA",
+    "TSN": "USA",
+    "MKC": "USA",
+    "CPB": "USA",
+    "LW": "USA",
+    "TAP": "USA",
+    "BF-B": "USA",
+    "MNST": "USA",
+    "FLO": "USA",
+    "SYY": "USA",
+    "KR": "USA",
+    "K": "USA",
+    "COTY": "USA",
+    "TGT": "USA",
+    "HD": "USA",
+    "LOW": "USA",
+    "DG": "USA",
+    "DLTR": "USA",
+    "FIVE": "USA",
+    "BURL": "USA",
+    "ROST": "USA",
+    "TJX": "USA",
+    "JPM": "USA",
+    "BAC": "USA",
+    "V": "USA",
+    "MA": "USA",
+    "WFC": "USA",
+    "C": "USA",
+    "GS": "USA",
+    "AXP": "USA",
+    "MS": "USA",
+    "BLK": "USA",
+    "SCHW": "USA",
+    "COF": "USA",
+    "USB": "USA",
+    "PNC": "USA",
+    "TFC": "USA",
+    "TD": "Canada",
+    "CME": "USA",
+    "ICE": "USA",
+    "AON": "UK",
+    "MMC": "USA",
+    "AJG": "USA",
+    "SPGI": "USA",
+    "MCO": "USA",
+    "FIS": "USA",
+    "FISV": "USA",
+    "NDAQ": "USA",
+    "CBOE": "USA",
+    "MKTX": "USA",
+    "RJF": "USA",
+    "RY": "Canada",
+    "BNS": "Canada",
+    "BMO": "Canada",
+    "ALLY": "USA",
+    "KEY": "USA",
+    "CFG": "USA",
+    "HBAN": "USA",
+    "MTB": "USA",
+    "RF": "USA",
+    "ZION": "USA",
+    "GE": "USA",
+    "HON": "USA",
+    "MMM": "USA",
+    "BA": "USA",
+    "CAT": "USA",
+    "UNP": "USA",
+    "DE": "USA",
+    "RTX": "USA",
+    "LMT": "USA",
+    "GD": "USA",
+    "NOC": "USA",
+    "ITW": "USA",
+    "EMR": "USA",
+    "ETN": "USA",
+    "WM": "USA",
+    "RSG": "USA",
+    "FDX": "USA",
+    "UPS": "USA",
+    "CSX": "USA",
+    "NSC": "USA",
+    "CP": "Canada",
+    "CNI": "Canada",
+    "DAL": "USA",
+    "UAL": "USA",
+    "LUV": "USA",
+    "AAL": "USA",
+    "DOV": "USA",
+    "FTV": "USA",
+    "IR": "USA",
+    "OTIS": "USA",
+    "TT": "USA",
+    "PH": "USA",
+    "ROK": "USA",
+    "SWK": "USA",
+    "AME": "USA",
+    "GNRC": "USA",
+    "JCI": "Ireland",
+    "PWR": "USA",
+    "WAB": "USA",
+    "XYL": "USA",
+    "WSO": "USA",
+    "FAST": "USA",
+    "O": "USA",
+    "AMT": "USA",
+    "PLD": "USA",
+    "CCI": "USA",
+    "EQIX": "USA",
+    "DLR": "USA",
+    "PSA": "USA",
+    "SPG": "USA",
+    "AVB": "USA",
+    "EQR": "USA",
+    "VTR": "USA",
+    "WELL": "USA",
+    "WY": "USA",
+    "EXR": "USA",
+    "MAA": "USA",
+    "ESS": "USA",
+    "UDR": "USA",
+    "SBAC": "USA",
+    "IRM": "USA",
+    "ARE": "USA",
+    "REG": "USA",
+    "KIM": "USA",
+    "FRT": "USA",
+    "VICI": "USA",
+    "STOR": "USA",
+    "NSA": "USA",
+    "LAMR": "USA",
+    "GLPI": "USA",
+    "CPT": "USA",
+    "ACC": "USA",
+    "XOM": "USA",
+    "CVX": "USA",
+    "SHEL": "UK",
+    "TTE": "France",
+    "COP": "USA",
+    "EOG": "USA",
+    "PXD": "USA",
+    "MPC": "USA",
+    "PSX": "USA",
+    "VLO": "USA",
+    "OXY": "USA",
+    "HES": "USA",
+    "DVN": "USA",
+    "FANG": "USA",
+    "CTRA": "USA",
+    "EQT": "USA",
+    "MRO": "USA",
+    "HAL": "USA",
+    "SLB": "USA",
+    "BKR": "USA",
+    "NOV": "USA",
+    "FTI": "UK",
+    "LNG": "USA",
+    "ET": "USA",
+    "EPD": "USA",
+    "WMB": "USA",
+    "OKE": "USA",
+    "KMI": "USA",
+    "TRP": "Canada",
+    "ENB": "Canada",
+    "DIS": "USA",
+    "NFLX": "USA",
+    "CMCSA": "USA",
+    "T": "USA",
+    "VZ": "USA",
+    "TMUS": "USA",
+    "CHTR": "USA",
+    "EA": "USA",
+    "TTWO": "USA",
+    "ATVI": "USA",
+    "ROKU": "USA",
+    "LYV": "USA",
+    "NWSA": "USA",
+    "FOXA": "USA",
+    "IPG": "USA",
+    "OMC": "USA",
+    "WPP": "UK",
+    "DISH": "USA",
+    "SIRI": "USA",
+    "LGF-A": "USA",
+    "IAC": "USA",
+    "MTCH": "USA",
+    "BIDU": "China",
+    "JD": "China",
+    "BABA": "China",
+    "TME": "China",
+    "YY": "China",
+    "DOYU": "China",
+    "HUYA": "China",
+    "IQ": "China",
+})
+
+# Relevant economic partners by country
+ECONOMIC_PARTNERS = MappingProxyType({
+    "USA": ("Canada", "China", "Germany", "UK", "Japan"),
+    "China": ("USA", "Japan", "Germany", "Australia", "India"),
+    "Japan": ("USA", "China", "Australia", "Germany", "India"),
+    "Germany": ("USA", "UK", "France", "China", "Japan"),
+    "UK": ("USA", "Germany", "France", "China", "Australia"),
+    "France": ("Germany", "UK", "USA", "China", "Australia"),
+    "Canada": ("USA", "UK", "China", "Germany", "Japan"),
+    "Australia": ("China", "Japan", "USA", "UK", "India"),
+    "India": ("USA", "China", "Japan", "Germany", "Australia"),
+    "Brazil": ("USA", "China", "Germany", "UK", "Argentina"),
+})
+
+DEFAULT_ORIGIN = "USA"
+DEFAULT_PARTNERS = ("USA", "China", "Germany")
+ORIGIN_WEIGHT = 0.85  # Weight of the country of origin
+MAX_COUNTRIES = 5
+
+def exposure_profile(origin_country):
+    """
+    Country exposure of a company from its country of origin.
+
+    Args:
+        origin_country (str): Country of origin
+
+    Returns:
+        list: (country, weight) tuples, origin country first
+    """
+    # First 3 partners
+    partners = ECONOMIC_PARTNERS.get(origin_country, DEFAULT_PARTNERS)[:3]
+    secondary_countries = partners[:MAX_COUNTRIES - 1]
+
+    # Distribute remaining 15% among secondary countries
+    weight_per_country = (1 - ORIGIN_WEIGHT) / len(secondary_countries)
+    return [(origin_country, ORIGIN_WEIGHT)] + [(country, weight_per_country) for country in secondary_countries]
+
+class GeoExposureMatrix:
+    """Precomputed ticker x country exposure matrix (CSR sparse storage)"""
+
+    def __init__(self, tickers=()):
+        """
+        Build the matrix for known tickers.
+
+        Args:
+            tickers (iterable): Extra tickers to include besides COMPANY_ORIGINS
+        """
+        self.countries = tuple(COUNTRY_DATA)
+        self.tickers = tuple(dict.fromkeys(list(COMPANY_ORIGINS) + list(tickers)))
+        self._ticker_rows = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._country_columns = {country: j for j, country in enumerate(self.countries)}
+
+        # Last row holds the default profile used for unknown tickers
+        origins = [COMPANY_ORIGINS.get(ticker, DEFAULT_ORIGIN) for ticker in self.tickers] + [DEFAULT_ORIGIN]
+        self._default_row = len(self.tickers)
+
+        indptr = [0]
+        indices = []
+        data = []
+        for origin in origins:
+            for country, weight in exposure_profile(origin):
+                # Countries without coordinates cannot be mapped
+                if country not in self._country_columns:
+                    continue
+                indices.append(self._country_columns[country])
+                data.append(weight)
+            indptr.append(len(indices))
+
+        self.indptr = np.array(indptr)
+        self.indices = np.array(indices)
+        self.data = np.array(data)
+        for array in (self.indptr, self.indices, self.data):
+            array.flags.writeable = False
+
+    @property
+    def shape(self):
+        """(number of tickers, number of countries)"""
+        return len(self.tickers), len(self.countries)
+
+    def row(self, ticker):
+        """
+        Sparse exposure row of a ticker.
+
+        Unknown tickers get the profile of the default origin country.
+
+        Args:
+            ticker (str): Stock ticker symbol
+
+        Returns:
+            tuple: (country column indices, weights)
+        """
+        i = self._ticker_rows.get(ticker, self._default_row)
+        return self.indices[self.indptr[i]:self.indptr[i + 1]], self.data[self.indptr[i]:self.indptr[i + 1]]
+
+    def combined(self, tickers_weights):
+        """
+        Combined country exposure of a portfolio (sparse transposed matrix-vector product).
+
+        Args:
+            tickers_weights (dict): {ticker: weight} dictionary
+
+        Returns:
+            np.ndarray: Weight per country, aligned with self.countries
+        """
+        if not tickers_weights:
+            return np.zeros(len(self.countries))
+
+        rows = np.array([self._ticker_rows.get(ticker, self._default_row) for ticker in tickers_weights])
+        weights = np.array(list(tickers_weights.values()), dtype=float)
+        starts, ends = self.indptr[rows], self.indptr[rows + 1]
+        lengths = ends - starts
+        # Positions of every nonzero of the selected rows, in row order
+        nonzero = np.repeat(ends - lengths.cumsum(), lengths) + np.arange(lengths.sum())
+        return np.bincount(
+            self.indices[nonzero],
+            weights=self.data[nonzero] * np.repeat(weights, lengths),
+            minlength=len(self.countries)
+        )
+
+@lru_cache(maxsize=1)
+def get_exposure_matrix():
+    """Return the shared exposure matrix (built on first use)"""
+    from src.asset_categories import AssetCategories
+    return GeoExposureMatrix(AssetCategories.get_all_tickers())
 
 class GeoDataFetcher:
     """Class to manage geographical data for companies"""
     
     def __init__(self):
-        # Database of countries and their coordinates
-        self.country_data = {
-            "USA": {"lat": 37.0902, "lon": -95.7129, "color": "#FF0000"},
-            "China": {"lat": 35.8617, "lon": 104.1954, "color": "#0000FF"},
-            "Japan": {"lat": 36.2048, "lon": 138.2529, "color": "#00FF00"},
-            "Germany": {"lat": 51.1657, "lon": 10.4515, "color": "#FFFF00"},
-            "UK": {"lat": 55.3781, "lon": -3.4360, "color": "#00FFFF"},
-            "India": {"lat": 20.5937, "lon": 78.9629, "color": "#FF00FF"},
-            "France": {"lat": 46.2276, "lon": 2.2137, "color": "#800080"},
-            "Canada": {"lat": 56.1304, "lon": -106.3468, "color": "#FFA500"},
-            "Australia": {"lat": -25.2744, "lon": 133.7751, "color": "#008000"},
-            "Brazil": {"lat": -14.2350, "lon": -51.9253, "color": "#008080"},
-        }
-        
-        # Database of companies with their country of origin
-        self.company_origins = {
-            "AAPL": "USA",
-            "MSFT": "USA",
-            "GOOGL": "USA",
-            "META": "USA",
-            "NVDA": "USA",
-            "TSLA": "USA",
-            "ADBE": "USA",
-            "INTC": "USA",
-            "CSCO": "USA",
-            "ORCL": "USA",
-            "IBM": "USA",
-            "QCOM": "USA",
-            "TXN": "USA",
-            "AVGO": "USA",
-            "AMD": "USA",
-            "CRM": "USA",
-            "ADP": "USA",
-            "INTU": "USA",
-            "NOW": "USA",
-            "AMAT": "USA",
-            "MU": "USA",
-            "ADI": "USA",
-            "LRCX": "USA",
-            "KLAC": "USA",
-            "CDNS": "USA",
-            "SNPS": "USA",
-            "ANET": "USA",
-            "FTNT": "USA",
-            "NXPI": "USA",
-            "MRVL": "USA",
-            "PANW": "USA",
-            "PYPL": "USA",
-            "SQ": "USA",
-            "SHOP": "Canada",
-            "ZM": "USA",
-            "TEAM": "USA",
-            "OKTA": "USA",
-            "CRWD": "USA",
-            "ZS": "USA",
-            "NET": "USA",
-            "NEE": "USA",
-            "DUK": "USA",
-            "SO": "USA",
-            "D": "USA",
-            "EXC": "USA",
-            "AEP": "USA",
-            "PEG": "USA",
-            "ED": "USA",
-            "EIX": "USA",
-            "ES": "USA",
-            "FE": "USA",
-            "PPL": "USA",
-            "WEC": "USA",
-            "XEL": "USA",
-            "AEE": "USA",
-            "ETR": "USA",
-            "CMS": "USA",
-            "AWK": "USA",
-            "ATO": "USA",
-            "SRE": "USA",
-            "CNP": "USA",
-            "PCG": "USA",
-            "NI": "USA",
-            "DTE": "USA",
-            "LNT": "USA",
-            "EVRG": "USA",
-            "AGR": "USA",
-            "BEP": "Canada",
-            "BIPC": "Canada",
-            "JNJ": "USA",
-            "PFE": "USA",
-            "UNH": "USA",
-            "MRK": "USA",
-            "ABT": "USA",
-            "TMO": "USA",
-            "BMY": "USA",
-            "AMGN": "USA",
-            "GILD": "USA",
-            "CVS": "USA",
-            "LLY": "USA",
-            "ABBV": "USA",
-            "MDT": "USA",
-            "VRTX": "USA",
-            "REGN": "USA",
-            "DHR": "USA",
-            "SYK": "USA",
-            "BDX": "USA",
-            "ISRG": "USA",
-            "ZTS": "USA",
-            "HCA": "USA",
-            "CI": "USA",
-            "ANTM": "USA",
-            "HUM": "USA",
-            "IQV": "USA",
-            "EW": "USA",
-            "IDXX": "USA",
-            "ALGN": "USA",
-            "MRNA": "USA",
-            "BNTX": "Germany",
-            "VTRS": "USA",
-            "BAX": "USA",
-            "BIIB": "USA",
-            "ILMN": "USA",
-            "DGX": "USA",
-            "LH": "USA",
-            "UHS": "USA",
-            "HOLX": "USA",
-            "DXCM": "USA",
-            "STE": "USA",
-            "PG": "USA",
-            "KO": "USA",
-            "PEP": "USA",
-            "WMT": "USA",
-            "COST": "USA",
-            "MO": "USA",
-            "PM": "USA",
-            "MDLZ": "USA",
-            "CL": "USA",
-            "KHC": "USA",
-            "EL": "USA",
-            "KMB": "USA",
-            "STZ": "USA",
-            "CLX": "USA",
-            "SJM": "USA",
-            "CHD": "USA",
-            "CAG": "USA",
-            "HSY": "USA",
-            "GIS": "USA",
-            "ADM": "USA",
-            "TSN": "USA",
-            "MKC": "USA",
-            "CPB": "USA",
-            "LW": "USA",
-            "TAP": "USA",
-            "BF-B": "USA",
-            "MNST": "USA",
-            "FLO": "USA",
-            "SYY": "USA",
-            "KR": "USA",
-            "K": "USA",
-            "COTY": "USA",
-            "TGT": "USA",
-            "HD": "USA",
-            "LOW": "USA",
-            "DG": "USA",
-            "DLTR": "USA",
-            "FIVE": "USA",
-            "BURL": "USA",
-            "ROST": "USA",
-            "TJX": "USA",
-            "JPM": "USA",
-            "BAC": "USA",
-            "V": "USA",
-            "MA": "USA",
-            "WFC": "USA",
-            "C": "USA",
-            "GS": "USA",
-            "AXP": "USA",
-            "MS": "USA",
-            "BLK": "USA",
-            "SCHW": "USA",
-            "COF": "USA",
-            "USB": "USA",
-            "PNC": "USA",
-            "TFC": "USA",
-            "TD": "Canada",
-            "CME": "USA",
-            "ICE": "USA",
-            "AON": "UK",
-            "MMC": "USA",
-            "AJG": "USA",
-            "SPGI": "USA",
-            "MCO": "USA",
-            "FIS": "USA",
-            "FISV": "USA",
-            "NDAQ": "USA",
-            "CBOE": "USA",
-            "MKTX": "USA",
-            "RJF": "USA",
-            "RY": "Canada",
-            "BNS": "Canada",
-            "BMO": "Canada",
-            "ALLY": "USA",
-            "KEY": "USA",
-            "CFG": "USA",
-            "HBAN": "USA",
-            "MTB": "USA",
-            "RF": "USA",
-            "ZION": "USA",
-            "GE": "USA",
-            "HON": "USA",
-            "MMM": "USA",
-            "BA": "USA",
-            "CAT": "USA",
-            "UNP": "USA",
-            "DE": "USA",
-            "RTX": "USA",
-            "LMT": "USA",
-            "GD": "USA",
-            "NOC": "USA",
-            "ITW": "USA",
-            "EMR": "USA",
-            "ETN": "USA",
-            "WM": "USA",
-            "RSG": "USA",
-            "FDX": "USA",
-            "UPS": "USA",
-            "CSX": "USA",
-            "NSC": "USA",
-            "CP": "Canada",
-            "CNI": "Canada",
-            "DAL": "USA",
-            "UAL": "USA",
-            "LUV": "USA",
-            "AAL": "USA",
-            "DOV": "USA",
-            "FTV": "USA",
-            "IR": "USA",
-            "OTIS": "USA",
-            "TT": "USA",
-            "PH": "USA",
-            "ROK": "USA",
-            "SWK": "USA",
-            "AME": "USA",
-            "GNRC": "USA",
-            "JCI": "Ireland",
-            "PWR": "USA",
-            "WAB": "USA",
-            "XYL": "USA",
-            "WSO": "USA",
-            "FAST": "USA",
-            "O": "USA",
-            "AMT": "USA",
-            "PLD": "USA",
-            "CCI": "USA",
-            "EQIX": "USA",
-            "DLR": "USA",
-            "PSA": "USA",
-            "SPG": "USA",
-            "AVB": "USA",
-            "EQR": "USA",
-            "VTR": "USA",
-            "WELL": "USA",
-            "WY": "USA",
-            "EXR": "USA",
-            "MAA": "USA",
-            "ESS": "USA",
-            "UDR": "USA",
-            "SBAC": "USA",
-            "IRM": "USA",
-            "ARE": "USA",
-            "REG": "USA",
-            "KIM": "USA",
-            "FRT": "USA",
-            "VICI": "USA",
-            "STOR": "USA",
-            "NSA": "USA",
-            "LAMR": "USA",
-            "GLPI": "USA",
-            "CPT": "USA",
-            "ACC": "USA",
-            "XOM": "USA",
-            "CVX": "USA",
-            "SHEL": "UK",
-            "TTE": "France",
-            "COP": "USA",
-            "EOG": "USA",
-            "PXD": "USA",
-            "MPC": "USA",
-            "PSX": "USA",
-            "VLO": "USA",
-            "OXY": "USA",
-            "HES": "USA",
-            "DVN": "USA",
-            "FANG": "USA",
-            "CTRA": "USA",
-            "EQT": "USA",
-            "MRO": "USA",
-            "HAL": "USA",
-            "SLB": "USA",
-            "BKR": "USA",
-            "NOV": "USA",
-            "FTI": "UK",
-            "LNG": "USA",
-            "ET": "USA",
-            "EPD": "USA",
-            "WMB": "USA",
-            "OKE": "USA",
-            "KMI": "USA",
-            "TRP": "Canada",
-            "ENB": "Canada",
-            "DIS": "USA",
-            "NFLX": "USA",
-            "CMCSA": "USA",
-            "T": "USA",
-            "VZ": "USA",
-            "TMUS": "USA",
-            "CHTR": "USA",
-            "EA": "USA",
-            "TTWO": "USA",
-            "ATVI": "USA",
-            "ROKU": "USA",
-            "LYV": "USA",
-            "NWSA": "USA",
-            "FOXA": "USA",
-            "IPG": "USA",
-            "OMC": "USA",
-            "WPP": "UK",
-            "DISH": "USA",
-            "SIRI": "USA",
-            "LGF-A": "USA",
-            "IAC": "USA",
-            "MTCH": "USA",
-            "BIDU": "China",
-            "JD": "China",
-            "BABA": "China",
-            "TME": "China",
-            "YY": "China",
-            "DOYU": "China",
-            "HUYA": "China",
-            "IQ": "China",
-        }
+        # Shared read-only registries (no per-instance copy)
+        self.country_data = COUNTRY_DATA
+        self.company_origins = COMPANY_ORIGINS
     
     def get_geo_data(self, ticker):
         """
@@ -354,51 +492,13 @@ class GeoDataFetcher:
         Returns:
             list: Geographical data points
         """
-        MAX_COUNTRIES = 5
-        # Get country of origin
-        origin_country = self.company_origins.get(ticker, "USA")
-        
-        # Create data with origin country as main
-        data = [{
-            "country": origin_country,
-            "weight": 0.85,
-            **self.country_data[origin_country]
-        }]
-        
-        # Add relevant secondary countries based on origin country
-        relevant_countries = self._get_relevant_secondary_countries(origin_country)
-        secondary_countries = relevant_countries[:MAX_COUNTRIES-1]
-        
-        # Distribute remaining 15% among secondary countries
-        total_weight = 0.15
-        weight_per_country = total_weight / len(secondary_countries)
-        
-        for country in secondary_countries:
-            data.append({
-                "country": country,
-                "weight": weight_per_country,
-                **self.country_data[country]
-            })
-        
-        return data
-    
-    def _get_relevant_secondary_countries(self, origin_country):
-        """Define relevant economic partners by country"""
-        economic_partners = {
-            "USA": ["Canada", "China", "Germany", "UK", "Japan"],
-            "China": ["USA", "Japan", "Germany", "Australia", "India"],
-            "Japan": ["USA", "China", "Australia", "Germany", "India"],
-            "Germany": ["USA", "UK", "France", "China", "Japan"],
-            "UK": ["USA", "Germany", "France", "China", "Australia"],
-            "France": ["Germany", "UK", "USA", "China", "Australia"],
-            "Canada": ["USA", "UK", "China", "Germany", "Japan"],
-            "Australia": ["China", "Japan", "USA", "UK", "India"],
-            "India": ["USA", "China", "Japan", "Germany", "Australia"],
-            "Brazil": ["USA", "China", "Germany", "UK", "Argentina"],
-        }
-        
-        # Return first 3 partners
-        return economic_partners.get(origin_country, ["USA", "China", "Germany"])[:3]
+        matrix = get_exposure_matrix()
+        indices, weights = matrix.row(ticker)
+        return [{
+            "country": matrix.countries[j],
+            "weight": float(weight),
+            **self.country_data[matrix.countries[j]]
+        } for j, weight in zip(indices, weights)]
     
     def to_dataframe(self, data):
         """
@@ -411,5 +511,6 @@ class GeoDataFetcher:
             pd.DataFrame: Formatted DataFrame
         """
         df = pd.DataFrame(data)
-        df['size'] = df['weight'] * 50  # Size proportional to weight
+        if not df.empty:
+            df['size'] = df['weight'] * 50  # Size proportional to weight
         return df
\ No newline at end of file
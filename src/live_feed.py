@@ -0,0 +1,142 @@
+import time
+
+import pandas as pd
+
+# Import local modules
+from src.data_fetcher import DataFetcher
+from src.technical_analyzer import TechnicalAnalyzer
+from src.visualizer import Visualizer
+
+class LiveFeed:
+    """Class to keep a ticker's analyzed data and chart current with incremental updates"""
+
+    def __init__(self, ticker, data_frame, interval="1d", fetcher=None):
+        """
+        Initialize feed from already analyzed data.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            data_frame (pd.DataFrame): Bars with their indicator columns, sorted by date
+            interval (str): Bar interval of the data (default: "1d")
+            fetcher (DataFetcher): Source of new bars (default: DataFetcher(ticker))
+        """
+        self.ticker = ticker
+        self.interval = interval
+        self.analyzer = TechnicalAnalyzer(data_frame)
+        self.fetcher = fetcher if fetcher is not None else DataFetcher(ticker)
+        self.viz = None
+        self.last_update = {}
+
+    @classmethod
+    def start(cls, ticker, period="6mo", interval="1d"):
+        """
+        Download a ticker's history and compute its indicators
+
+        Args:
+            ticker (str): Stock ticker symbol
+            period (str): History to download (default: "6mo")
+            interval (str): Bar interval (default: "1d")
+
+        Returns:
+            LiveFeed: Feed, or None when no data is available
+        """
+        df = DataFetcher(ticker).fetch_data(period=period, interval=interval)
+        if df.empty:
+            return None
+        analyzer = TechnicalAnalyzer(df)
+        analyzer.add_rsi()
+        analyzer.add_performance_column()
+        return cls(ticker, analyzer.df, interval=interval)
+
+    @property
+    def df(self):
+        """Current data"""
+        return self.analyzer.df
+
+    def refresh(self):
+        """
+        Pull the bars since the last known one and apply them
+
+        Indicators are computed for the new rows only and the chart, once
+        built, is extended in place: the cost follows the number of new bars.
+
+        Returns:
+            dict: 'rows' added or revised, 'fetch_ms' and 'update_ms'
+        """
+        start = time.perf_counter()
+        bars = self.fetcher.fetch_new_bars(self.df.index[-1], interval=self.interval)
+        fetched = time.perf_counter()
+
+        rows = self.analyzer.update(bars)
+        if rows and self.viz is not None:
+            self.viz.append_rows(self.df.iloc[-rows:])
+
+        self.last_update = {
+            'rows': rows,
+            'fetch_ms': round((fetched - start) * 1000, 1),
+            'update_ms': round((time.perf_counter() - fetched) * 1000, 1),
+            'time': pd.Timestamp.now()
+        }
+        return self.last_update
+
+    def chart(self):
+        """
+        Candles, moving averages and volume, built on first call then extended by refresh()
+
+        Returns:
+            Visualizer: Styled chart
+        """
+        if self.viz is None:
+            self.viz = Visualizer(self.df, rows=2, columns=1, row_heights=[0.75, 0.25])
+            self.viz.draw_candlestick()
+            if 'MA_50' in self.df.columns:
+                self.viz.MA_draw(overlay=True)
+            self.viz.draw_volume()
+            self.viz.styled_figure(title=f"{self.ticker} (live)")
+        return self.viz
+
+    def summary(self):
+        """
+        Last values for a watchlist row
+
+        Returns:
+            dict: Ticker, last close, change since the previous bar, RSI and last refresh time
+        """
+        close = self.df['Close']
+        return {
+            'Ticker': self.ticker,
+            'Last': close.iloc[-1],
+            'Change %': (close.iloc[-1] / close.iloc[-2] - 1) * 100 if len(close) > 1 else 0.0,
+            'RSI': self.df['rsi'].iloc[-1] if 'rsi' in self.df.columns else None,
+            'Updated': self.last_update.get('time')
+        }
+
+    @classmethod
+    def test_live_feed(cls):
+        """
+        Test a refresh with a stub fetcher returning a revised bar and new bars
+
+        Example:
+        >>> result = LiveFeed.test_live_feed()
+        >>> print(result)
+        """
+        full = TechnicalAnalyzer.test_update().df
+        raw = full[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+        class StubFetcher:
+            def fetch_new_bars(self, since, interval="1d"):
+                return raw[raw.index >= since]
+
+        history = TechnicalAnalyzer(raw.iloc[:390].copy())
+        for method in ('compute_50_200_days', 'add_rsi', 'calculate_volatility', 'add_signal_column',
+                       'add_performance_column', 'add_returns_columns'):
+            getattr(history, method)()
+
+        feed = cls("TEST", history.df, fetcher=StubFetcher())
+        points = feed.chart().plotted_points
+        stats = feed.refresh()
+        assert stats['rows'] == 11, f"Unexpected update: {stats}"
+        pd.testing.assert_frame_equal(feed.df, full, check_freq=False)
+        assert feed.viz.plotted_points - points == 10 * 5, "Chart not extended with the new bars"
+        assert feed.refresh()['rows'] == 1, "Only the last bar should come back"
+        return stats
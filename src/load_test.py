@@ -0,0 +1,189 @@
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+class LoadTester:
+    """Class to measure an analytics service's throughput and latency under concurrent clients"""
+
+    def __init__(self, base_url, gzip=True, timeout=30):
+        """
+        Initialize load tester.
+
+        Args:
+            base_url (str): Service URL (ex: "http://127.0.0.1:8765")
+            gzip (bool): Accept gzip responses (default: True)
+            timeout (float): Request timeout in seconds (default: 30)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Accept-Encoding': "gzip"} if gzip else {}
+        self.timeout = timeout
+
+    @staticmethod
+    def default_paths(tickers):
+        """
+        Request mix of a dashboard-like consumer: indicators, Arrow bars, portfolios and macro correlations
+
+        Args:
+            tickers (list): Tickers to query
+
+        Returns:
+            list: URL paths
+        """
+        paths = []
+        for ticker in tickers:
+            paths += [
+                f"/indicators?ticker={ticker}&tail=250",
+                f"/bars?ticker={ticker}&format=arrow",
+                f"/macro/correlation?ticker={ticker}",
+            ]
+        for i in range(0, len(tickers) - 1, 2):
+            paths.append(f"/portfolio?tickers={tickers[i]},{tickers[i + 1]}")
+        return paths
+
+    def request(self, path):
+        """
+        Send one GET request
+
+        Returns:
+            tuple: (path, HTTP status or 0 on connection error, seconds, body bytes)
+        """
+        start = time.perf_counter()
+        try:
+            request = urllib.request.Request(self.base_url + path, headers=self.headers)
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, size = response.status, len(response.read())
+        except urllib.error.HTTPError as e:
+            status, size = e.code, len(e.read())
+        except OSError:
+            status, size = 0, 0
+        return path, status, time.perf_counter() - start, size
+
+    def run(self, paths, total=500, concurrency=16):
+        """
+        Send requests cycling through paths from concurrent clients
+
+        Args:
+            paths (list): URL paths
+            total (int): Number of requests (default: 500)
+            concurrency (int): Concurrent clients (default: 16)
+
+        Returns:
+            tuple: (summary dict, pd.DataFrame of per-endpoint latencies)
+        """
+        sequence = [paths[i % len(paths)] for i in range(total)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(self.request, sequence))
+        elapsed = time.perf_counter() - start
+
+        frame = pd.DataFrame(results, columns=['path', 'status', 'seconds', 'bytes'])
+        latency = frame['seconds'].to_numpy() * 1000
+        summary = {
+            'requests': total,
+            'concurrency': concurrency,
+            'seconds': round(elapsed, 3),
+            'requests_per_s': round(total / elapsed, 1),
+            'ok': int((frame['status'] == 200).sum()),
+            'errors': int((frame['status'] != 200).sum()),
+            'p50_ms': round(float(np.percentile(latency, 50)), 1),
+            'p95_ms': round(float(np.percentile(latency, 95)), 1),
+            'p99_ms': round(float(np.percentile(latency, 99)), 1),
+            'max_ms': round(float(latency.max()), 1),
+            'megabytes': round(float(frame['bytes'].sum()) / 1e6, 2)
+        }
+        frame['endpoint'] = frame['path'].str.split('?').str[0]
+        frame['ms'] = frame['seconds'] * 1000
+        by_endpoint = frame.groupby('endpoint').agg(
+            count=('ms', 'size'), p50_ms=('ms', 'median'), max_ms=('ms', 'max'),
+            kb=('bytes', 'mean'), errors=('status', lambda s: int((s != 200).sum()))
+        ).round(1)
+        by_endpoint['kb'] = (by_endpoint['kb'] / 1000).round(1)
+        return summary, by_endpoint
+
+    def server_stats(self):
+        """Service counters from /health"""
+        with urllib.request.urlopen(self.base_url + "/health", timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    @classmethod
+    def test_load(cls):
+        """
+        Test a short load run against an in-process service on synthetic data
+
+        Example:
+        >>> summary = LoadTester.test_load()
+        >>> print(summary)
+        """
+        import os
+        import tempfile
+        from src.analytics_service import AnalyticsService
+        from src.technical_analyzer import TechnicalAnalyzer
+
+        raw = TechnicalAnalyzer.test_update().df[['Open', 'High', 'Low', 'Close', 'Volume']]
+        with tempfile.TemporaryDirectory() as input_dir:
+            for i, ticker in enumerate(("AAA", "BBB")):
+                (raw * (1 + i / 10)).to_parquet(os.path.join(input_dir, f"{ticker}.parquet"))
+            raw.to_parquet(os.path.join(input_dir, "^VIX.parquet"))
+
+            AnalyticsService.clear_cache()
+            server, url = AnalyticsService(input_dir=input_dir).start_background()
+            try:
+                tester = cls(url)
+                summary, _ = tester.run(cls.default_paths(["AAA", "BBB"]), total=60, concurrency=8)
+                stats = tester.server_stats()
+            finally:
+                server.shutdown()
+                server.server_close()
+                AnalyticsService.clear_cache()
+
+        assert summary['errors'] == 0, f"Failed requests: {summary}"
+        # 7 distinct paths: everything else is served from the response cache or coalesced
+        assert stats['computed'] <= 7, f"Responses computed more than once: {stats}"
+        return summary
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load test the analytics service (python -m src.analytics_service)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Running service URL")
+    target.add_argument("--input", help="Start an in-process service on <ticker>.parquet/.csv bars of this directory")
+    parser.add_argument("--tickers", nargs="+", default=["AAPL", "MSFT", "NVDA", "AMZN"])
+    parser.add_argument("--paths", nargs="+", help="URL paths to request (default: a mix over --tickers)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--no-gzip", action="store_true", help="Do not accept gzip responses")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        from src.analytics_service import AnalyticsService
+
+        # Client and server share this process (and its GIL): a separate server gives higher figures
+        server, url = AnalyticsService(input_dir=args.input).start_background()
+
+    tester = LoadTester(url, gzip=not args.no_gzip)
+    paths = args.paths or LoadTester.default_paths(args.tickers)
+    try:
+        # Cold pass: every response computed (concurrent identical requests coalesced)
+        cold, _ = tester.run(paths, total=len(paths), concurrency=args.concurrency)
+        warm, by_endpoint = tester.run(paths, total=args.requests, concurrency=args.concurrency)
+        stats = tester.server_stats()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print(pd.DataFrame({'cold': cold, 'warm': warm}).to_string())
+    print()
+    print(by_endpoint.to_string())
+    print()
+    print("Server:", ", ".join(f"{name}={value}" for name, value in stats.items()))
+    sys.exit(1 if cold['errors'] or warm['errors'] else 0)
@@ -1,10 +1,16 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
-import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+
+# Import local modules
+from src.runtime import Runtime
+
+# Shared by every MacroData instance: {(symbol, period): (Series or None, error or None)}
+_INDICATOR_CACHE = Runtime.cache("macro_indicators", ttl=3600)
 
 class MacroData:
     """Class to fetch macroeconomic data"""
-    
+
     INDICATORS = {
         "VIX": "^VIX",  # Volatility index
         "Treasury 10Y": "^TNX",  # Bond yield
@@ -15,50 +21,182 @@ class MacroData:
         "S&P 500": "^GSPC"
     }
 
-    @st.cache_data(ttl=3600, show_spinner=False)
-    def fetch_macro_data(_self, period="1y"):
+    CACHE_TTL = 3600  # Successful downloads are kept 1 hour
+    ERROR_TTL = 300  # Failures are retried after 5 minutes
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached indicator downloads"""
+        _INDICATOR_CACHE.clear()
+
+    def fetch_indicator(self, name, period="1y"):
         """
-        Fetch macroeconomic data with caching
-        
+        Fetch one indicator's closing prices, cached independently of the others
+
         Args:
+            name (str): Indicator name (key of INDICATORS)
             period (str): Data period (default: "1y")
-            
+
+        Returns:
+            tuple: (pd.Series of closes indexed by date or None, error message or None)
+        """
+        key = (self.INDICATORS[name], period)
+        cached = _INDICATOR_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        import yfinance as yf
+
+        try:
+            data = yf.Ticker(self.INDICATORS[name]).history(period=period, timeout=10)
+            if data is None or data.empty:
+                result = (None, "No data")
+            else:
+                closes = data['Close'].dropna()
+                # Align symbols from different exchanges/timezones on plain dates
+                if closes.index.tz is not None:
+                    closes.index = closes.index.tz_localize(None)
+                closes.index = closes.index.normalize()
+                result = (closes[~closes.index.duplicated(keep='last')].rename(name), None)
+        except Exception as e:
+            result = (None, str(e))
+
+        ttl = self.CACHE_TTL if result[0] is not None else self.ERROR_TTL
+        _INDICATOR_CACHE.set(key, result, ttl=ttl)
+        return result
+
+    def fetch_macro_data(self, period="1y"):
+        """
+        Fetch macroeconomic data, all indicators concurrently
+
+        Args:
+            period (str): Data period (default: "1y")
+
         Returns:
             tuple: (DataFrame of macro data, dictionary of errors)
         """
-        macro_df = pd.DataFrame()
         errors = {}  # Store errors by indicator
-        
-        for name, ticker in _self.INDICATORS.items():
-            try:
-                # Use yf.download()
-                data = yf.download(ticker, period=period, progress=False)
-                
-                if data.empty:
-                    errors[name] = "No data"
-                    continue
-                    
-                macro_df[name] = data['Close']
-                
-            except Exception as e:
-                errors[name] = str(e)
-        
+        series = {}
+
+        with ThreadPoolExecutor(max_workers=len(self.INDICATORS)) as executor:
+            futures = {
+                name: executor.submit(self.fetch_indicator, name, period)
+                for name in self.INDICATORS
+            }
+
+        # Keep INDICATORS order
+        for name, future in futures.items():
+            closes, error = future.result()
+            if error:
+                errors[name] = error
+            else:
+                series[name] = closes
+
+        if not series:
+            return pd.DataFrame(), errors
+
+        # Use trading days of the first available indicator
+        macro_df = pd.concat(series, axis=1)
+        macro_df = macro_df.reindex(next(iter(series.values())).index)
         return macro_df, errors
 
-    def get_correlation(self, stock_data, macro_df):
+    def get_macro_returns(self, period="1y"):
         """
-        Calculate correlation between asset and macro indicators
-        
+        Daily returns of all macro indicators on a shared date index (cached)
+
         Args:
-            stock_data (pd.DataFrame): Stock price data
-            macro_df (pd.DataFrame): Macroeconomic data
-            
+            period (str): Data period (default: "1y")
+
         Returns:
-            pd.DataFrame: Correlation matrix
+            pd.DataFrame: Daily returns, one column per available indicator
         """
-        if macro_df.empty or stock_data.empty:
+        key = ("returns", period)
+        cached = _INDICATOR_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        macro_df, errors = self.fetch_macro_data(period=period)
+        macro_returns = macro_df.pct_change(fill_method=None).iloc[1:]
+        # Rebuild sooner when some indicators are missing
+        _INDICATOR_CACHE.set(key, macro_returns, ttl=self.ERROR_TTL if errors else self.CACHE_TTL)
+        return macro_returns
+
+    def get_correlation(self, stock_data, macro_returns=None, period="1y"):
+        """
+        Calculate correlation between asset daily returns and macro indicator returns
+
+        Args:
+            stock_data (pd.DataFrame): Stock price data (needs a 'Close' column)
+            macro_returns (pd.DataFrame): Macro returns from get_macro_returns() (default: cached panel)
+            period (str): Period of the cached panel when macro_returns is None (default: "1y")
+
+        Returns:
+            pd.DataFrame: 'Close' column of correlations, one row per indicator
+        """
+        if macro_returns is None:
+            macro_returns = self.get_macro_returns(period=period)
+        if macro_returns.empty or stock_data.empty:
+            return pd.DataFrame()
+
+        # Returns over the panel's own intervals (weekend moves of crypto land on Monday)
+        asset = daily_returns(stock_data['Close'], index=macro_returns.index).to_numpy()
+        macro = macro_returns.to_numpy(dtype=float)
+
+        # Pairwise-complete Pearson correlation of the asset against every column
+        valid = ~np.isnan(macro) & ~np.isnan(asset)[:, None]
+        count = valid.sum(axis=0)
+        x = np.where(valid, asset[:, None], 0.0)
+        y = np.where(valid, macro, 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.where(valid, x - x.sum(axis=0) / count, 0.0)
+            y = np.where(valid, y - y.sum(axis=0) / count, 0.0)
+            corr = (x * y).sum(axis=0) / np.sqrt((x * x).sum(axis=0) * (y * y).sum(axis=0))
+        corr[count < 3] = np.nan
+
+        result = pd.DataFrame({'Close': corr}, index=macro_returns.columns)
+        return result.sort_values('Close', ascending=False)
+
+    def get_rolling_correlation(self, stock_data, macro_returns=None, window=60, period="1y"):
+        """
+        Rolling correlation between asset daily returns and each macro indicator
+
+        Args:
+            stock_data (pd.DataFrame): Stock price data (needs a 'Close' column)
+            macro_returns (pd.DataFrame): Macro returns from get_macro_returns() (default: cached panel)
+            window (int): Rolling window in days (default: 60)
+            period (str): Period of the cached panel when macro_returns is None (default: "1y")
+
+        Returns:
+            pd.DataFrame: Rolling correlations, one column per indicator
+        """
+        from src.rolling_stats import RollingStats
+
+        if macro_returns is None:
+            macro_returns = self.get_macro_returns(period=period)
+        if macro_returns.empty or stock_data.empty:
             return pd.DataFrame()
-            
-        merged = pd.merge(stock_data, macro_df, left_index=True, right_index=True, how='inner')
-        corr_matrix = merged.corr()
-        return corr_matrix[['Close']].sort_values('Close', ascending=False)
\ No newline at end of file
+
+        asset = daily_returns(stock_data['Close'], index=macro_returns.index)
+        return RollingStats(window=window).against(macro_returns, asset)['correlation']
+
+def daily_returns(prices, index=None):
+    """
+    Daily returns indexed by timezone-naive dates, so series from different sources align
+
+    Args:
+        prices (pd.Series): Prices indexed by date
+        index (pd.DatetimeIndex): Dates to compute returns on, e.g. the macro panel's. Prices are
+            taken on those dates first (last known price when the asset did not trade), so every
+            return covers the same interval as returns computed on index (default: own dates)
+
+    Returns:
+        pd.Series: Returns (first date NaN)
+    """
+    dates = pd.DatetimeIndex(prices.index)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    prices = pd.Series(prices.to_numpy(), index=dates.normalize()).sort_index()
+    prices = prices[~prices.index.duplicated(keep='last')].dropna()
+    if index is not None:
+        prices = prices.reindex(index, method='ffill')
+    return prices.pct_change(fill_method=None)
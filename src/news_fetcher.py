@@ -1,44 +1,309 @@
-import random
-import feedparser
+import asyncio
+import calendar
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pandas as pd
+
+# Import local modules
+from src.asset_categories import AssetCategories
+from src.news_store import NewsStore
+from src.reddit_analyzer import build_ticker_matcher
+from src.sentiment_scorer import SentimentScorer
+
+FEED_URL = "https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}"
+
+# Shared so the text-hash score cache survives Streamlit reruns
+_SCORER = SentimentScorer()
+_MATCH_TICKERS = build_ticker_matcher(AssetCategories.get_all_tickers())
+
+# Tickers currently being refreshed by a background thread
+_IN_FLIGHT = set()
+_IN_FLIGHT_LOCK = threading.Lock()
 
 class NewsFetcher:
     """Class to fetch company news"""
-    
-    def __init__(self):
-        pass
-    
-    def get_company_news(self, ticker):
-        """
-        Get company news with sentiment simulation
-        
+
+    def __init__(self, store=None, feed_url=FEED_URL, max_age=900, retry_after=120, timeout=10):
+        """
+        Initialize news fetcher
+
+        Args:
+            store (NewsStore): On-disk entry store (default: shared temporary store)
+            feed_url (str): Feed URL template with a {ticker} field (default: Yahoo Finance RSS)
+            max_age (int): Seconds before a feed is considered stale (default: 900)
+            retry_after (int): Seconds before a failed feed is fetched again (default: 120)
+            timeout (int): HTTP timeout in seconds (default: 10)
+        """
+        self.store = store if store is not None else NewsStore()
+        self.feed_url = feed_url
+        self.max_age = max_age
+        self.retry_after = retry_after
+        self.timeout = timeout
+
+    def get_company_news(self, ticker, limit=5):
+        """
+        Get company news with lexicon sentiment scores
+
+        Reads the on-disk store only. Missing or stale feeds are refreshed in a
+        background thread, so this never waits on the network.
+
+        Args:
+            ticker (str): Stock ticker symbol
+            limit (int): Maximum number of items (default: 5)
+
+        Returns:
+            list: News items with sentiment analysis (empty until the first refresh completes)
+        """
+        fetched_at = self.store.get_feed_state(ticker)['fetched_at']
+        if fetched_at is None or time.time() - fetched_at > self.max_age:
+            self.refresh_in_background([ticker])
+
+        return self._to_items(self.store.get_entries(ticker, limit=limit))
+
+    def search(self, query="", tickers=None, days=None, limit=50):
+        """
+        Stored news matching a query, from the inverted index
+
+        Args:
+            query (str): Words that must all appear in the title (default: any title)
+            tickers (list): Tickers, any of them (default: all tickers)
+            days (int): Only the last days (default: no limit)
+            limit (int): Maximum number of items (default: 50)
+
+        Returns:
+            list: News items like get_company_news(), newest first
+        """
+        since = time.time() - days * 86400 if days else None
+        entries = self.store.search(
+            terms=SentimentScorer.tokenize(query), tickers=tickers or (), since=since, limit=limit
+        )
+        return self._to_items(entries)
+
+    def get_sentiment_series(self, ticker, days=None):
+        """
+        Daily news sentiment of a ticker
+
         Args:
             ticker (str): Stock ticker symbol
-            
+            days (int): Only the last days (default: all stored days)
+
+        Returns:
+            pd.DataFrame: 'count' and mean 'score' columns indexed by date
+        """
+        since = time.strftime('%Y-%m-%d', time.gmtime(time.time() - days * 86400)) if days else None
+        rows = self.store.get_daily_sentiment(ticker, since=since)
+        series = pd.DataFrame(rows, columns=['day', 'count', 'score_sum'])
+        series.index = pd.DatetimeIndex(pd.to_datetime(series.pop('day')), name='Date')
+        series['score'] = series.pop('score_sum') / series['count']
+        return series
+
+    @staticmethod
+    def _to_items(entries):
+        """Format store entries as news items, scoring entries stored without a score"""
+        unscored = [entry['title'] for entry in entries if entry['score'] is None]
+        fallback = iter(_SCORER.score_batch(unscored)) if unscored else iter(())
+        items = []
+        for entry in entries:
+            score = entry['score'] if entry['score'] is not None else float(next(fallback))
+            items.append({
+                'title': entry['title'],
+                'source': entry['source'] or "Yahoo Finance",
+                'date': time.strftime('%Y-%m-%d', time.gmtime(entry['published'])) if entry['published'] else "",
+                'url': entry['link'],
+                'sentiment': _SCORER.label(score),
+                'score': score
+            })
+        return items
+
+    @staticmethod
+    def _annotate(entries):
+        """Add sentiment score, index terms and mentioned tickers to parsed entries"""
+        titles = [entry['title'] for entry in entries]
+        for entry, score in zip(entries, _SCORER.score_batch(titles)):
+            entry['score'] = float(score)
+            entry['terms'] = SentimentScorer.tokenize(entry['title'])
+            entry['tickers'] = _MATCH_TICKERS(entry['title'])
+        return entries
+
+    def refresh(self, tickers, concurrency=8):
+        """
+        Fetch feeds for many tickers concurrently (blocking)
+
+        Args:
+            tickers (list): Ticker symbols
+            concurrency (int): Maximum simultaneous requests (default: 8)
+
+        Returns:
+            dict: {ticker: status} with status in 'updated', 'not_modified' or an error message
+        """
+        return asyncio.run(self.refresh_async(tickers, concurrency=concurrency))
+
+    def refresh_in_background(self, tickers):
+        """Start refresh() in a daemon thread, skipping tickers already being refreshed"""
+        with _IN_FLIGHT_LOCK:
+            pending = [t for t in tickers if t not in _IN_FLIGHT]
+            _IN_FLIGHT.update(pending)
+        if not pending:
+            return None
+
+        def run():
+            try:
+                self.refresh(pending)
+            finally:
+                with _IN_FLIGHT_LOCK:
+                    _IN_FLIGHT.difference_update(pending)
+
+        thread = threading.Thread(target=run, name="news-refresh", daemon=True)
+        thread.start()
+        return thread
+
+    async def refresh_async(self, tickers, concurrency=8):
+        """Coroutine version of refresh()"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(ticker):
+            async with semaphore:
+                try:
+                    return ticker, await self._fetch_feed(ticker)
+                except Exception as e:
+                    self._record_failure(ticker)
+                    return ticker, str(e)
+
+        results = await asyncio.gather(*(bounded(t) for t in tickers))
+        return dict(results)
+
+    def _record_failure(self, ticker):
+        """Mark a failed feed as fetched, so it is retried after retry_after rather than on every read"""
+        state = self.store.get_feed_state(ticker)
+        # Backdated: the feed turns stale retry_after seconds from now instead of max_age
+        fetched_at = time.time() - max(self.max_age - self.retry_after, 0)
+        if state['fetched_at'] is not None:
+            fetched_at = min(fetched_at, state['fetched_at'])  # Never makes an older fetch look fresher
+        self.store.save_feed_state(ticker, state['etag'], state['last_modified'], fetched_at=fetched_at)
+
+    async def _fetch_feed(self, ticker):
+        """
+        Conditional GET of one feed, then parse and store new entries
+
         Returns:
-            list: News items with sentiment analysis
-        """
-        sentiment_map = {
-            "positive": 0.8,   # Positive sentiment score
-            "neutral": 0.2,    # Neutral sentiment score
-            "negative": -0.5   # Negative sentiment score
-        }
-    
+            str: 'updated' or 'not_modified'
+        """
+        state = self.store.get_feed_state(ticker)
+        request = urllib.request.Request(self.feed_url.format(ticker=ticker))
+        if state['etag']:
+            request.add_header('If-None-Match', state['etag'])
+        if state['last_modified']:
+            request.add_header('If-Modified-Since', state['last_modified'])
+
+        def download():
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return response.status, response.headers, response.read()
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    return 304, e.headers, b""
+                raise
+
+        status, headers, body = await asyncio.to_thread(download)
+
+        if status == 304:
+            self.store.save_feed_state(ticker, state['etag'], state['last_modified'])
+            return 'not_modified'
+
+        entries = await asyncio.to_thread(lambda: self._annotate(self._parse_feed(body)))
+        self.store.add_entries(ticker, entries)
+        self.store.save_feed_state(
+            ticker,
+            headers.get('ETag'),
+            headers.get('Last-Modified')
+        )
+        return 'updated'
+
+    @staticmethod
+    def _parse_feed(body):
+        """Parse RSS/Atom bytes into store entries"""
+        import feedparser  # Only needed when a feed is actually downloaded
+
+        feed = feedparser.parse(body)
+        source = feed.feed.get('title') or "Yahoo Finance"
+        entries = []
+        for entry in feed.entries:
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            entries.append({
+                'title': entry.get('title', ''),
+                'link': entry.get('link', ''),
+                'source': source,
+                'published': calendar.timegm(published) if published else None
+            })
+        return entries
+
+    @classmethod
+    def test_fetcher(cls):
+        """
+        Test NewsFetcher against a local HTTP stand-in serving a fixture feed
+
+        Example:
+        >>> results = NewsFetcher.test_fetcher()
+        >>> print(results)
+        """
+        import os
+        import tempfile
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        fixture = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>Fixture</title>
+            <item><title>Fixture beats estimates</title><link>http://local/1</link>
+            <pubDate>Mon, 01 Jul 2024 10:00:00 GMT</pubDate></item>
+            <item><title>Fixture cuts guidance as NVDA demand slows</title><link>http://local/2</link>
+            <pubDate>Tue, 02 Jul 2024 10:00:00 GMT</pubDate></item>
+            </channel></rss>"""
+        etag = '"fixture-v1"'
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.endswith("=ERR"):
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'application/rss+xml')
+                self.end_headers()
+                self.wfile.write(fixture)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
         try:
-            feed = feedparser.parse(f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}")
-            return [{
-                'title': entry.title,
-                'source': "Yahoo Finance",
-                'date': entry.published.split('T')[0],
-                'url': entry.link,
-                'sentiment': random.choice(["positive", "neutral", "negative"]),
-                'score': sentiment_map[random.choice(["positive", "neutral", "negative"])]
-            } for entry in feed.entries[:5]]
-        except:
-            return [{
-                'title': f"Simulated news for {ticker}",
-                'source': "System",
-                'date': "2023-01-01",
-                'url': "#",
-                'sentiment': "neutral",
-                'score': 0.2  # DEFAULT SCORE
-            }]
\ No newline at end of file
+            with tempfile.TemporaryDirectory() as tmp:
+                fetcher = cls(
+                    store=NewsStore(os.path.join(tmp, 'news.sqlite3')),
+                    feed_url=f"http://127.0.0.1:{server.server_address[1]}/rss?s={{ticker}}"
+                )
+                first = fetcher.refresh(["AAA", "BBB"])
+                second = fetcher.refresh(["AAA", "BBB"])
+                news = fetcher.get_company_news("AAA")
+                found = fetcher.search("guidance", tickers=["NVDA"])
+                series = fetcher.get_sentiment_series("AAA")
+                failed = fetcher.refresh(["ERR"])
+                failed_age = time.time() - fetcher.store.get_feed_state("ERR")['fetched_at']
+        finally:
+            server.shutdown()
+
+        assert first == {"AAA": "updated", "BBB": "updated"}, f"Unexpected first fetch: {first}"
+        assert second == {"AAA": "not_modified", "BBB": "not_modified"}, f"Unexpected second fetch: {second}"
+        assert len(news) == 2, "Entries were not deduplicated"
+        assert [item['url'] for item in found] == ["http://local/2"], f"Unexpected search result: {found}"
+        assert series['count'].sum() == 2, "Daily sentiment counted an entry twice"
+        assert failed["ERR"] != 'updated', f"Unexpected failed fetch: {failed}"
+        retry_at = fetcher.max_age - fetcher.retry_after
+        assert retry_at - 1 <= failed_age <= fetcher.max_age, f"Failed fetch not backed off: {failed_age:.0f} s old"
+        return {'first': first, 'second': second, 'news': news, 'found': found, 'series': series}
@@ -0,0 +1,259 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'bourse_dashboard', 'news.sqlite3')
+
+class NewsStore:
+    """Class to persist news feed entries and feed validators on disk (SQLite)"""
+
+    SCHEMA_VERSION = 2  # The store is a cache: older layouts are dropped, not migrated
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS feeds (
+            ticker TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS entries (
+            link_hash TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            link TEXT NOT NULL,
+            source TEXT,
+            published REAL,
+            inserted_at REAL,
+            score REAL
+        );
+        -- Ticker postings: feed the entry came from and tickers named in its title
+        -- (publication time copied so a ticker + date range query is one index range)
+        CREATE TABLE IF NOT EXISTS entry_tickers (
+            link_hash TEXT NOT NULL,
+            ticker TEXT NOT NULL,
+            published REAL,
+            PRIMARY KEY (ticker, link_hash)
+        );
+        CREATE INDEX IF NOT EXISTS idx_entry_tickers_published ON entry_tickers (ticker, published);
+        -- Term postings (inverted index over titles)
+        CREATE TABLE IF NOT EXISTS entry_terms (
+            term TEXT NOT NULL,
+            link_hash TEXT NOT NULL,
+            PRIMARY KEY (term, link_hash)
+        ) WITHOUT ROWID;
+        -- Per-ticker daily sentiment, updated as postings are added
+        CREATE TABLE IF NOT EXISTS daily_sentiment (
+            ticker TEXT NOT NULL,
+            day TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            score_sum REAL NOT NULL,
+            PRIMARY KEY (ticker, day)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_entries_published ON entries (published);
+    """
+
+    TABLES = ("feeds", "entries", "entry_tickers", "entry_terms", "daily_sentiment")
+
+    def __init__(self, path=DEFAULT_PATH):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path (str): SQLite file path (default: temporary directory)
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                for table in self.TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection for one transaction (one per call, so the store can be shared across threads)"""
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def link_hash(link):
+        """Stable deduplication key of an entry"""
+        return hashlib.sha1(link.encode('utf-8')).hexdigest()
+
+    def get_feed_state(self, ticker):
+        """
+        Return HTTP validators and last fetch time of a ticker feed.
+
+        Returns:
+            dict: {'etag', 'last_modified', 'fetched_at'} (values None if never fetched)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified, fetched_at FROM feeds WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        if row is None:
+            return {'etag': None, 'last_modified': None, 'fetched_at': None}
+        return dict(row)
+
+    def save_feed_state(self, ticker, etag=None, last_modified=None, fetched_at=None):
+        """Record HTTP validators after a successful (200 or 304) fetch"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO feeds (ticker, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?)",
+                (ticker, etag, last_modified, fetched_at if fetched_at is not None else time.time())
+            )
+
+    @staticmethod
+    def _day(entry, now):
+        """UTC date of an entry (insertion time when it has no publication date)"""
+        timestamp = entry.get('published') or now
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).date().isoformat()
+
+    def add_entries(self, ticker, entries):
+        """
+        Insert entries, skipping links already stored.
+
+        Postings and the daily sentiment of each ticker are updated in the same
+        transaction, only for (ticker, entry) pairs not seen before, so an entry
+        repeated across fetches or feeds is counted once per ticker.
+
+        Args:
+            ticker (str): Ticker the feed was fetched for
+            entries (list): Dicts with 'title', 'link', 'source', 'published' (epoch seconds or None),
+                and optionally 'score' (sentiment), 'terms' and 'tickers' (mentioned in the title)
+
+        Returns:
+            list: link hashes of entries that were not stored yet
+        """
+        now = time.time()
+        by_hash = {self.link_hash(e['link']): e for e in entries if e.get('link')}
+        if not by_hash:
+            return []
+
+        with self._connect() as conn:
+            hashes = list(by_hash)
+            placeholders = ",".join("?" * len(hashes))
+            known = {r[0] for r in conn.execute(
+                f"SELECT link_hash FROM entries WHERE link_hash IN ({placeholders})", hashes
+            )}
+            new_hashes = [h for h in hashes if h not in known]
+            conn.executemany(
+                "INSERT OR IGNORE INTO entries (link_hash, title, link, source, published, inserted_at, score) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(h, by_hash[h]['title'], by_hash[h]['link'], by_hash[h].get('source'),
+                  by_hash[h].get('published'), now, by_hash[h].get('score')) for h in new_hashes]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO entry_terms (term, link_hash) VALUES (?, ?)",
+                [(term, h) for h in new_hashes for term in set(by_hash[h].get('terms', ()))]
+            )
+
+            # rowcount tells which pairs are new, also when two feeds store the same entry at once
+            pairs = sorted({(t, h) for h, e in by_hash.items() for t in {ticker, *e.get('tickers', ())}})
+            new_pairs = [
+                (t, h) for t, h in pairs
+                if conn.execute(
+                    "INSERT OR IGNORE INTO entry_tickers (ticker, link_hash, published) VALUES (?, ?, ?)",
+                    (t, h, by_hash[h].get('published'))
+                ).rowcount
+            ]
+
+            daily = {}
+            for t, h in new_pairs:
+                score = by_hash[h].get('score')
+                if score is None:
+                    continue
+                counts = daily.setdefault((t, self._day(by_hash[h], now)), [0, 0.0])
+                counts[0] += 1
+                counts[1] += score
+            conn.executemany(
+                "INSERT INTO daily_sentiment (ticker, day, count, score_sum) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (ticker, day) DO UPDATE SET "
+                "count = count + excluded.count, score_sum = score_sum + excluded.score_sum",
+                [(t, day, count, score_sum) for (t, day), (count, score_sum) in daily.items()]
+            )
+        return new_hashes
+
+    def get_entries(self, ticker, limit=5):
+        """
+        Latest stored entries for a ticker.
+
+        Returns:
+            list: Dicts with 'link_hash', 'title', 'link', 'source', 'published', 'score'
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT e.link_hash, e.title, e.link, e.source, e.published, e.score "
+                "FROM entries e JOIN entry_tickers t ON t.link_hash = e.link_hash "
+                "WHERE t.ticker = ? ORDER BY e.published DESC, e.inserted_at DESC LIMIT ?",
+                (ticker, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, terms=(), tickers=(), since=None, limit=50):
+        """
+        Entries containing every term and linked to any of the tickers.
+
+        Args:
+            terms (iterable): Normalized title terms, all required (default: none)
+            tickers (iterable): Tickers, any of them (default: all)
+            since (float): Minimum publication epoch seconds (default: no limit)
+            limit (int): Maximum number of entries (default: 50)
+
+        Returns:
+            list: Dicts like get_entries(), newest first
+        """
+        clauses, params = [], []
+        tickers = list(tickers)
+        if tickers:
+            # Driven by the (ticker, published) postings index
+            source = "entry_tickers t JOIN entries e ON e.link_hash = t.link_hash"
+            clauses.append(f"t.ticker IN ({','.join('?' * len(tickers))})")
+            params.extend(tickers)
+            if since is not None:
+                clauses.append("t.published >= ?")
+                params.append(since)
+        else:
+            source = "entries e"
+            if since is not None:
+                clauses.append("e.published >= ?")
+                params.append(since)
+        for term in dict.fromkeys(terms):
+            clauses.append("e.link_hash IN (SELECT link_hash FROM entry_terms WHERE term = ?)")
+            params.append(term)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT e.link_hash, e.title, e.link, e.source, e.published, e.score, e.inserted_at "
+                f"FROM {source} {where} ORDER BY e.published DESC, e.inserted_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_daily_sentiment(self, ticker, since=None):
+        """
+        Daily sentiment aggregates of a ticker.
+
+        Args:
+            ticker (str): Ticker symbol
+            since (str): First ISO day included (default: all days)
+
+        Returns:
+            list: (ISO day, entry count, score sum) tuples sorted by day
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT day, count, score_sum FROM daily_sentiment WHERE ticker = ? AND day >= ? ORDER BY day",
+                (ticker, since or "")
+            ).fetchall()
+        return [tuple(row) for row in rows]
@@ -0,0 +1,85 @@
+from functools import lru_cache
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Import local modules
+from src.css import Cssdash
+
+DEFAULT_THEME = "Neon Cyberpunk"
+
+def template_name(theme):
+    """
+    Name of the registered Plotly template of a theme (registers all themes on first call)
+
+    Args:
+        theme (str): Theme name (key of Cssdash.themes), unknown names fall back to DEFAULT_THEME
+
+    Returns:
+        str: Key in plotly.io.templates
+    """
+    names = register_templates()
+    return names.get(theme, names[DEFAULT_THEME])
+
+@lru_cache(maxsize=None)
+def register_templates():
+    """
+    Compile every Cssdash theme into a plotly.io.templates entry, once per process
+
+    Returns:
+        dict: {theme name: template name}
+    """
+    names = {}
+    for theme, colors in Cssdash.themes.items():
+        name = "bourse_" + theme.lower().replace(" ", "_")
+        pio.templates[name] = build_template(colors)
+        names[theme] = name
+    return names
+
+def _rgba(hex_color, alpha):
+    red, green, blue = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({red}, {green}, {blue}, {alpha})"
+
+def build_template(colors):
+    """
+    Build a dark Plotly template from a theme palette
+
+    Rising candles use accent1, falling candles and bars accent2, lines cycle
+    through the palette so overlaid series stay distinguishable. Only the trace
+    types Visualizer draws are styled: a full template such as plotly_dark is
+    much larger, and it is copied into every figure and its JSON.
+
+    Args:
+        colors (dict): Palette with 'primary', 'secondary', 'background', 'accent1', 'accent2', 'text'
+
+    Returns:
+        go.layout.Template: Template
+    """
+    template = go.layout.Template()
+    axis = dict(
+        gridcolor=colors['accent1'],
+        linecolor=colors['secondary'],
+        zerolinecolor=colors['secondary'],
+        tickfont=dict(color=colors['text']),
+        rangeslider=dict(visible=False)
+    )
+    template.layout.update(
+        colorway=list(dict.fromkeys([colors['accent1'], colors['accent2'], colors['secondary'], colors['text']])),
+        hovermode='x unified',
+        plot_bgcolor=colors['primary'],
+        paper_bgcolor=colors['background'],
+        font=dict(color=colors['text']),
+        hoverlabel=dict(bgcolor=colors['primary'], font=dict(color=colors['text'])),
+        title=dict(x=0.5, xanchor='center', font=dict(size=20, color=colors['text'])),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        xaxis=axis,
+        yaxis={key: value for key, value in axis.items() if key != 'rangeslider'}
+    )
+    template.data.candlestick = [go.Candlestick(
+        increasing=dict(line=dict(color=colors['accent1']), fillcolor=_rgba(colors['accent1'], 0.7)),
+        decreasing=dict(line=dict(color=colors['accent2']), fillcolor=_rgba(colors['accent2'], 0.7))
+    )]
+    template.data.bar = [go.Bar(marker=dict(color=colors['accent2']), opacity=0.8)]
+    template.data.scatter = [go.Scatter(line=dict(width=2))]
+    template.data.scattergl = [go.Scattergl(line=dict(width=2))]
+    return template
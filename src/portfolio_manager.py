@@ -1,12 +1,13 @@
 import pandas as pd
 import numpy as np
-import streamlit as st
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import local modules
 from src.data_fetcher import DataFetcher
 from src.technical_analyzer import TechnicalAnalyzer
-from src.geo_data import GeoDataFetcher
+from src.geo_data import COUNTRY_DATA, get_exposure_matrix
+from src.covariance_engine import CovarianceEngine
+from src.risk_analyzer import RiskAnalyzer
 
 class PortfolioManager:
     """Class to manage virtual portfolios"""
@@ -21,36 +22,26 @@ class PortfolioManager:
         self.weights = tickers_weights
         self.data = {}  # Stores DataFrames by ticker
         self.returns = None  # DataFrame of weighted returns
+        self.covariance_engine = None  # Return covariance estimator
         
     def get_combined_geo_influence(self):
         """Calculate combined geographical influence for portfolio"""
-        geo_fetcher = GeoDataFetcher()
-        country_weights = {}
-        
-        # Aggregate weights by country
-        for ticker, weight in self.weights.items():
-            geo_data = geo_fetcher.get_geo_data(ticker)
-            for item in geo_data:
-                country = item['country']
-                country_weights[country] = country_weights.get(country, 0) + (item['weight'] * weight)
-        
+        matrix = get_exposure_matrix()
+
+        # Aggregate weights by country (one sparse matrix-vector product)
+        country_weights = matrix.combined(self.weights)
+
         # Normalize to sum to 1
-        total = sum(country_weights.values())
+        total = country_weights.sum()
         if total > 0:
-            for country in country_weights:
-                country_weights[country] /= total
-        
+            country_weights = country_weights / total
+
         # Prepare for visualization
-        combined_data = []
-        for country, weight in country_weights.items():
-            if country in geo_fetcher.country_data:
-                combined_data.append({
-                    "country": country,
-                    "weight": weight,
-                    **geo_fetcher.country_data[country]
-                })
-        
-        return combined_data
+        return [{
+            "country": country,
+            "weight": float(weight),
+            **COUNTRY_DATA[country]
+        } for country, weight in zip(matrix.countries, country_weights) if weight > 0]
         
     def fetch_portfolio_data(self, period="1y"):
         """Fetch portfolio data with improved error handling"""
@@ -123,7 +114,142 @@ class PortfolioManager:
         
         self.returns = portfolio_returns
         return portfolio_returns
-    
+
+    def _aligned_returns(self):
+        """
+        Align daily returns of all portfolio assets on a common date index.
+
+        Returns:
+            pd.DataFrame: Daily returns (rows: dates, columns: tickers), missing days filled with 0
+        """
+        if not self.data:
+            raise ValueError("No data available. Run fetch_portfolio_data() first.")
+
+        returns = pd.concat(
+            {ticker: df['Daily_Return'] for ticker, df in self.data.items()},
+            axis=1
+        ).sort_index()
+        return returns.fillna(0.0)
+
+    def simulate_rebalancing(self, frequency=None, threshold=None, proportional_cost=0.0,
+                             fixed_cost=0.0, initial_value=1.0):
+        """
+        Simulate the portfolio with weight drift, periodic/threshold rebalancing and trading costs.
+
+        Holdings drift with asset returns between rebalances. At a rebalance (end of day)
+        the portfolio is traded back to its target weights and pays
+        `proportional_cost * turnover * value + fixed_cost`.
+
+        Args:
+            frequency (str): Calendar rebalancing period ("D", "W", "M", "Q", "Y"),
+                None to only check the threshold every day (default: None)
+            threshold (float): Rebalance only when an asset weight drifts more than this
+                absolute amount from its target, None to always rebalance on calendar dates (default: None)
+            proportional_cost (float): Cost per unit of traded value (ex: 0.001 for 10 bps)
+            fixed_cost (float): Fixed cost per rebalance, in the same unit as initial_value
+            initial_value (float): Starting portfolio value (default: 1.0)
+
+        Returns:
+            pd.DataFrame: DataFrame with columns:
+                - one drifted weight column per ticker
+                - 'Portfolio_Value', 'Portfolio_Return', 'Cumulative_Return' (in percentage)
+                - 'Rebalanced' (bool), 'Turnover', 'Costs'
+        """
+        returns = self._aligned_returns()
+        tickers = list(returns.columns)
+        target = np.array([self.weights[t] for t in tickers], dtype=float)
+        if target.sum() <= 0:
+            raise ValueError("Portfolio weights must sum to a positive value.")
+        target = target / target.sum()
+
+        n_days = len(returns)
+        # growth[t] = cumulative growth of each asset up to the end of day t-1 (growth[0] = 1)
+        growth = np.vstack([
+            np.ones(len(tickers)),
+            np.cumprod(1.0 + returns.to_numpy(), axis=0)
+        ])
+
+        events = self._rebalancing_events(returns.index, growth, target, frequency, threshold)
+
+        # Segment k starts at growth row starts[k] and ends (inclusive) on day ends[k]
+        ends = np.append(events, n_days - 1)
+        starts = np.concatenate(([0], events + 1))
+        segment = np.repeat(np.arange(len(ends)), ends - starts + 1)
+
+        # Value multiple of each segment since its start, for every day (vectorized over segments)
+        relative_growth = growth[1:] / growth[starts[segment]]
+        multiple = relative_growth @ target
+        drifted_weights = relative_growth * target / multiple[:, None]
+
+        turnover = np.abs(drifted_weights[events] - target).sum(axis=1)
+        # Value invested at segment start follows U[k+1] = a[k] * U[k] - fixed_cost
+        a = multiple[events] * (1.0 - proportional_cost * turnover)
+        prod_a = np.concatenate(([1.0], np.cumprod(a)))
+        invested = prod_a * (initial_value - fixed_cost * np.concatenate(([0.0], np.cumsum(1.0 / prod_a[1:]))))
+
+        values = invested[segment] * multiple
+        costs = np.zeros(n_days)
+        costs[events] = values[events] - invested[1:]
+        values[events] = invested[1:]
+        drifted_weights[events] = target
+
+        result = pd.DataFrame(drifted_weights, index=returns.index, columns=tickers)
+        result['Portfolio_Value'] = values
+        result['Portfolio_Return'] = np.diff(values, prepend=initial_value) / np.concatenate(([initial_value], values[:-1]))
+        result['Cumulative_Return'] = (values / initial_value - 1) * 100  # In percentage
+        result['Rebalanced'] = False
+        result.iloc[events, result.columns.get_loc('Rebalanced')] = True
+        result['Turnover'] = 0.0
+        result.iloc[events, result.columns.get_loc('Turnover')] = turnover
+        result['Costs'] = costs
+
+        self.returns = result
+        return result
+
+    @staticmethod
+    def _rebalancing_events(dates, growth, target, frequency, threshold, block=64):
+        """
+        Find the day indices (end of day) on which the portfolio is rebalanced.
+
+        Calendar candidates are the last trading day of each period. With a threshold,
+        candidates are scanned block by block from the last rebalance, so the cost
+        grows with the number of rebalances rather than the number of days.
+
+        Returns:
+            np.ndarray: Sorted day indices of rebalancing events
+        """
+        n_days = len(dates)
+        if frequency is None and threshold is None:
+            return np.array([], dtype=int)
+
+        if frequency is None:
+            candidates = np.arange(n_days)
+        else:
+            periods = pd.Series(np.arange(n_days), index=dates).groupby(dates.to_period(frequency)).max()
+            candidates = periods.to_numpy()
+        # Rebalancing on the last day would only pay costs
+        candidates = candidates[candidates < n_days - 1]
+
+        if threshold is None:
+            return candidates
+
+        events = []
+        start = 0  # growth row at which the current segment starts
+        position = 0
+        while position < len(candidates):
+            window = candidates[position:position + block]
+            relative = growth[window + 1] / growth[start]
+            drift = relative * target / (relative @ target)[:, None] - target
+            breached = np.flatnonzero(np.abs(drift).max(axis=1) > threshold)
+            if breached.size:
+                day = window[breached[0]]
+                events.append(day)
+                start = day + 1
+                position += breached[0] + 1
+            else:
+                position += block
+        return np.array(events, dtype=int)
+
     def get_performance_metrics(self):
         """
         Calculate key portfolio metrics.
@@ -152,14 +278,63 @@ class PortfolioManager:
         
         return metrics
         
-    def calculate_correlations(self):
-        """Calculate correlations between portfolio assets"""
-        closes = pd.DataFrame()
-        for ticker, df in self.data.items():
-            if not df.empty:
-                closes[ticker] = df['Close']
-        
-        if closes.empty:
+    def get_risk_metrics(self, confidence=0.95):
+        """
+        Risk metrics (VaR, CVaR, drawdown, Sortino, Calmar...) of the portfolio returns.
+
+        Uses the returns of the last calculate_weighted_returns() or
+        simulate_rebalancing() run, so drift, rebalancing and costs are
+        included like in get_performance_metrics().
+
+        Args:
+            confidence (float): VaR/CVaR confidence level (default: 0.95)
+
+        Returns:
+            dict: Metrics (see RiskAnalyzer.evaluate)
+        """
+        if self.returns is None:
+            raise ValueError("Run calculate_weighted_returns() first.")
+
+        analyzer = RiskAnalyzer(self.returns[['Portfolio_Return']])
+        return analyzer.evaluate([[1.0]], confidence=confidence).iloc[0].to_dict()
+
+    def evaluate_allocations(self, weights=None, confidence=0.95):
+        """
+        Compute risk metrics (VaR, CVaR, drawdown, Sortino, Calmar...) for many allocations at once.
+
+        Args:
+            weights (pd.DataFrame): Candidate weights (rows: candidates, columns: tickers),
+                default: the portfolio's own weights
+            confidence (float): VaR/CVaR confidence level (default: 0.95)
+
+        Returns:
+            pd.DataFrame: One row of metrics per candidate (see RiskAnalyzer.evaluate)
+        """
+        analyzer = RiskAnalyzer(self._aligned_returns())
+        if weights is None:
+            weights = pd.DataFrame([self.weights])
+        return analyzer.evaluate(weights, confidence=confidence)
+
+    def calculate_correlations(self, shrinkage=False):
+        """
+        Calculate correlations between portfolio asset returns.
+
+        The fitted estimator is kept in `covariance_engine` so new days can be
+        added with `covariance_engine.update()` instead of recomputing.
+
+        Args:
+            shrinkage (bool): Apply Ledoit-Wolf shrinkage (default: False)
+
+        Returns:
+            pd.DataFrame: Correlation matrix
+        """
+        daily_returns = {
+            ticker: df['Close'].pct_change()
+            for ticker, df in self.data.items() if not df.empty
+        }
+        if not daily_returns:
             return pd.DataFrame()
-        
-        return closes.corr()
\ No newline at end of file
+
+        returns = pd.concat(daily_returns, axis=1).sort_index()
+        self.covariance_engine = CovarianceEngine.from_returns(returns)
+        return self.covariance_engine.correlation(shrinkage=shrinkage)
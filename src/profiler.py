@@ -0,0 +1,142 @@
+import json
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+# Imported when app.py starts, in this order
+STARTUP_MODULES = (
+    "streamlit", "pandas", "numpy", "plotly.graph_objects",
+    "src.visualizer", "src.dashboard", "src.portfolio_manager", "src.news_fetcher"
+)
+
+# Imported on first use of a feature
+LAZY_MODULES = ("yfinance", "plotly.express", "feedparser", "pyarrow")
+
+# Run in a fresh interpreter: imports the JSON list of modules of argv[1], prints {module: ms}
+_IMPORT_TIMER = """
+import json, sys, time
+times = {}
+for module in json.loads(sys.argv[1]):
+    start = time.perf_counter()
+    __import__(module)
+    times[module] = round((time.perf_counter() - start) * 1000, 1)
+print(json.dumps(times))
+"""
+
+class ColdStartProfiler:
+    """Class to time module imports and first renders of the app's process"""
+
+    # Process-wide {stage name: seconds}, only the first (cold) occurrence of each stage
+    _stages = {}
+
+    @classmethod
+    def record(cls, name, seconds):
+        """
+        Record a stage duration, unless the stage was already recorded in this process
+
+        Args:
+            name (str): Stage name
+            seconds (float): Duration
+        """
+        cls._stages.setdefault(name, seconds)
+
+    @classmethod
+    @contextmanager
+    def stage(cls, name):
+        """
+        Time a block as a stage (first occurrence only)
+
+        Example:
+        >>> with ColdStartProfiler.stage("First render: Dashboard"):
+        ...     dashboard.display()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(name, time.perf_counter() - start)
+
+    @classmethod
+    def stages(cls):
+        """
+        Recorded stages
+
+        Returns:
+            dict: {stage name: milliseconds}, in recording order
+        """
+        return {name: round(seconds * 1000, 1) for name, seconds in cls._stages.items()}
+
+    @staticmethod
+    def import_times(modules=STARTUP_MODULES + LAZY_MODULES, python=sys.executable, cwd=None):
+        """
+        Cold import cost of modules, measured in a fresh interpreter
+
+        Modules are imported in the given order, so each cost excludes what an
+        earlier module already loaded (about 0 when it was loaded before).
+
+        Args:
+            modules (tuple): Module names (default: startup then lazily imported modules)
+            python (str): Interpreter (default: current one)
+            cwd (str): Working directory, where 'src' is importable (default: current one)
+
+        Returns:
+            dict: {module: milliseconds}
+        """
+        result = subprocess.run(
+            [python, "-c", _IMPORT_TIMER, json.dumps(list(modules))],
+            cwd=cwd, capture_output=True, text=True, check=True
+        )
+        return json.loads(result.stdout.splitlines()[-1])
+
+    @classmethod
+    def test_profiler(cls):
+        """
+        Test stage recording and import timing
+
+        Example:
+        >>> result = ColdStartProfiler.test_profiler()
+        >>> print(result)
+        """
+        saved = dict(cls._stages)
+        cls._stages.clear()
+        try:
+            with cls.stage("cold"):
+                time.sleep(0.01)
+            with cls.stage("cold"):
+                pass
+            stages = cls.stages()
+        finally:
+            cls._stages.clear()
+            cls._stages.update(saved)
+        assert stages["cold"] >= 10, f"Warm run overwrote the cold one: {stages}"
+
+        times = cls.import_times(("email.parser", "email"))
+        assert times["email"] < times["email.parser"], f"Already imported module has a cost: {times}"
+        return {'stages': stages, 'imports': times}
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Cold-start profile of the dashboard")
+    parser.add_argument("--render", action="store_true", help="Also time the first run of app.py (headless)")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print("Cold imports (ms, in import order):")
+    for module, ms in ColdStartProfiler.import_times(cwd=root).items():
+        lazy = " (lazy)" if module in LAZY_MODULES else ""
+        print(f"  {module:<24}{ms:>8.1f}{lazy}")
+
+    if args.render:
+        from streamlit.testing.v1 import AppTest
+
+        # app.py records into the importable module, not into this __main__ copy
+        from src.profiler import ColdStartProfiler as AppProfiler
+
+        start = time.perf_counter()
+        AppTest.from_file(os.path.join(root, "app.py"), default_timeout=120).run()
+        print(f"First run of app.py: {(time.perf_counter() - start) * 1000:.1f} ms")
+        for name, ms in AppProfiler.stages().items():
+            print(f"  {name:<40}{ms:>8.1f}")
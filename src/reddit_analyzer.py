@@ -1,25 +1,334 @@
-import random
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+from datetime import datetime, timezone
+from itertools import islice
+
+# Import local modules
+from src.asset_categories import AssetCategories
+from src.sentiment_scorer import SentimentScorer
+from src.social_store import DEFAULT_PATH, SocialSentimentStore
+
+# English stopwords, common short words and abbreviations written in capitals in posts:
+# tickers among them only count as $CASHTAGS (see cashtag_only)
+COMMON_WORDS = frozenset("""
+a about above after again against ain all am an and any are aren as at be because been before being
+below between both but by can couldn d did didn do does doesn doing don down during each few for from
+further had hadn has hasn have haven having he her here hers herself him himself his how i if in into
+is isn it its itself just ll m ma me mightn more most mustn my myself needn no nor not now o of off on
+once only or other our ours ourselves out over own re s same shan she should shouldn so some such t
+than that the their theirs them themselves then there these they this those through to too under until
+up ve very was wasn we were weren what when where which while who whom why will with won wouldn y you
+your yours yourself yourselves
+add age ago air also any arm art ask back bad bag ball bank base bear beat bed best bet big bill bit
+blue boil boom box boy bull buy call came cane car card care case cash cat cold come cool corn cost cut
+day dear deal dish dog done door dry due easy eat else end even ever eye face fact fair fall far fast
+fat fear feel few fine fire firm fit five fly food foot form four free fun game gas get gift give glad
+go gold good got grow gun guy half hand hard hat head hear heat hell help high hit hold home hope hot
+hour huge hum ice idea job joy keep key kid kind king know lady land last late law lead less let lie
+life like line list live long look lose lot love low luck made main make man many map max may mean meet
+mind miss moon move much must name near need net new news next nice nine none note old one open pay
+pick plan play plus poor post pull pump push put rain rate read real red rest rich ride rise risk road
+rock room run safe sale save say see seem sell send set shop show shut side sign sit six size slow
+small snow soon sort star stay step stop sun sure take talk tap team tell ten test than thing till tip
+top true try turn two type use vote wait walk want war way week well went win wish word work yeah year
+yes yet zero
+ai am apr ath atm aug bc btw ceo cfo cpi dd de dec ea ed el eps es et etf eu ev fbi feb fed fomc fyi
+gdp ge hd hr imo ipo ir irs jan jul jun lmao lol mar ms mtd nov ny oct ok otc pe pm pr ps q1 q2 q3 q4
+sec sep tbh tt tv uk us usa usb usd wm wsb ytd yolo
+""".split())
+
+# Upper-case words (with optional '$' and inner hyphens) that could be tickers
+CANDIDATE_PATTERN = re.compile(r"(?<![\w$-])(\$?)([A-Z](?:[A-Z0-9]|-(?=[A-Z]))*)(?![\w-])")
+
+def cashtag_only(tickers):
+    """
+    Tickers that are also common English words or abbreviations (SO, ARE, MS, ICE...)
+
+    Args:
+        tickers (iterable): Ticker symbols
+
+    Returns:
+        frozenset: Tickers found in COMMON_WORDS
+    """
+    return frozenset(t for t in tickers if t.lower() in COMMON_WORDS)
+
+def build_ticker_matcher(tickers):
+    """
+    Build a function returning the tickers mentioned in a text.
+
+    Candidates come from one precompiled regex and are checked against sets,
+    which is much faster than a regex alternation of every ticker. Single-letter
+    tickers and common words (cashtag_only) need a '$' prefix, the others match
+    as whole upper-case words with an optional '$'.
+
+    Args:
+        tickers (list): Ticker symbols
+
+    Returns:
+        callable: text -> set of tickers
+    """
+    tickers = set(tickers)
+    plain = frozenset(t for t in tickers if len(t) > 1) - cashtag_only(tickers)
+    findall = CANDIDATE_PATTERN.findall
+
+    def match(text):
+        return {
+            word for dollar, word in findall(text)
+            if word in plain or (dollar and word in tickers)
+        }
+
+    return match
 
 class RedditSentiment:
-    """Class to analyze Reddit sentiment (simulated)"""
-    
-    def __init__(self):
-        pass  # No authentication needed
-    
+    """Class to analyze Reddit sentiment from local post dumps"""
+
+    def __init__(self, store=None, scorer=None, tickers=None):
+        """
+        Initialize analyzer.
+
+        Args:
+            store (SocialSentimentStore): Aggregate store (default: shared store on disk)
+            scorer (SentimentScorer): Headline scorer (default: uncached lexicon scorer)
+            tickers (list): Tickers to detect (default: all AssetCategories tickers)
+        """
+        self.store = store if store is not None else SocialSentimentStore.load(DEFAULT_PATH)
+        # Posts are rarely repeated, so a text cache would only cost memory
+        self.scorer = scorer if scorer is not None else SentimentScorer(cache_size=0)
+        self.match_tickers = build_ticker_matcher(tickers or AssetCategories.get_all_tickers())
+
     def analyze_ticker(self, ticker):
         """
-        Simulated sentiment analysis without API access
-        
+        Sentiment counts of a ticker from the aggregate store (constant time)
+
         Args:
             ticker (str): Stock ticker symbol
-            
+
         Returns:
-            dict: Simulated sentiment analysis results
+            dict: 'positive', 'neutral', 'negative', 'total' post counts and mean 'score'
         """
-        return {
-            'positive': random.randint(5, 15),
-            'neutral': random.randint(20, 30),
-            'negative': random.randint(5, 15),
-            'total': 50,
-            'sample': "Simulation without Reddit access"
-        }
\ No newline at end of file
+        return self.store.summary(ticker)
+
+    def ingest(self, path, batch_size=5000, force=False):
+        """
+        Stream a JSONL dump (.jsonl, .gz or .zst) into the aggregate store
+
+        Posts are read, matched and scored batch by batch, so memory stays
+        bounded whatever the dump size. A file already ingested with the same
+        size and modification time is skipped. A plain dump that only grew
+        (lines appended) is read from where the last ingestion stopped; any
+        other change, or force, replaces the counts of that file. A last line
+        without newline is left for the next ingestion, in case it is still
+        being written.
+
+        Args:
+            path (str): Dump file path
+            batch_size (int): Posts scored at once (default: 5000)
+            force (bool): Ingest again an unchanged file (default: False)
+
+        Returns:
+            dict: 'posts' read, 'mentions' counted, 'skipped' lines, 'resumed' from a byte offset,
+                and 'cached' if not re-read
+        """
+        stats = {'posts': 0, 'mentions': 0, 'skipped': 0, 'cached': False, 'resumed': False}
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        record = self.store.sources.get(key)
+        if isinstance(record, list):  # [size, mtime] of stores written before offsets were kept
+            record = {'size': record[0], 'mtime': record[1], 'offset': record[0], 'tail': None}
+        if not force and record and [record['size'], record['mtime']] == [stat.st_size, stat.st_mtime]:
+            stats['cached'] = True
+            return stats
+
+        offset = 0
+        if (not force and record and not path.endswith(('.gz', '.zst'))
+                and stat.st_size > record['offset'] and record['tail'] in (None, self._tail(path, record['offset']))):
+            offset = record['offset']
+            stats['resumed'] = True
+        else:
+            self.store.drop_source(key)
+
+        position = {'offset': offset}
+        mentions = self._iter_mentions(self._iter_posts(self._iter_lines(path, position), stats))
+        while True:
+            batch = list(islice(mentions, batch_size))
+            if not batch:
+                break
+            scores = self.scorer.score_batch([text for _, _, text in batch])
+            for (tickers, day, _), score in zip(batch, scores):
+                label = self.scorer.label(score)
+                for ticker in tickers:
+                    self.store.add(ticker, day, label, float(score), source=key)
+                stats['mentions'] += len(tickers)
+
+        self.store.sources[key] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'offset': position['offset'],
+            'tail': self._tail(path, position['offset']) if 'end' not in position else None
+        }
+        self.store.save()
+        return stats
+
+    @staticmethod
+    def _tail(path, offset, size=4096):
+        """Hash of the bytes before offset, to check an appended file kept its ingested part"""
+        with open(path, 'rb') as f:
+            f.seek(max(0, offset - size))
+            return hashlib.blake2b(f.read(min(offset, size)), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _iter_lines(path, position):
+        """
+        Yield text lines of a plain, gzip or zstandard file
+
+        Plain files are read from position['offset'], which is advanced past
+        each complete line. Compressed files are read whole and get
+        position['end'] set.
+        """
+        if path.endswith('.zst'):
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("Reading .zst dumps requires the 'zstandard' package") from None
+            with open(path, 'rb') as raw:
+                # Reddit dumps use a long matching window
+                reader = zstandard.ZstdDecompressor(max_window_size=2**31).stream_reader(raw)
+                yield from io.TextIOWrapper(reader, encoding='utf-8', errors='replace')
+        elif path.endswith('.gz'):
+            with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+                yield from f
+        else:
+            with open(path, 'rb') as f:
+                f.seek(position['offset'])
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Possibly still being written
+                    position['offset'] += len(line)
+                    yield line.decode('utf-8', errors='replace')
+            return
+        position['end'] = True
+
+    @staticmethod
+    def _iter_posts(lines, stats):
+        """Yield (text, ISO day) of submissions and comments, counting unreadable lines"""
+        for line in lines:
+            try:
+                post = json.loads(line)
+                created = datetime.fromtimestamp(float(post['created_utc']), tz=timezone.utc)
+            except (ValueError, KeyError, TypeError):
+                stats['skipped'] += 1
+                continue
+            # Submissions have title/selftext, comments have body
+            text = post.get('body') or f"{post.get('title') or ''} {post.get('selftext') or ''}"
+            stats['posts'] += 1
+            yield text, created.date().isoformat()
+
+    def _iter_mentions(self, posts):
+        """Yield (tickers, ISO day, text) for posts mentioning at least one ticker"""
+        match_tickers = self.match_tickers
+        for text, day in posts:
+            tickers = match_tickers(text)
+            if tickers:
+                yield tickers, day, text
+
+    @classmethod
+    def test_ingest(cls):
+        """
+        Test ingestion on a small generated dump
+
+        Example:
+        >>> result = RedditSentiment.test_ingest()
+        >>> print(result)
+        """
+        import tempfile
+
+        posts = [
+            {"created_utc": 1719828000, "title": "TSLA beats estimates", "selftext": "strong quarter"},
+            {"created_utc": 1719828000, "body": "$TSLA and AAPL cut guidance, layoffs ahead"},
+            {"created_utc": "1719914400", "body": "Bought some $V today"},
+            {"created_utc": 1719914400, "body": "V for vendetta, IT is fine"},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            dump = os.path.join(tmp, 'posts.jsonl.gz')
+            with gzip.open(dump, 'wt', encoding='utf-8') as f:
+                for post in posts:
+                    f.write(json.dumps(post) + "\n")
+                f.write("not json\n")
+
+            analyzer = cls(store=SocialSentimentStore(os.path.join(tmp, 'store.json.gz')))
+            first = analyzer.ingest(dump, batch_size=2)
+            second = analyzer.ingest(dump)
+            reloaded = cls(store=SocialSentimentStore.load(analyzer.store.path))
+            tsla = reloaded.analyze_ticker("TSLA")
+
+        assert first['posts'] == 4 and first['skipped'] == 1, f"Unexpected stats: {first}"
+        assert first['mentions'] == 4, f"Unexpected mentions: {first}"
+        assert second['cached'], "Unchanged dump was ingested twice"
+        assert tsla['total'] == 2 and tsla['positive'] == 1 and tsla['negative'] == 1, f"Unexpected TSLA: {tsla}"
+        assert reloaded.analyze_ticker("V")['total'] == 1, "Bare single-letter word counted as ticker"
+        match = build_ticker_matcher(["SO", "ARE", "MS", "HD", "ICE", "TSLA"])
+        found = match("SO ARE we buying HD TV or ICE? MS says $SO and TSLA")
+        assert found == {"SO", "TSLA"}, f"Common words counted as tickers: {found}"
+        return {'first': first, 'TSLA': tsla}
+
+    @classmethod
+    def test_reingest(cls):
+        """
+        Test that appended, rewritten and forced dumps are not counted twice
+
+        Example:
+        >>> result = RedditSentiment.test_reingest()
+        >>> print(result)
+        """
+        import tempfile
+
+        def write(path, posts, mode='w'):
+            with open(path, mode, encoding='utf-8') as f:
+                for post in posts:
+                    f.write(json.dumps(post) + "\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            dump = os.path.join(tmp, 'posts.jsonl')
+            write(dump, [{"created_utc": 1719828000, "body": "TSLA beats estimates"}])
+            analyzer = cls(store=SocialSentimentStore(os.path.join(tmp, 'store.json.gz')))
+            analyzer.ingest(dump)
+
+            # Unrelated line, then a mention and a line still being written
+            write(dump, [{"created_utc": 1719828000, "body": "nothing to see"},
+                         {"created_utc": 1719914400, "body": "AAPL and TSLA rally"}], mode='a')
+            with open(dump, 'a', encoding='utf-8') as f:
+                f.write('{"created_utc": 1719914400, "body": "TSLA')
+            appended = analyzer.ingest(dump)
+            assert appended['resumed'] and appended['posts'] == 2, f"Appended lines not resumed: {appended}"
+            assert analyzer.analyze_ticker("TSLA")['total'] == 2, "Appended dump counted twice"
+
+            with open(dump, 'a', encoding='utf-8') as f:
+                f.write(' recall"}\n')
+            completed = analyzer.ingest(dump)
+            assert completed['posts'] == 1 and analyzer.analyze_ticker("TSLA")['total'] == 3, f"Bad resume: {completed}"
+
+            forced = analyzer.ingest(dump, force=True)
+            assert not forced['resumed'] and analyzer.analyze_ticker("TSLA")['total'] == 3, "Forced dump counted twice"
+
+            write(dump, [{"created_utc": 1719828000, "body": "AAPL only"}])
+            rewritten = analyzer.ingest(dump)
+            reloaded = cls(store=SocialSentimentStore.load(analyzer.store.path))
+            assert not rewritten['resumed'] and reloaded.analyze_ticker("TSLA")['total'] == 0, "Rewritten dump kept old counts"
+            assert reloaded.analyze_ticker("AAPL")['total'] == 1 and reloaded.store.daily("TSLA") == [], "Bad replaced counts"
+        return {'appended': appended, 'completed': completed, 'forced': forced, 'rewritten': rewritten}
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingest Reddit JSONL dumps into the sentiment store")
+    parser.add_argument("paths", nargs="+", help="Dump files (.jsonl, .gz or .zst)")
+    parser.add_argument("--force", action="store_true", help="Ingest again files already ingested")
+    args = parser.parse_args()
+
+    analyzer = RedditSentiment()
+    for dump_path in args.paths:
+        print(dump_path, analyzer.ingest(dump_path, force=args.force))
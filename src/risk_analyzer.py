@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from statistics import NormalDist
+
+class RiskAnalyzer:
+    """Class to compute risk metrics for many candidate allocations at once"""
+
+    def __init__(self, returns, periods_per_year=252, risk_free_rate=0.0):
+        """
+        Initialize analyzer with asset returns.
+
+        Args:
+            returns (pd.DataFrame): Daily asset returns (rows: dates, columns: tickers)
+            periods_per_year (int): Annualization factor (default: 252)
+            risk_free_rate (float): Annual risk-free rate (default: 0.0)
+        """
+        self.returns = returns.fillna(0.0)
+        self.periods_per_year = periods_per_year
+        self.risk_free_rate = risk_free_rate
+
+    def portfolio_returns(self, weights):
+        """
+        Daily returns of each candidate portfolio (constant weights).
+
+        Args:
+            weights (np.ndarray/pd.DataFrame): Weight matrix (candidates x assets) or one weight vector
+
+        Returns:
+            np.ndarray: Returns matrix (days x candidates)
+        """
+        if isinstance(weights, pd.DataFrame):
+            weights = weights[self.returns.columns].to_numpy(dtype=float)
+        weights = np.atleast_2d(np.asarray(weights, dtype=float))
+        if weights.shape[1] != self.returns.shape[1]:
+            raise ValueError(f"Expected {self.returns.shape[1]} weights per candidate, got {weights.shape[1]}")
+        return self.returns.to_numpy(dtype=float) @ weights.T
+
+    def evaluate(self, weights, confidence=0.95):
+        """
+        Compute risk/performance metrics for every candidate allocation.
+
+        VaR and CVaR are expressed as positive daily loss fractions.
+
+        Args:
+            weights (np.ndarray/pd.DataFrame): Weight matrix (candidates x assets)
+            confidence (float): VaR/CVaR confidence level (default: 0.95)
+
+        Returns:
+            pd.DataFrame: One row per candidate with columns:
+                annualized_return, volatility, sharpe_ratio, sortino_ratio, calmar_ratio,
+                var_historical, cvar_historical, var_parametric, cvar_parametric,
+                max_drawdown, max_drawdown_duration
+        """
+        returns = self.portfolio_returns(weights)
+        n_days = returns.shape[0]
+        if n_days < 2:
+            raise ValueError("At least 2 days of returns are required.")
+
+        annual = self.periods_per_year
+        daily_rf = self.risk_free_rate / annual
+        mean = returns.mean(axis=0)
+        std = returns.std(axis=0, ddof=1)
+        excess = mean - daily_rf
+
+        # Downside deviation relative to the risk-free rate
+        downside = np.sqrt(np.mean(np.minimum(returns - daily_rf, 0.0) ** 2, axis=0))
+
+        # Historical VaR / CVaR
+        alpha = 1 - confidence
+        var_hist = -np.quantile(returns, alpha, axis=0)
+        tail = returns <= -var_hist
+        cvar_hist = -(np.where(tail, returns, 0.0).sum(axis=0) / np.maximum(tail.sum(axis=0), 1))
+
+        # Gaussian VaR / CVaR
+        z = NormalDist().inv_cdf(alpha)
+        var_param = -(mean + z * std)
+        cvar_param = -(mean - std * NormalDist().pdf(z) / alpha)
+
+        # Drawdowns on the compounded wealth curve (starting at 1)
+        wealth = np.cumprod(1.0 + returns, axis=0)
+        peaks = np.maximum.accumulate(np.vstack([np.ones(returns.shape[1]), wealth]), axis=0)[1:]
+        drawdowns = wealth / peaks - 1.0
+        max_drawdown = -drawdowns.min(axis=0)
+
+        # Longest underwater stretch: days since the last peak, maximized per candidate
+        days = np.arange(1, n_days + 1)[:, None]
+        last_peak = np.maximum.accumulate(np.where(drawdowns < 0, 0, days), axis=0)
+        max_duration = (days - last_peak).max(axis=0)
+
+        annualized_return = (1 + mean) ** annual - 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            metrics = {
+                'annualized_return': annualized_return * 100,
+                'volatility': std * np.sqrt(annual) * 100,
+                'sharpe_ratio': excess / std * np.sqrt(annual),
+                'sortino_ratio': excess / downside * np.sqrt(annual),
+                'calmar_ratio': annualized_return / max_drawdown,
+                'var_historical': var_hist,
+                'cvar_historical': cvar_hist,
+                'var_parametric': var_param,
+                'cvar_parametric': cvar_param,
+                'max_drawdown': max_drawdown * 100,
+                'max_drawdown_duration': max_duration
+            }
+
+        index = weights.index if isinstance(weights, pd.DataFrame) else None
+        return pd.DataFrame(metrics, index=index)
+
+    def random_allocations(self, count=1000, seed=None):
+        """
+        Draw random long-only allocations (uniform on the simplex).
+
+        Args:
+            count (int): Number of candidates (default: 1000)
+            seed (int): Random seed (default: None)
+
+        Returns:
+            pd.DataFrame: Weight matrix (candidates x assets)
+        """
+        rng = np.random.default_rng(seed)
+        weights = rng.dirichlet(np.ones(self.returns.shape[1]), size=count)
+        return pd.DataFrame(weights, columns=self.returns.columns)
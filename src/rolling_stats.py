@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+from src.macro_data import MacroData, daily_returns
+
+class RollingStats:
+    """Class to compute rolling covariance, correlation and beta in O(n) per series"""
+
+    def __init__(self, window=60, min_periods=None):
+        """
+        Initialize rolling statistics.
+
+        Args:
+            window (int): Rolling window size in observations (default: 60)
+            min_periods (int): Minimum valid pairs in a window (default: window)
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.min_periods = window if min_periods is None else max(2, min_periods)
+
+    def _window_sums(self, values):
+        """Rolling window sums along axis 0 from a cumulative sum"""
+        cumulative = np.cumsum(values, axis=0)
+        sums = cumulative.copy()
+        sums[self.window:] -= cumulative[:-self.window]
+        return sums
+
+    def _moments(self, x, y):
+        """
+        Rolling covariance and variances of matching columns of x and y.
+
+        Each input is demeaned over the full sample before the cumulative sums,
+        which keeps the window differences numerically stable.
+
+        Args:
+            x (np.ndarray): Shape (T, N)
+            y (np.ndarray): Shape (T, N) or (T, 1)
+
+        Returns:
+            tuple: (covariance, variance of x, variance of y), each of shape (T, N)
+        """
+        x, y = np.broadcast_arrays(x, y)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x = np.where(valid, x - np.nanmean(np.where(valid, x, np.nan), axis=0), 0.0)
+        y = np.where(valid, y - np.nanmean(np.where(valid, y, np.nan), axis=0), 0.0)
+
+        count = self._window_sums(valid.astype(float))
+        sum_x = self._window_sums(x)
+        sum_y = self._window_sums(y)
+        sum_xx = self._window_sums(x * x)
+        sum_yy = self._window_sums(y * y)
+        sum_xy = self._window_sums(x * y)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = (sum_xy - sum_x * sum_y / count) / (count - 1)
+            var_x = (sum_xx - sum_x ** 2 / count) / (count - 1)
+            var_y = (sum_yy - sum_y ** 2 / count) / (count - 1)
+
+        insufficient = count < self.min_periods
+        for array in (cov, var_x, var_y):
+            array[insufficient] = np.nan
+        # Guard against tiny negative variances left by rounding
+        return cov, np.maximum(var_x, 0.0), np.maximum(var_y, 0.0)
+
+    def against(self, returns, benchmark):
+        """
+        Rolling covariance, correlation and beta of every column against one series.
+
+        Args:
+            returns (pd.DataFrame): Asset returns (rows: dates, columns: tickers)
+            benchmark (pd.Series): Benchmark returns
+
+        Returns:
+            dict: {'covariance': pd.DataFrame, 'correlation': pd.DataFrame, 'beta': pd.DataFrame}
+        """
+        aligned = returns.join(benchmark.rename('__benchmark__'), how='inner')
+        x = aligned[returns.columns].to_numpy(dtype=float)
+        y = aligned[['__benchmark__']].to_numpy(dtype=float)
+
+        cov, var_x, var_y = self._moments(x, y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            beta = cov / var_y
+            corr = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+
+        frame = lambda values: pd.DataFrame(values, index=aligned.index, columns=returns.columns)
+        return {
+            'covariance': frame(cov),
+            'correlation': frame(corr),
+            'beta': frame(beta)
+        }
+
+    def pairwise_correlation(self, returns, pairs=None):
+        """
+        Rolling correlation for pairs of columns.
+
+        Args:
+            returns (pd.DataFrame): Asset returns
+            pairs (list): (ticker_a, ticker_b) tuples (default: all pairs)
+
+        Returns:
+            pd.DataFrame: One column per pair (MultiIndex columns)
+        """
+        columns = list(returns.columns)
+        if pairs is None:
+            first, second = np.triu_indices(len(columns), k=1)
+            pairs = [(columns[i], columns[j]) for i, j in zip(first, second)]
+        position = {name: i for i, name in enumerate(columns)}
+        left = [position[a] for a, _ in pairs]
+        right = [position[b] for _, b in pairs]
+
+        values = returns.to_numpy(dtype=float)
+        cov, var_x, var_y = self._moments(values[:, left], values[:, right])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+
+        return pd.DataFrame(corr, index=returns.index, columns=pd.MultiIndex.from_tuples(pairs))
+
+    def against_indicator(self, tickers_data, macro_df, indicator="S&P 500"):
+        """
+        Rolling statistics of several tickers against a macro indicator.
+
+        Args:
+            tickers_data (dict): {ticker: DataFrame} with a 'Close' column
+            macro_df (pd.DataFrame): Macro data as returned by MacroData.fetch_macro_data()
+            indicator (str): Key of MacroData.INDICATORS used as benchmark (default: "S&P 500")
+
+        Returns:
+            dict: Same as against()
+        """
+        if indicator not in MacroData.INDICATORS:
+            raise ValueError(f"Unknown indicator: {indicator}")
+        if indicator not in macro_df.columns:
+            raise ValueError(f"No data for indicator: {indicator}")
+
+        returns = pd.concat(
+            {ticker: daily_returns(df['Close']) for ticker, df in tickers_data.items()},
+            axis=1
+        )
+        return self.against(returns, daily_returns(macro_df[indicator]))
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import threading
+
+# Import local modules
+from src.cache_utils import DiskCache, LRUCache, StreamlitCache, TTLCache
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'bourse_dashboard', 'cache')
+
+class Runtime:
+    """Class holding the cache backend and settings of the analytics modules
+
+    Modules take their caches from Runtime.cache() at import time and their
+    UI settings (e.g. the chart theme) from Runtime.setting(), so they run the
+    same in the Streamlit app, worker processes, batch jobs and services. The
+    entry point picks the backend with configure(): "memory" (default,
+    per-process), "disk" (pickle files shared by processes) or "streamlit"
+    (resource cache shared by sessions and dropped by "Clear cache").
+    """
+
+    BACKENDS = ("memory", "disk", "streamlit")
+
+    backend = os.environ.get('BOURSE_CACHE_BACKEND', "memory")
+    cache_dir = os.environ.get('BOURSE_CACHE_DIR', DEFAULT_CACHE_DIR)
+    settings = {}  # Mapping read by setting(); the app passes st.session_state
+
+    _stores = {}  # (backend, cache dir, name) -> store
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, backend=None, cache_dir=None, settings=None):
+        """
+        Select the cache backend and settings source (arguments left to None are unchanged)
+
+        Args:
+            backend (str): One of BACKENDS
+            cache_dir (str): Directory of the disk backend
+            settings (Mapping): Source of setting() values
+        """
+        if backend is not None:
+            if backend not in cls.BACKENDS:
+                raise ValueError(f"Unknown cache backend: {backend}, use one of: {', '.join(cls.BACKENDS)}")
+            cls.backend = backend
+        if cache_dir is not None:
+            cls.cache_dir = cache_dir
+        if settings is not None:
+            cls.settings = settings
+
+    @classmethod
+    def setting(cls, name, default=None):
+        """
+        Value of a setting
+
+        Args:
+            name (str): Setting name (e.g. 'theme')
+            default: Value when unset (default: None)
+        """
+        return cls.settings.get(name, default)
+
+    @classmethod
+    def cache(cls, name, ttl=None, maxsize=None):
+        """
+        Named cache following the configured backend
+
+        Args:
+            name (str): Cache name, unique per use
+            ttl (float): Default time-to-live in seconds: expiring entries (TTLCache semantics)
+            maxsize (int): Maximum number of entries, least recently used evicted first
+
+        Returns:
+            NamedCache: Cache with get/set/clear, resolved on each call
+        """
+        return NamedCache(name, ttl=ttl, maxsize=maxsize)
+
+    @classmethod
+    def store(cls, name, ttl=None, maxsize=None):
+        """
+        Store of a named cache for the current backend, created on first use
+
+        Returns:
+            TTLCache, LRUCache, DiskCache or StreamlitCache
+        """
+        key = (cls.backend, cls.cache_dir, name)
+        store = cls._stores.get(key)
+        if store is None:
+            with cls._lock:
+                store = cls._stores.get(key)
+                if store is None:
+                    if cls.backend == "disk":
+                        store = DiskCache(os.path.join(cls.cache_dir, name), ttl=ttl, maxsize=maxsize)
+                    elif cls.backend == "streamlit":
+                        store = StreamlitCache(name, ttl=ttl, maxsize=maxsize)
+                    elif ttl is not None:
+                        store = TTLCache(ttl=ttl, maxsize=maxsize)
+                    else:
+                        store = LRUCache(maxsize=maxsize or 32)
+                    cls._stores[key] = store
+        return store
+
+    @classmethod
+    def test_runtime(cls, cache_dir=None):
+        """
+        Test every backend behind the same named cache
+
+        Example:
+        >>> Runtime.test_runtime()
+        """
+        saved = (cls.backend, cls.cache_dir, cls.settings)
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                cache = cls.cache("runtime_test", ttl=60)
+                for backend in ("memory", "disk"):
+                    cls.configure(backend=backend, cache_dir=cache_dir or tmp)
+                    assert cache.get("key") is None, f"{backend}: unexpected value"
+                    cache.set("key", {"value": 1})
+                    assert cache.get("key") == {"value": 1}, f"{backend}: value not stored"
+                    cache.set("expired", 1, ttl=-1)
+                    assert cache.get("expired", "missing") == "missing", f"{backend}: entry not expired"
+                    cache.clear()
+                    assert cache.get("key") is None, f"{backend}: not cleared"
+
+                # Expired entries are reclaimed on write even if never read again, the rest kept to maxsize
+                cls.configure(backend="memory")
+                bounded = cls.cache("runtime_test_bounded", ttl=60, maxsize=3)
+                for i in range(3):
+                    bounded.set(("expired", i), i, ttl=-1)
+                bounded.set("key", 1)
+                assert len(bounded) == 1, f"Expired entries kept: {len(bounded)}"
+                for i in range(5):
+                    bounded.set(i, i)
+                assert len(bounded) == 3 and bounded.get(0) is None and bounded.get(4) == 4, "Size not bounded"
+
+                cls.configure(settings={'theme': "Lava Explosion"})
+                assert cls.setting('theme') == "Lava Explosion" and cls.setting('other', 1) == 1, "Bad settings"
+            finally:
+                cls.backend, cls.cache_dir, cls.settings = saved
+        return True
+
+class NamedCache:
+    """Cache handle delegating to the store of the configured backend"""
+
+    def __init__(self, name, ttl=None, maxsize=None):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+    def _store(self):
+        return Runtime.store(self.name, ttl=self.ttl, maxsize=self.maxsize)
+
+    def get(self, key, default=None):
+        """Return cached value, or default on miss"""
+        return self._store().get(key, default)
+
+    def set(self, key, value, ttl=None):
+        """Store a value (ttl overrides the cache's one where entries expire)"""
+        store = self._store()
+        if ttl is None or isinstance(store, LRUCache):
+            store.set(key, value)
+        else:
+            store.set(key, value, ttl=ttl)
+
+    def clear(self):
+        """Remove all entries"""
+        self._store().clear()
+
+    def __len__(self):
+        return len(self._store())
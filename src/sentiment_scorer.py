@@ -0,0 +1,159 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Finance-oriented lexicon (inspired by Loughran-McDonald word lists), scores in [-1, 1]
+FINANCE_LEXICON = {
+    # Positive
+    "beat": 0.8, "beats": 0.8, "surge": 0.8, "surges": 0.8, "surged": 0.8, "soar": 0.9, "soars": 0.9,
+    "soared": 0.9, "rally": 0.7, "rallies": 0.7, "rallied": 0.7, "jump": 0.6, "jumps": 0.6, "jumped": 0.6,
+    "gain": 0.5, "gains": 0.5, "gained": 0.5, "rise": 0.4, "rises": 0.4, "rising": 0.4, "rose": 0.4,
+    "climb": 0.5, "climbs": 0.5, "climbed": 0.5, "record": 0.5, "high": 0.3, "highs": 0.4,
+    "growth": 0.5, "grow": 0.4, "grows": 0.4, "strong": 0.6, "stronger": 0.6, "strength": 0.5,
+    "profit": 0.6, "profits": 0.6, "profitable": 0.7, "upgrade": 0.8, "upgrades": 0.8, "upgraded": 0.8,
+    "outperform": 0.8, "outperforms": 0.8, "bullish": 0.8, "buy": 0.4, "boost": 0.6, "boosts": 0.6,
+    "boosted": 0.6, "raise": 0.4, "raises": 0.4, "raised": 0.4, "exceed": 0.7, "exceeds": 0.7,
+    "exceeded": 0.7, "upbeat": 0.7, "optimistic": 0.7, "optimism": 0.6, "recover": 0.5,
+    "recovery": 0.5, "rebound": 0.6, "rebounds": 0.6, "win": 0.6, "wins": 0.6, "approval": 0.6,
+    "approved": 0.6, "launch": 0.3, "launches": 0.3, "expand": 0.4, "expands": 0.4, "expansion": 0.4,
+    "dividend": 0.3, "buyback": 0.5, "innovative": 0.5, "breakthrough": 0.8, "partnership": 0.4,
+    "accelerate": 0.5, "accelerates": 0.5, "positive": 0.5, "improve": 0.5, "improves": 0.5,
+    "improved": 0.5, "opportunity": 0.4, "momentum": 0.4, "top": 0.3, "tops": 0.5, "success": 0.7,
+    "successful": 0.7, "robust": 0.6, "solid": 0.5, "upside": 0.6, "favorable": 0.6,
+    # Negative
+    "miss": -0.8, "misses": -0.8, "missed": -0.8, "plunge": -0.9, "plunges": -0.9, "plunged": -0.9,
+    "crash": -1.0, "crashes": -1.0, "tumble": -0.8, "tumbles": -0.8, "tumbled": -0.8, "slump": -0.8,
+    "slumps": -0.8, "drop": -0.5, "drops": -0.5, "dropped": -0.5, "fall": -0.5, "falls": -0.5,
+    "fell": -0.5, "decline": -0.5, "declines": -0.5, "declined": -0.5, "sink": -0.6, "sinks": -0.6,
+    "sank": -0.6, "slide": -0.5, "slides": -0.5, "loss": -0.6, "losses": -0.6, "lose": -0.5,
+    "weak": -0.6, "weaker": -0.6, "weakness": -0.6, "downgrade": -0.8, "downgrades": -0.8,
+    "downgraded": -0.8, "underperform": -0.7, "bearish": -0.8, "sell": -0.4, "selloff": -0.8,
+    "cut": -0.5, "cuts": -0.5, "layoff": -0.7, "layoffs": -0.7, "lawsuit": -0.7, "lawsuits": -0.7,
+    "sue": -0.6, "sued": -0.6, "probe": -0.6, "investigation": -0.6, "fraud": -1.0, "scandal": -0.9,
+    "recall": -0.6, "recalls": -0.6, "warning": -0.6, "warns": -0.6, "warned": -0.6, "risk": -0.3,
+    "risks": -0.3, "concern": -0.4, "concerns": -0.4, "fear": -0.6, "fears": -0.6, "volatile": -0.3,
+    "volatility": -0.2, "bankruptcy": -1.0, "default": -0.8, "debt": -0.3, "lower": -0.3,
+    "low": -0.3, "lows": -0.4, "pessimistic": -0.7, "negative": -0.5, "delay": -0.5, "delays": -0.5,
+    "delayed": -0.5, "fine": -0.3, "fined": -0.6, "penalty": -0.6, "halt": -0.6, "halts": -0.6,
+    "shortfall": -0.7, "disappoint": -0.7, "disappoints": -0.7, "disappointing": -0.7,
+    "slowdown": -0.6, "recession": -0.8, "inflation": -0.3, "downside": -0.6, "struggle": -0.6,
+    "struggles": -0.6, "worst": -0.8, "worse": -0.6, "hurt": -0.5, "hurts": -0.5, "pressure": -0.3,
+    "headwinds": -0.5, "tariff": -0.3, "tariffs": -0.3, "ban": -0.6, "bans": -0.6,
+}
+
+NEGATIONS = frozenset({"not", "no", "never", "without", "isn't", "aren't", "wasn't", "don't",
+                       "doesn't", "didn't", "won't", "can't", "cannot", "fails", "failed"})
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z'-]*")
+
+class SentimentScorer:
+    """Class to score headline sentiment with a finance lexicon (offline and deterministic)"""
+
+    def __init__(self, lexicon=None, neutral_band=0.05, cache_size=100000):
+        """
+        Initialize scorer.
+
+        Args:
+            lexicon (dict): {word: score} mapping (default: FINANCE_LEXICON)
+            neutral_band (float): Scores within +/- this value are neutral (default: 0.05)
+            cache_size (int): Maximum number of cached texts (default: 100000)
+        """
+        lexicon = FINANCE_LEXICON if lexicon is None else lexicon
+        words = sorted(lexicon)
+        # Sorted vocabulary + aligned scores, looked up with np.searchsorted
+        self._vocabulary = np.array(words)
+        self._scores = np.array([lexicon[w] for w in words], dtype=float)
+        self._negations = np.array(sorted(NEGATIONS))
+        self.neutral_band = neutral_band
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # text hash -> score
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tokenize(text):
+        """Lowercase word tokens of a text"""
+        return TOKEN_PATTERN.findall(text.lower())
+
+    @staticmethod
+    def _hash(text):
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def _lookup(self, tokens, vocabulary):
+        """Positions of tokens in a sorted vocabulary and a found mask"""
+        positions = np.searchsorted(vocabulary, tokens)
+        positions = np.minimum(positions, len(vocabulary) - 1)
+        return positions, vocabulary[positions] == tokens
+
+    def score_batch(self, texts):
+        """
+        Score many texts at once.
+
+        A lexicon hit preceded (within two tokens) by a negation is inverted.
+        The summed score is squashed to [-1, 1] with tanh.
+
+        Args:
+            texts (list): Texts to score
+
+        Returns:
+            np.ndarray: One score in [-1, 1] per text
+        """
+        keys = [self._hash(text) for text in texts]
+        scores = np.empty(len(texts))
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing.append(i)
+                else:
+                    scores[i] = cached
+                    self._cache.move_to_end(key)
+
+        if missing:
+            token_lists = [self.tokenize(texts[i]) for i in missing]
+            lengths = np.array([len(tokens) for tokens in token_lists])
+            doc = np.repeat(np.arange(len(missing)), lengths)
+
+            values = np.zeros(len(doc))
+            if len(doc):
+                tokens = np.array([token for tokens in token_lists for token in tokens])
+                positions, found = self._lookup(tokens, self._vocabulary)
+                values = np.where(found, self._scores[positions], 0.0)
+
+                _, negation = self._lookup(tokens, self._negations)
+                # Negation applies to the next two tokens of the same text
+                negated = np.zeros(len(doc), dtype=bool)
+                for shift in (1, 2):
+                    negated[shift:] |= negation[:-shift] & (doc[shift:] == doc[:-shift])
+                values = np.where(negated, -values, values)
+
+            computed = np.tanh(np.bincount(doc, weights=values, minlength=len(missing)))
+            scores[missing] = computed
+
+            with self._lock:
+                for i, score in zip(missing, computed):
+                    self._cache[keys[i]] = float(score)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return scores
+
+    def label(self, score):
+        """Map a score to 'positive', 'neutral' or 'negative'"""
+        if score > self.neutral_band:
+            return "positive"
+        if score < -self.neutral_band:
+            return "negative"
+        return "neutral"
+
+    def analyze_batch(self, texts):
+        """
+        Score and label many texts.
+
+        Returns:
+            list: (label, score) tuples
+        """
+        return [(self.label(score), float(score)) for score in self.score_batch(texts)]
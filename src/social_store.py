@@ -0,0 +1,156 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+
+DEFAULT_PATH = os.path.join(tempfile.gettempdir(), 'bourse_dashboard', 'social_sentiment.json.gz')
+
+# Loaded stores shared across reruns: path -> (mtime, store)
+_LOADED = {}
+_LOADED_LOCK = threading.Lock()
+
+class SocialSentimentStore:
+    """Class to keep per-ticker, per-day social sentiment aggregates (gzip JSON on disk)"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        """
+        Initialize an empty store.
+
+        Args:
+            path (str): gzip JSON file path (default: temporary directory)
+        """
+        self.path = path
+        self.days = {}  # ticker -> {ISO day: [positive, neutral, negative, score sum]}
+        self.totals = {}  # ticker -> [positive, neutral, negative, score sum]
+        self.sources = {}  # ingested file -> {'size', 'mtime', 'offset', 'tail'} (see RedditSentiment.ingest)
+        self.contributions = {}  # ingested file -> {ticker: {ISO day: counts}}, to replace a file's share
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        """
+        Load a store, reusing the in-memory copy while the file is unchanged.
+
+        Args:
+            path (str): gzip JSON file path (default: temporary directory)
+
+        Returns:
+            SocialSentimentStore: Loaded store (empty if the file does not exist)
+        """
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return cls(path)
+
+        with _LOADED_LOCK:
+            cached = _LOADED.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+        store = cls(path)
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            payload = json.load(f)
+        store.days = payload.get('days', {})
+        store.sources = payload.get('sources', {})
+        store.contributions = payload.get('contributions', {})
+        # Totals are derived, rebuilt once per load
+        for ticker, days in store.days.items():
+            total = [0, 0, 0, 0.0]
+            for counts in days.values():
+                for i in range(4):
+                    total[i] += counts[i]
+            store.totals[ticker] = total
+
+        with _LOADED_LOCK:
+            _LOADED[path] = (mtime, store)
+        return store
+
+    def save(self):
+        """Write the store atomically (temporary file + rename)"""
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                json.dump({'days': self.days, 'sources': self.sources, 'contributions': self.contributions},
+                          f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def add(self, ticker, day, label, score, source=None):
+        """
+        Count one scored post mentioning a ticker.
+
+        Args:
+            ticker (str): Ticker symbol
+            day (str): ISO date of the post
+            label (str): 'positive', 'neutral' or 'negative'
+            score (float): Sentiment score in [-1, 1]
+            source (str): Ingested file the post comes from, so drop_source() can remove it (default: None)
+        """
+        slot = {'positive': 0, 'neutral': 1, 'negative': 2}[label]
+        targets = [
+            self.days.setdefault(ticker, {}).setdefault(day, [0, 0, 0, 0.0]),
+            self.totals.setdefault(ticker, [0, 0, 0, 0.0])
+        ]
+        if source is not None:
+            targets.append(
+                self.contributions.setdefault(source, {}).setdefault(ticker, {}).setdefault(day, [0, 0, 0, 0.0])
+            )
+        for counts in targets:
+            counts[slot] += 1
+            counts[3] += score
+
+    def drop_source(self, source):
+        """
+        Remove the counts added from an ingested file, before it is ingested again.
+
+        Args:
+            source (str): Source passed to add()
+        """
+        for ticker, days in self.contributions.pop(source, {}).items():
+            ticker_days = self.days.get(ticker, {})
+            total = self.totals.get(ticker)
+            for day, counts in days.items():
+                for target in (ticker_days.get(day), total):
+                    if target is not None:
+                        for i in range(4):
+                            target[i] -= counts[i]
+                if day in ticker_days and not any(ticker_days[day][:3]):
+                    del ticker_days[day]
+            if not ticker_days:
+                self.days.pop(ticker, None)
+                self.totals.pop(ticker, None)
+        self.sources.pop(source, None)
+
+    def summary(self, ticker):
+        """
+        Aggregate counts of a ticker (constant time).
+
+        Returns:
+            dict: 'positive', 'neutral', 'negative', 'total' counts and mean 'score'
+        """
+        positive, neutral, negative, score_sum = self.totals.get(ticker, (0, 0, 0, 0.0))
+        total = positive + neutral + negative
+        return {
+            'positive': positive,
+            'neutral': neutral,
+            'negative': negative,
+            'total': total,
+            'score': score_sum / total if total else 0.0
+        }
+
+    def daily(self, ticker):
+        """
+        Per-day aggregates of a ticker.
+
+        Returns:
+            list: (ISO day, positive, neutral, negative, mean score) tuples sorted by day
+        """
+        rows = []
+        for day, (positive, neutral, negative, score_sum) in sorted(self.days.get(ticker, {}).items()):
+            total = positive + neutral + negative
+            rows.append((day, positive, neutral, negative, score_sum / total if total else 0.0))
+        return rows
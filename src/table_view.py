@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+# Import local modules
+from src.cache_utils import LRUCache
+
+class TableView:
+    """Class to page through a large time-indexed DataFrame, newest rows first"""
+
+    def __init__(self, data_frame):
+        """
+        Prepare a view (sorts the index once when it is not already ascending).
+
+        Args:
+            data_frame (pd.DataFrame): Data indexed by date
+        """
+        self.df = data_frame
+        index = pd.DatetimeIndex(data_frame.index)
+        if index.is_monotonic_increasing:
+            self._order = None  # Positions are already chronological
+            self._sorted_index = index
+        else:
+            self._order = np.argsort(index.asi8, kind='stable')
+            self._sorted_index = index[self._order]
+        self._queries = LRUCache(maxsize=16)  # query -> matching positions
+
+    def __len__(self):
+        return len(self.df)
+
+    def _timestamp(self, value):
+        """Timestamp comparable with the index (same timezone)"""
+        value = pd.Timestamp(value)
+        tz = self._sorted_index.tz
+        if tz is not None and value.tz is None:
+            return value.tz_localize(tz)
+        if tz is None and value.tz is not None:
+            return value.tz_localize(None)
+        return value
+
+    def query(self, start=None, end=None, filters=None):
+        """
+        Row positions matching a date range and value ranges, newest first
+
+        The date range is two binary searches on the sorted index, value ranges
+        are only evaluated on rows inside it. Results are cached per query.
+
+        Args:
+            start (date-like): First date included (default: first row)
+            end (date-like): Last date included, whole day (default: last row)
+            filters (dict): {column: (min or None, max or None)} inclusive ranges (default: none)
+
+        Returns:
+            np.ndarray: Integer positions into the DataFrame
+        """
+        filters = {column: bounds for column, bounds in (filters or {}).items()
+                   if bounds[0] is not None or bounds[1] is not None}
+        key = (start, end, tuple(sorted(filters.items())))
+        positions = self._queries.get(key)
+        if positions is not None:
+            return positions
+
+        low = 0 if start is None else self._sorted_index.searchsorted(self._timestamp(start), side='left')
+        high = len(self._sorted_index) if end is None else self._sorted_index.searchsorted(
+            self._timestamp(end) + pd.Timedelta(days=1), side='left'
+        )
+        positions = np.arange(high - 1, low - 1, -1) if self._order is None else self._order[low:high][::-1]
+
+        for column, (minimum, maximum) in filters.items():
+            values = self.df[column].to_numpy(dtype=float)[positions]
+            mask = np.ones(len(positions), dtype=bool)
+            if minimum is not None:
+                mask &= values >= minimum
+            if maximum is not None:
+                mask &= values <= maximum
+            positions = positions[mask]
+
+        self._queries.set(key, positions)
+        return positions
+
+    def page(self, positions, page=1, page_size=100, columns=None):
+        """
+        Rows of one page, only the requested columns
+
+        Args:
+            positions (np.ndarray): Result of query()
+            page (int): 1-based page number (default: 1)
+            page_size (int): Rows per page (default: 100)
+            columns (list): Columns to keep (default: all)
+
+        Returns:
+            pd.DataFrame: Page slice
+        """
+        start = (page - 1) * page_size
+        rows = positions[start:start + page_size]
+        if columns is None:
+            return self.df.iloc[rows]
+        return self.df.iloc[rows, self.df.columns.get_indexer(columns)]
+
+    @staticmethod
+    def page_count(positions, page_size=100):
+        """Number of pages (at least 1)"""
+        return max(1, -(-len(positions) // page_size))
@@ -123,6 +123,59 @@ class TechnicalAnalyzer:
         self.df['Lower_Band'] = self.df['MA_BB'] - num_std * self.df['Volatility']
         self._clean_data(self.df)
 
+    # Indicator columns and the method adding each, in dependency order
+    INDICATORS = (
+        ('MA_50', 'compute_50_200_days'),
+        ('rsi', 'add_rsi'),
+        ('Volatility', 'calculate_volatility'),
+        ('MA_BB', 'bollinger_bands'),
+        ('Signal', 'add_signal_column'),
+        ('Daily_Return', 'add_performance_column'),
+        ('returns', 'add_returns_columns'),
+    )
+
+    # Previous rows needed to compute an indicator on a new row (longest window: MA 200)
+    LOOKBACK = 200
+
+    def update(self, new_bars):
+        """
+        Append new bars and compute indicators for them only
+
+        Rows dated at or after the first new bar are replaced, so a bar that
+        was still forming is revised. Indicators already in the DataFrame are
+        recomputed on the new bars plus LOOKBACK previous rows: refresh cost
+        follows the number of new bars, with the values a full recomputation
+        gives. Histories shorter than LOOKBACK are recomputed in full.
+
+        Args:
+            new_bars (pd.DataFrame): Bars sorted by date (e.g. DataFetcher.fetch_new_bars)
+
+        Returns:
+            int: Number of rows added or revised (the last rows of df)
+        """
+        if new_bars.empty:
+            return 0
+
+        methods = [method for column, method in self.INDICATORS if column in self.df.columns]
+        indicator_columns = {'MA_200', 'Upper_Band', 'Lower_Band'} | {column for column, _ in self.INDICATORS}
+        raw_columns = [c for c in self.df.columns if c not in indicator_columns and c in new_bars.columns]
+        new_bars = new_bars[raw_columns]
+
+        # Rows before the first new bar are kept (binary search, the index is sorted)
+        cut = self.df.index.searchsorted(new_bars.index[0], side='left')
+        full = cut < self.LOOKBACK
+        history = self.df.iloc[0 if full else cut - self.LOOKBACK:cut]
+        window = TechnicalAnalyzer(pd.concat([history[raw_columns], new_bars]))
+        for method in methods:
+            getattr(window, method)()
+
+        if full:
+            self.df = window.df.reindex(columns=self.df.columns)
+        else:
+            new_rows = window.df.iloc[-len(new_bars):].reindex(columns=self.df.columns)
+            self.df = pd.concat([self.df.iloc[:cut], new_rows])
+        return len(new_bars)
+
     def _clean_data(self, raw_data):
         """
         Clean and normalize input DataFrame.
@@ -166,4 +219,36 @@ class TechnicalAnalyzer:
         analyzer = cls(df)
         analyzer.compute_50_200_days()
         analyzer.add_rsi()
-        return analyzer
\ No newline at end of file
+        return analyzer
+
+    @classmethod
+    def test_update(cls):
+        """
+        Test that incremental updates give the same indicators as a full computation
+
+        Example:
+        >>> analyzer = TechnicalAnalyzer.test_update()
+        >>> print(analyzer.df.tail())
+        """
+        rng = np.random.default_rng(0)
+        close = 100 + np.cumsum(rng.normal(size=400))
+        df = pd.DataFrame(
+            {'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1e6},
+            index=pd.date_range("2023-01-02", periods=400, freq="B")
+        )
+
+        def analyze(data):
+            analyzer = cls(data.copy())
+            analyzer.compute_50_200_days()
+            analyzer.add_rsi()
+            analyzer.calculate_volatility()
+            analyzer.add_signal_column()
+            analyzer.add_performance_column()
+            analyzer.add_returns_columns()
+            return analyzer
+
+        analyzer = analyze(df.iloc[:390])
+        revised = df.iloc[389:].copy()  # Last known bar comes back revised, with 10 new ones
+        assert analyzer.update(revised) == 11, "Unexpected number of updated rows"
+        pd.testing.assert_frame_equal(analyzer.df, analyze(df).df, check_freq=False)
+        return analyzer
@@ -1,15 +1,23 @@
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
-import streamlit as st
 from plotly.subplots import make_subplots
 
 # Import local modules
+from src.cache_utils import data_fingerprint
+from src.downsampling import lttb_indices, ohlc_buckets, sum_buckets
+from src.plot_templates import DEFAULT_THEME, template_name
+from src.runtime import Runtime
 from src.technical_analyzer import TechnicalAnalyzer
 
+# Built (styled) Visualizers shared across reruns and sessions, keyed on data, recipe and theme
+_FIGURE_CACHE = Runtime.cache("figures", maxsize=32)
+
 class Visualizer:
     """Class to visualize financial data"""
     
-    def __init__(self, data_frame, rows=2, columns=2, row_heights=None):
+    def __init__(self, data_frame, rows=2, columns=2, row_heights=None, max_points=2000, webgl_threshold=10000,
+                 theme=None):
         """
         Initialize visualizer with subplot grid
         
@@ -18,8 +26,16 @@ class Visualizer:
             rows (int): Number of rows (default: 2)
             columns (int): Number of columns (default: 2)
             row_heights (list): Relative row heights (default: None)
+            max_points (int): Points per trace above which series are downsampled, None to disable (default: 2000)
+            webgl_threshold (int): Plotted points above which line traces use WebGL, None to disable (default: 10000)
+            theme (str): Theme name (default: the 'theme' setting of Runtime, else DEFAULT_THEME)
         """
         self.df = data_frame
+        self.theme = theme
+        self.max_points = max_points
+        self.webgl_threshold = webgl_threshold
+        self.dropped_points = 0  # Points removed by downsampling, all traces together
+        self.plotted_points = 0  # Points sent to the browser, all traces together
         self.max_row = rows
         self.max_column = columns
         self.current_row = 1
@@ -71,11 +87,79 @@ class Visualizer:
             row, col = self.last_row, self.last_col
         elif row is None or col is None:
             row, col = self._next_position()
+
+        points = self._trace_points(trace)
+        self.plotted_points += points
+        # A single long line switches at once, the others when the figure is finalized
+        if trace.type == 'scatter' and self._use_webgl(points):
+            trace = self._to_webgl(trace)
         
         self.fig.add_trace(trace, row=row, col=col)
         self.last_row, self.last_col = row, col
         return self
 
+    @staticmethod
+    def _trace_points(trace):
+        values = trace.x if trace.x is not None else getattr(trace, 'y', None)
+        return 0 if values is None else len(values)
+
+    def _use_webgl(self, points):
+        return self.webgl_threshold is not None and points > self.webgl_threshold
+
+    @staticmethod
+    def _to_webgl(trace):
+        """Same line as a Scattergl trace (styled by the template's scattergl defaults)"""
+        props = trace.to_plotly_json()
+        props.pop('type', None)
+        return go.Scattergl(props)
+
+    def _apply_webgl(self):
+        """Switch every remaining scatter trace to WebGL when the figure is over the threshold"""
+        if not self._use_webgl(self.plotted_points) or not any(t.type == 'scatter' for t in self.fig.data):
+            return
+        # Traces keep their xaxis/yaxis references, so they land in the same subplots
+        traces = [self._to_webgl(t) if t.type == 'scatter' else t.to_plotly_json() for t in self.fig.data]
+        self.fig.data = ()
+        self.fig.add_traces(traces)
+
+    def render_report(self, include_json=False):
+        """
+        Size of the figure sent to the browser, to tune max_points and webgl_threshold
+
+        Args:
+            include_json (bool): Also serialize the figure to measure its JSON size (default: False)
+
+        Returns:
+            dict: trace counts by type, plotted and dropped points, WebGL use and optionally JSON bytes
+        """
+        trace_types = {}
+        for trace in self.fig.data:
+            trace_types[trace.type] = trace_types.get(trace.type, 0) + 1
+        report = {
+            'traces': len(self.fig.data),
+            'trace_types': trace_types,
+            'plotted_points': self.plotted_points,
+            'dropped_points': self.dropped_points,
+            'webgl': 'scattergl' in trace_types
+        }
+        if include_json:
+            report['json_bytes'] = len(self.fig.to_json())
+        return report
+
+    def _needs_downsampling(self, length):
+        return self.max_points is not None and length > self.max_points
+
+    def _downsample_line(self, x, y):
+        """Reduce a line to max_points with LTTB (unchanged when within budget)"""
+        if not self._needs_downsampling(len(y)):
+            return x, y
+        x = pd.Index(x)
+        # LTTB needs numeric x: nanoseconds for dates
+        numeric_x = x.asi8 if isinstance(x, pd.DatetimeIndex) else np.arange(len(x))
+        keep = lttb_indices(numeric_x, np.asarray(y, dtype=float), self.max_points)
+        self.dropped_points += len(y) - len(keep)
+        return x[keep], np.asarray(y)[keep]
+
     def _check_columns(self, required_columns):
         """Check required columns exist"""
         missing = [col for col in required_columns if col not in self.df.columns]
@@ -87,25 +171,28 @@ class Visualizer:
         self._check_columns(['MA_200', 'MA_50', 'Close'])
         dates = self.df.index if isinstance(self.df.index, pd.DatetimeIndex) else self.df['Date']
         
-        traces = [
-            go.Scatter(x=dates, y=self.df['Close'], name='Close Price', line=dict(color='blue')),
-            go.Scatter(x=dates, y=self.df['MA_50'], name='MA 50', line=dict(color='orange', dash='dot')),
-            go.Scatter(x=dates, y=self.df['MA_200'], name='MA 200', line=dict(color='red', dash='dash'))
+        # Colors come from the theme template colorway
+        lines = [
+            ('Close', 'Close Price', dict()),
+            ('MA_50', 'MA 50', dict(dash='dot')),
+            ('MA_200', 'MA 200', dict(dash='dash'))
         ]
         
-        for trace in traces:
-            self._add_trace(trace, overlay=overlay)
+        for column, name, line in lines:
+            x, y = self._downsample_line(dates, self.df[column])
+            self._add_trace(go.Scatter(x=x, y=y, name=name, line=line), overlay=overlay)
         return self
 
     def Rsi_draw(self, show_zones=True, overlay=False):
         """Display RSI indicator with threshold zones"""
         self._check_columns(['rsi'])
         dates = self.df.index if isinstance(self.df.index, pd.DatetimeIndex) else self.df['Date']
+        dates, rsi = self._downsample_line(dates, self.df['rsi'])
         
         self._add_trace(
             go.Scatter(
-                x=dates, y=self.df['rsi'], name='RSI',
-                line=dict(color='black', dash='dash')
+                x=dates, y=rsi, name='RSI',
+                line=dict(dash='dash')
             ),
             overlay=overlay
         )
@@ -129,54 +216,68 @@ class Visualizer:
             )
         return self
 
-    def draw_candlestick(self, overlay=False, increasing_color='green', decreasing_color='red'):
-        """Add candlestick chart"""
+    def draw_candlestick(self, overlay=False, increasing_color=None, decreasing_color=None):
+        """Add candlestick chart (colors default to the theme template)"""
         self._check_columns(['Open', 'High', 'Low', 'Close'])
         dates = self.df.index if isinstance(self.df.index, pd.DatetimeIndex) else self.df['Date']
+        open_, high, low, close = (self.df[c] for c in ('Open', 'High', 'Low', 'Close'))
+
+        if self._needs_downsampling(len(self.df)):
+            # Each bucket becomes one candle covering the whole bucket range
+            starts, open_, high, low, close = ohlc_buckets(open_, high, low, close, self.max_points)
+            self.dropped_points += len(self.df) - len(starts)
+            dates = pd.Index(dates)[starts]
     
         self._add_trace(
             go.Candlestick(
                 x=dates,
-                open=self.df['Open'],
-                high=self.df['High'],
-                low=self.df['Low'],
-                close=self.df['Close'],
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
                 name='Candlesticks',
-                increasing=dict(line=dict(color=increasing_color)),
-                decreasing=dict(line=dict(color=decreasing_color))
+                increasing=dict(line=dict(color=increasing_color)) if increasing_color else None,
+                decreasing=dict(line=dict(color=decreasing_color)) if decreasing_color else None
             ),
             overlay=overlay
         )
         return self
 
-    def draw_volume(self, overlay=False, color='blue'):
-        """Display traded volume"""
+    def draw_volume(self, overlay=False, color=None):
+        """Display traded volume (color defaults to the theme template)"""
         self._check_columns(['Volume'])
         dates = self.df.index if isinstance(self.df.index, pd.DatetimeIndex) else self.df['Date']
+        volume = self.df['Volume']
+
+        if self._needs_downsampling(len(self.df)):
+            # Same buckets as draw_candlestick, so bars stay under their candle
+            starts, volume = sum_buckets(volume, self.max_points)
+            self.dropped_points += len(self.df) - len(starts)
+            dates = pd.Index(dates)[starts]
     
         self._add_trace(
             go.Bar(
-                x=dates, y=self.df['Volume'], name='Volume',
-                marker_color=color, opacity=0.7
+                x=dates, y=volume, name='Volume',
+                marker_color=color
             ),
             overlay=overlay
         )
         return self
 
-    def draw_cumulative_returns(self, overlay=False, color='blue'):
+    def draw_cumulative_returns(self, overlay=False, color=None):
         """Plot cumulative returns with automatic fallback if 'returns' column is missing"""
-        try:
-            self._check_columns(['returns'])
-            dates = self.df.index if isinstance(self.df.index, pd.DatetimeIndex) else self.df['Date']
-            cumulative_returns = (1 + self.df['returns']).cumprod() - 1
-        except ValueError:
-            # Fallback if 'returns' doesn't exist
-            self.df['returns'] = self.df['Close'].pct_change().fillna(0)
-            cumulative_returns = (1 + self.df['returns']).cumprod() - 1
+        dates = self.df.index if isinstance(self.df.index, pd.DatetimeIndex) else self.df['Date']
+        if 'returns' in self.df.columns:
+            returns = self.df['returns']
+        else:
+            # Fallback if 'returns' doesn't exist (input data left untouched)
+            returns = self.df['Close'].pct_change().fillna(0)
+        cumulative_returns = (1 + returns).cumprod() - 1
+        x, y = self._downsample_line(dates, cumulative_returns)
         
         self._add_trace(
             go.Scatter(
-                x=dates, y=cumulative_returns,
+                x=x, y=y,
                 name='Cumulative Returns',
                 line=dict(color=color, width=2),
                 mode='lines'
@@ -185,6 +286,28 @@ class Visualizer:
         )
         return self
 
+    def draw_sentiment(self, sentiment, overlay=False):
+        """
+        Display daily sentiment bars (green positive, red negative)
+
+        Args:
+            sentiment (pd.DataFrame): 'score' column indexed by date (NewsFetcher.get_sentiment_series)
+            overlay (bool): Overlay on current plot (default: False)
+        """
+        if 'score' not in sentiment.columns:
+            raise ValueError("sentiment must have a 'score' column")
+
+        self._add_trace(
+            go.Bar(
+                x=sentiment.index, y=sentiment['score'], name='News sentiment',
+                marker_color=['green' if score >= 0 else 'red' for score in sentiment['score']],
+                customdata=sentiment.get('count'),
+                hovertemplate='%{y:+.2f} (%{customdata} headlines)<extra></extra>'
+            ),
+            overlay=overlay
+        )
+        return self
+
     def draw_multiple_tickers(self, tickers_data, overlay=False, colors=None):
         """
         Display multiple price series
@@ -192,191 +315,243 @@ class Visualizer:
         Args:
             tickers_data (dict): {ticker: DataFrame} dictionary
             overlay (bool): Overlay on current plot (default: False)
-            colors (list): Color list for each series (default: None)
+            colors (list): Color list for each series (default: theme colorway)
         """
         if not isinstance(tickers_data, dict):
             raise ValueError("tickers_data must be a {ticker: df} dictionary")
     
-        if not colors:
-            colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    
         for i, (ticker, df) in enumerate(tickers_data.items()):
             if 'Close' not in df.columns:
                 raise ValueError(f"DataFrame for {ticker} missing 'Close' column")
         
+            x, y = self._downsample_line(df.index, df['Close'])
             self._add_trace(
                 go.Scatter(
-                    x=df.index,
-                    y=df['Close'],
+                    x=x,
+                    y=y,
                     name=ticker,
-                    line=dict(color=colors[i % len(colors)], width=2),
+                    line=dict(color=colors[i % len(colors)] if colors else None, width=2),
                     mode='lines'
                 ),
                 overlay=overlay
             )
         return self
 
-    def show(self, log_scale=False, title=None):
-        """Display final chart with theme style"""
-        theme = st.session_state.get('theme', 'Neon Cyberpunk')
-        colors = st.session_state.get('theme_colors', {
-            'primary': '#0f0c29',
-            'secondary': '#ff00ff',
-            'background': '#100e1d',
-            'accent1': '#00ffff',
-            'accent2': '#ff00ff',
-            'text': '#e0e0ff'
-        })
-
-        # Apply theme-specific colors with enhanced contrast
-        if theme == "Neon Cyberpunk":
-            self.fig.update_traces(
-            selector=dict(type='candlestick'),
-            increasing_line_color='#00ffff', 
-            decreasing_line_color='#ff00ff',
-            increasing_fillcolor='rgba(0, 255, 255, 0.7)',
-            decreasing_fillcolor='rgba(255, 0, 255, 0.7)'
-            )
-            self.fig.update_traces(
-                selector=dict(type='bar'),
-                marker_color='#ff00ff',
-                opacity=0.8
-            )
-            self.fig.update_traces(
-            selector=dict(type='scatter'),
-            line_color='#00ffff',
-            line_width=2
-            )
+    @staticmethod
+    def align_series(tickers_data, column='Close', rebase=False):
+        """
+        Align one column of several tickers on a single sorted date index
 
-        elif theme == "Lava Explosion":
-            self.fig.update_traces(
-            selector=dict(type='candlestick'),
-            increasing_line_color='#ff7b00', 
-            decreasing_line_color='#ff3c00',
-            increasing_fillcolor='rgba(255, 123, 0, 0.7)',
-            decreasing_fillcolor='rgba(255, 60, 0, 0.7)'
-            )
-            self.fig.update_traces(
-            selector=dict(type='bar'),
-            marker_color='#ff3c00',
-            opacity=0.8
-            )
-            self.fig.update_traces(
-            selector=dict(type='scatter'),
-            line_color='#ff7b00',
-            line_width=2
-            )
+        Args:
+            tickers_data (dict): {ticker: DataFrame} dictionary
+            column (str): Column to align (default: 'Close')
+            rebase (bool): Scale each series so its first value is 100 (default: False)
 
-        elif theme == "Electric Ocean":
-            self.fig.update_traces(
-            selector=dict(type='candlestick'),
-            increasing_line_color='#0074D9', 
-            decreasing_line_color='#7FDBFF',
-            increasing_fillcolor='rgba(0, 116, 217, 0.7)',
-            decreasing_fillcolor='rgba(127, 219, 255, 0.7)'
-            )
-            self.fig.update_traces(
-            selector=dict(type='bar'),
-            marker_color='#7FDBFF',
-            opacity=0.8
-            )
-            self.fig.update_traces(
-            selector=dict(type='scatter'),
-            line_color='#0074D9',
-            line_width=2
-            )
+        Returns:
+            pd.DataFrame: One column per ticker, NaN where a ticker has no value
+        """
+        series = {}
+        for ticker, df in tickers_data.items():
+            if column not in df.columns:
+                raise ValueError(f"DataFrame for {ticker} missing '{column}' column")
+            index = pd.DatetimeIndex(df.index)
+            if index.tz is not None:
+                # Keep exchange-local dates so daily bars of different markets line up
+                index = index.tz_localize(None)
+            values = pd.Series(df[column].to_numpy(dtype=float), index=index)
+            series[ticker] = values[~values.index.duplicated(keep='last')]
 
-        elif theme == "Acid Jungle":
-            self.fig.update_traces(
-            selector=dict(type='candlestick'),
-            increasing_line_color='#00cc00',
-            decreasing_line_color='#009900',
-            increasing_fillcolor='rgba(0, 204, 0, 0.7)',
-            decreasing_fillcolor='rgba(0, 153, 0, 0.7)'
-            )
-            self.fig.update_traces(
-            selector=dict(type='bar'),
-            marker_color='#00cc00',
-            opacity=0.8
-            )
-            self.fig.update_traces(
-            selector=dict(type='scatter'),
-            line_color='#00cc00',
-            line_width=2
-            )
+        panel = pd.concat(series, axis=1).sort_index()
+        if rebase:
+            panel = panel / panel.bfill().iloc[0] * 100
+        return panel
 
-        elif theme == "Galactic Purple":
-            self.fig.update_traces(
-            selector=dict(type='candlestick'),
-            increasing_line_color='#9900ff', 
-            decreasing_line_color='#ff00cc',
-            increasing_fillcolor='rgba(153, 0, 255, 0.7)',
-            decreasing_fillcolor='rgba(255, 0, 204, 0.7)'
-            )
-            self.fig.update_traces(
-            selector=dict(type='bar'),
-            marker_color='#ff00cc',
-            opacity=0.8
-            )
-            self.fig.update_traces(
-            selector=dict(type='scatter'),
-            line_color='#9900ff',
-            line_width=2
+    @staticmethod
+    def _regular_step(index, max_fill=1.5):
+        """
+        Step of a regular grid covering a date index, or None
+
+        The grid may have holes (weekends, holidays) but at most max_fill times
+        as many slots as the index has dates.
+        """
+        if len(index) < 3:
+            return None
+        diffs = np.diff(index.asi8)
+        step = diffs.min()
+        if step <= 0 or np.any(diffs % step):
+            return None
+        if (index.asi8[-1] - index.asi8[0]) // step + 1 > max_fill * len(index):
+            return None
+        return int(step)
+
+    def draw_comparison(self, tickers_data, column='Close', rebase=True, overlay=False):
+        """
+        Display several tickers on one shared x axis
+
+        Series are aligned on one date index. On a regular date grid (daily or
+        fixed-interval bars, missing days included as gaps) each trace is sent
+        as x0/dx plus its y values, so no x array is repeated per ticker.
+        Otherwise, or when the grid exceeds max_points, each trace gets its own
+        (downsampled) x array.
+
+        Args:
+            tickers_data (dict): {ticker: DataFrame} dictionary
+            column (str): Column to plot (default: 'Close')
+            rebase (bool): Rebase every series to 100 at its first value (default: True)
+            overlay (bool): Overlay on current plot (default: False)
+        """
+        if not isinstance(tickers_data, dict):
+            raise ValueError("tickers_data must be a {ticker: df} dictionary")
+
+        panel = self.align_series(tickers_data, column=column, rebase=rebase)
+        step = self._regular_step(panel.index)
+        if step is not None:
+            grid = pd.date_range(panel.index[0], panel.index[-1], freq=pd.Timedelta(step, unit='ns'))
+            if self._needs_downsampling(len(grid)):
+                step = None
+            else:
+                panel = panel.reindex(grid)
+
+        for i, ticker in enumerate(panel.columns):
+            if step is not None:
+                # Date axes take dx in milliseconds
+                position = dict(x0=panel.index[0], dx=step / 1e6, y=panel[ticker].to_numpy())
+            else:
+                values = panel[ticker].dropna()
+                x, y = self._downsample_line(values.index, values.to_numpy())
+                position = dict(x=x, y=y)
+            self._add_trace(
+                go.Scatter(name=ticker, mode='lines', connectgaps=True, **position),
+                overlay=overlay or i > 0
             )
 
-        # Update layout with theme-appropriate settings
-        layout_updates = {
-        'template': "plotly_dark",
-        'hovermode': 'x unified',
-        'xaxis_rangeslider_visible': False,
-        'height': 600,
-        'margin': dict(l=50, r=50, b=50, t=50 if title else 30),
-        'title': dict(
-            text=title,
-            x=0.5,
-            xanchor='center',
-            font=dict(size=20, color=colors['text'])
-        ),
-        'legend': dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            font=dict(color=colors['text'])
-        ),
-        'plot_bgcolor': colors['primary'],
-        'paper_bgcolor': colors['background'],
-        'font': dict(color=colors['text']),
-        'xaxis': dict(
-            gridcolor=colors['accent1'],  # Simplified grid color
-            linecolor=colors['secondary'],
-            tickfont=dict(color=colors['text'])
-        ),
-        'yaxis': dict(
-            gridcolor=colors['accent1'],  # Simplified grid color
-            linecolor=colors['secondary'],
-            tickfont=dict(color=colors['text'])
+        self.fig.update_yaxes(
+            title_text=f"Rebased {column} (first value = 100)" if rebase else column,
+            row=self.last_row, col=self.last_col
         )
-        }
-
-        self.fig.update_layout(**layout_updates)
+        return self
 
-        # Additional axes for subplots (simplified)
-        for axis in self.fig['layout']:
-            if axis.startswith('xaxis') or axis.startswith('yaxis'):
-                self.fig['layout'][axis].update(
-                gridcolor=colors['accent1'],
-                linecolor=colors['secondary'],
-                tickfont=dict(color=colors['text'])
-                )
+    def styled_figure(self, log_scale=False, title=None):
+        """Apply theme template and layout, and return the figure"""
+        self._apply_webgl()
+        # Whole theme comes from one pre-registered template
+        self.fig.update_layout(
+            template=template_name(self.theme or Runtime.setting('theme', DEFAULT_THEME)),
+            height=600,
+            margin=dict(l=50, r=50, b=50, t=50 if title else 30),
+            title_text=title
+        )
 
         if log_scale:
             self.fig.update_yaxes(type="log")
+        return self.fig
 
-        st.plotly_chart(self.fig, use_container_width=True, theme=None)  # Set theme=None to avoid conflict
+    def show(self, log_scale=False, title=None):
+        """Display final chart with theme style"""
+        self.styled_figure(log_scale=log_scale, title=title)
+        self._display()
         return self
-    
+
+    def _display(self):
+        self._show(self.fig, self.dropped_points, self.max_points, self.render_report())
+
+    @staticmethod
+    def _show(fig, dropped_points, max_points, report):
+        """Display a figure with its downsampling note and, when enabled, its render report"""
+        import streamlit as st  # Display only: building and styling figures does not need Streamlit
+
+        st.plotly_chart(fig, use_container_width=True, theme=None)  # Set theme=None to avoid conflict
+        if dropped_points:
+            st.caption(f"Downsampled for display: {dropped_points:,} points hidden (max {max_points:,} per series)")
+        if Runtime.setting('show_render_report'):
+            st.caption(f"Render report: {dict(report, json_bytes=len(fig.to_json()))}")
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all memoized figures"""
+        _FIGURE_CACHE.clear()
+
+    @classmethod
+    def render(cls, data_frame, recipe, rows=1, columns=1, row_heights=None, max_points=2000,
+               webgl_threshold=10000, log_scale=False, title=None, theme=None):
+        """
+        Display a chart described by a drawing recipe, reusing the figure built
+        by a previous run when data, recipe and theme are unchanged
+
+        Args:
+            data_frame (pd.DataFrame): Input data
+            recipe (list): (method name, kwargs dict) steps, e.g.
+                [("draw_candlestick", {}), ("MA_draw", {"overlay": True})]
+            rows, columns, row_heights, max_points, webgl_threshold: Subplot grid and budgets (see __init__)
+            log_scale (bool): Logarithmic y axes (default: False)
+            title (str): Chart title (default: None)
+            theme (str): Theme name (default: the 'theme' setting of Runtime, else DEFAULT_THEME)
+
+        Returns:
+            go.Figure: Displayed figure (shared with the cache, do not modify)
+        """
+        theme = theme or Runtime.setting('theme', DEFAULT_THEME)
+        key = data_fingerprint((
+            data_frame, recipe, rows, columns, row_heights, max_points, webgl_threshold, log_scale, title, theme
+        ))
+        entry = _FIGURE_CACHE.get(key)
+        if entry is None:
+            viz = cls(data_frame, rows=rows, columns=columns, row_heights=row_heights,
+                      max_points=max_points, webgl_threshold=webgl_threshold, theme=theme)
+            for method, kwargs in recipe:
+                getattr(viz, method)(**kwargs)
+            viz.styled_figure(log_scale=log_scale, title=title)
+            # Not the Visualizer: it holds the whole input frame, which the cache would keep alive
+            entry = (viz.fig, viz.dropped_points, viz.render_report())
+            _FIGURE_CACHE.set(key, entry)
+
+        fig, dropped_points, report = entry
+        cls._show(fig, dropped_points, max_points, report)
+        return fig
+
+    # Traces append_rows can extend: trace name -> {trace attribute: source column}
+    APPENDABLE_TRACES = {
+        'Candlesticks': {'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close'},
+        'Close Price': {'y': 'Close'},
+        'MA 50': {'y': 'MA_50'},
+        'MA 200': {'y': 'MA_200'},
+        'RSI': {'y': 'rsi'},
+        'Volume': {'y': 'Volume'}
+    }
+
+    def append_rows(self, rows):
+        """
+        Extend the drawn traces with new rows instead of rebuilding the figure
+
+        Points dated at or after the first new row are replaced (a bar that was
+        still forming is revised), then the new rows are appended. Only traces
+        of APPENDABLE_TRACES are extended; history that was downsampled stays
+        downsampled, new rows are added at full resolution.
+
+        Args:
+            rows (pd.DataFrame): New rows indexed by date, with the drawn columns
+
+        Returns:
+            int: Number of traces extended
+        """
+        if rows.empty:
+            return 0
+        extended = 0
+        for trace in self.fig.data:
+            columns = self.APPENDABLE_TRACES.get(trace.name)
+            if columns is None or trace.x is None or not set(columns.values()) <= set(rows.columns):
+                continue
+            points = self._trace_points(trace)
+            # Binary search on the (sorted) dates already plotted
+            cut = pd.Index(trace.x).searchsorted(rows.index[0], side='left')
+            trace.x = np.concatenate([np.asarray(trace.x)[:cut], rows.index.to_numpy()])
+            for attribute, column in columns.items():
+                kept = np.asarray(trace[attribute], dtype=float)[:cut]
+                trace[attribute] = np.concatenate([kept, rows[column].to_numpy(dtype=float)])
+            self.plotted_points += self._trace_points(trace) - points
+            extended += 1
+        return extended
+
     @classmethod
     def test_visualizer(cls, df=None):
         """